@@ -37,6 +37,7 @@ class ToolExecutor:
         """Initialize the tool executor."""
         self._available_tools = self._get_available_tools()
         self._parameter_validators = self._setup_parameter_validators()
+        self._signature_cache: Dict[str, Dict[str, Any]] = {}
         
     def _get_available_tools(self) -> Dict[str, Any]:
         """Get all available mathematical tools from dispatcher."""
@@ -359,6 +360,8 @@ class ToolExecutor:
     def get_tool_signature(self, tool_name: str) -> Optional[Dict[str, Any]]:
         """Get the signature and documentation for a tool.
         
+        Results are cached per tool, so repeated lookups skip introspection.
+        
         Args:
             tool_name: Name of the tool
             
@@ -368,6 +371,16 @@ class ToolExecutor:
         if tool_name not in self._available_tools:
             return None
         
+        cached = self._signature_cache.get(tool_name)
+        if cached is not None:
+            return cached
+        
+        result = self._build_signature(tool_name)
+        self._signature_cache[tool_name] = result
+        return result
+    
+    def _build_signature(self, tool_name: str) -> Dict[str, Any]:
+        """Introspect a tool's signature and docstring."""
         func = self._available_tools[tool_name]
         sig = inspect.signature(func)
         doc = inspect.getdoc(func)
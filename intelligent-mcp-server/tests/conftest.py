@@ -0,0 +1,16 @@
+"""Shared pytest configuration for the intelligent MCP server tests."""
+
+import pytest
+from pytest_asyncio import is_async_test
+
+
+def pytest_collection_modifyitems(items):
+    """Run every async test on one session-scoped event loop.
+
+    The async tests only drive mocks, so sharing a loop is safe and avoids
+    creating a fresh event loop for each test.
+    """
+    session_scope_marker = pytest.mark.asyncio(loop_scope="session")
+    for item in items:
+        if is_async_test(item):
+            item.add_marker(session_scope_marker, append=False)
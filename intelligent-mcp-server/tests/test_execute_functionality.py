@@ -176,7 +176,28 @@ class TestToolExecutor:
         assert result["name"] == "test_func"
         assert "parameters" in result
         assert "param1" in result["parameters"]
-    
+
+    @patch('intelligent_mcp_server.execute.tool_executor.math_dispatcher')
+    def test_get_tool_signature_cached(self, mock_dispatcher):
+        """Test that repeated signature lookups reuse the cached result."""
+        def test_func(a: int, b: int = 2):
+            """Test function documentation"""
+            return a + b
+
+        mock_dispatcher.__all__ = ["test_func"]
+        mock_dispatcher.test_func = test_func
+
+        executor = ToolExecutor()
+        first = executor.get_tool_signature("test_func")
+
+        with patch('inspect.signature') as mock_sig:
+            second = executor.get_tool_signature("test_func")
+            mock_sig.assert_not_called()
+
+        assert second is first
+        assert second["parameters"]["b"]["default"] == 2
+        assert executor.get_tool_signature("missing_func") is None
+
     @patch('intelligent_mcp_server.execute.tool_executor.math_dispatcher')
     def test_get_available_tools(self, mock_dispatcher):
         """Test getting list of available tools."""
@@ -1,9 +1,11 @@
 # Math Genius core package
 
+# Set before the submodule imports, which key their disk caches on it
+__version__ = "0.2.0"
+
 from mathgenius.api.dispatcher import *
 from mathgenius import arithmetic, algebra, geometry, core
 
-__version__ = "0.2.0"
 __all__ = [
     "arithmetic", "algebra", "geometry", "core"
 ]
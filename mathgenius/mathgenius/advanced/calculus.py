@@ -1,11 +1,367 @@
 """Calculus operations module for advanced mathematical computations."""
+import importlib
+import importlib.util
+import inspect
+import os
+import weakref
+from functools import lru_cache
+
 import sympy as sp
 import numpy as np
-from sympy import symbols, diff, integrate, limit, series, oo, nan, zoo
-from sympy.abc import x, y, z
+from scipy.integrate import quad
+from sympy import diff, integrate, limit, series, oo, zoo
 from mathgenius.core.validation import validate_numbers
 from mathgenius.core.errors import ValidationError, CalculationError
 
+# numba is an optional accelerator. Importing it (and loading the cached
+# kernels) takes longer than the rest of this module, so it happens on first use.
+_HAS_NUMBA = importlib.util.find_spec('numba') is not None
+
+# Compiled ufuncs and jitted scalar functions (None when compilation failed),
+# keyed weakly on the callable.
+_numba_ufuncs = weakref.WeakKeyDictionary()
+_numba_jitted = weakref.WeakKeyDictionary()
+
+# Whether a callable accepts an ndarray of points, keyed weakly on the callable.
+_array_callables = weakref.WeakKeyDictionary()
+
+# Highest-order Taylor expansion seen per (expr, var, point), oldest evicted first.
+_TAYLOR_CACHE_SIZE = 1024
+_taylor_cache = {}
+
+# Clear SymPy's global cache every N symbolic calls (0 disables). Clearing
+# bounds memory in long-running processes, but every expression built after
+# a clear is re-derived from scratch, so the first calls after it are slower.
+_CLEAR_CACHE_EVERY = int(os.environ.get('MATHGENIUS_CLEAR_CACHE_EVERY', '0') or 0)
+_CALL_COUNT = 0
+
+
+@lru_cache(maxsize=4096)
+def _cached_sympify(expression):
+    """Parse an expression string once and reuse the immutable result."""
+    return sp.sympify(expression)
+
+
+@lru_cache(maxsize=4096)
+def _cached_symbol(name):
+    """Return the SymPy symbol for a variable name, skipping symbols() parsing."""
+    return sp.Symbol(name)
+
+
+@lru_cache(maxsize=4096)
+def _cached_diff(expr, var, order):
+    """Differentiate a (hashable) expression, memoizing the result."""
+    if order < 3:
+        return diff(expr, var, order)
+    if expr.is_polynomial(var):
+        # High-order derivatives of polynomials are coefficient shifts
+        return sp.Poly(expr, var).diff((var, order)).as_expr()
+    return sp.Derivative(expr, (var, order)).doit(deep=False)
+
+
+@lru_cache(maxsize=4096)
+def _cached_integrate(expr, var):
+    """
+    Compute an antiderivative, memoizing the result.
+    
+    Polynomials integrate by shifting coefficients; other expressions go
+    through SymPy's general integrator.
+    """
+    if expr.is_polynomial(var):
+        return sp.Poly(expr, var).integrate().as_expr()
+    return integrate(expr, var)
+
+
+def clear_caches():
+    """
+    Clear the memoized parsing and symbolic results of this module.
+
+    Useful for tests and for bounding memory in long-running processes.
+    """
+    _cached_sympify.cache_clear()
+    _cached_symbol.cache_clear()
+    _cached_diff.cache_clear()
+    _cached_integrate.cache_clear()
+    _compile_cached.cache_clear()
+    _taylor_cache.clear()
+
+
+@lru_cache(maxsize=128)
+def _quadrature_weights(n, method):
+    """
+    Unit-step quadrature weights for n intervals.
+    
+    The returned array is read-only because it is shared between calls.
+    """
+    weights = np.ones(n + 1)
+    if method == 'simpson':
+        weights[1:-1:2] = 4.0
+        weights[2:-1:2] = 2.0
+        weights /= 3.0
+    else:
+        weights[0] = weights[-1] = 0.5
+    weights.flags.writeable = False
+    return weights
+
+
+@lru_cache(maxsize=32)
+def _gauss_legendre(n):
+    """Read-only n-point Gauss-Legendre nodes and weights on [-1, 1]."""
+    nodes, weights = np.polynomial.legendre.leggauss(n)
+    nodes.flags.writeable = False
+    weights.flags.writeable = False
+    return nodes, weights
+
+
+def _evaluate_on_grid(func, xs, jit=False):
+    """
+    Evaluate func on every grid point, in one vectorized call when possible.
+    
+    Scalar-only callables (e.g. ones using the math module or branching on
+    their argument) are compiled with numba when jit is set, and otherwise
+    fall back to a per-point loop. Real results are returned as contiguous
+    float64 so the weighted sum runs through BLAS.
+    """
+    ys = _try_vectorized(func, xs)
+    if ys is None and jit:
+        ufunc = _maybe_numba_vectorize(func)
+        if ufunc is not None:
+            ys = ufunc(xs)
+    if ys is None:
+        ys = np.array([func(x) for x in xs])
+    if ys.dtype.kind in 'biuf':
+        ys = np.ascontiguousarray(ys, dtype=np.float64)
+    return ys
+
+
+def _try_vectorized(func, xs):
+    """Call func on the whole array, or return None if it cannot take one."""
+    try:
+        ys = np.asarray(func(xs))
+    except Exception:
+        return None
+    return ys if ys.shape == xs.shape else None
+
+
+def _midpoint_sum(func, a, h, n, jit=False):
+    """
+    Midpoint-rule integral over n intervals of width h starting at a.
+    
+    With jit set, scalar-only callables run through a compiled loop that
+    never materializes the sample array.
+    """
+    xs = a + (np.arange(n) + 0.5) * h
+    ys = _try_vectorized(func, xs)
+    if ys is None and jit:
+        jitted = _maybe_numba_jit(func)
+        if jitted is not None:
+            return _midpoint_kernel()(jitted, float(a), float(h), n)
+    if ys is None:
+        ys = np.array([func(x) for x in xs])
+    return h * ys.sum()
+
+
+def _evaluate_points(func, pts):
+    """
+    Evaluate func at a few points, in one call when it accepts arrays.
+    
+    Whether a callable rejected an ndarray is remembered so later calls go
+    straight to the per-point loop.
+    """
+    try:
+        vector_safe = _array_callables.get(func)
+    except TypeError:  # not weak-referenceable, e.g. a builtin
+        vector_safe = None
+    if vector_safe is not False:
+        try:
+            ys = np.asarray(func(pts))
+            vector_safe = ys.shape == pts.shape
+        except Exception:
+            vector_safe = False
+        try:
+            _array_callables[func] = vector_safe
+        except TypeError:
+            pass
+        if vector_safe:
+            return ys
+    return np.array([func(p) for p in pts])
+
+
+def _maybe_numba_jit(func):
+    """
+    Compile a scalar Python function to a float64 -> float64 C callback.
+    
+    The callback matches the declared signature of the numba kernels, so
+    they are called through a function pointer without recompilation.
+    Returns None when numba is unavailable or cannot compile the function.
+    """
+    if not _HAS_NUMBA or not inspect.isfunction(func):
+        return None
+    try:
+        return _numba_jitted[func]
+    except KeyError:
+        pass
+    try:
+        jitted = _lazy('numba').cfunc('float64(float64)')(func)
+    except Exception:
+        jitted = None
+    _numba_jitted[func] = jitted
+    return jitted
+
+
+@lru_cache(maxsize=None)
+def _lazy(name):
+    """Import a module on first use."""
+    return importlib.import_module(name)
+
+
+@lru_cache(maxsize=1)
+def _midpoint_kernel():
+    """
+    The numba midpoint-sum kernel, built on first use.
+    
+    It is compiled (and disk-cached) for its single signature when built,
+    so integration requests do not pay JIT latency.
+    """
+    numba = _lazy('numba')
+    scalar_function = numba.types.FunctionType(numba.float64(numba.float64))
+    
+    @numba.njit(
+        numba.float64(scalar_function, numba.float64, numba.float64, numba.int64),
+        cache=True, fastmath=True,
+    )
+    def midpoint_kernel(f, a, h, n):
+        """Sum a jitted f over midpoints a + (i + 0.5) * h, i < n."""
+        acc = 0.0
+        for i in range(n):
+            acc += f(a + (i + 0.5) * h)
+        return acc * h
+    
+    return midpoint_kernel
+
+
+def _maybe_numba_vectorize(func):
+    """
+    Compile a scalar Python function into a parallel float64 ufunc.
+    
+    Returns None when numba is unavailable or cannot compile the function.
+    Results are cached per function so the compile cost is paid once.
+    """
+    if not _HAS_NUMBA or not inspect.isfunction(func):
+        return None
+    try:
+        return _numba_ufuncs[func]
+    except KeyError:
+        pass
+    try:
+        ufunc = _lazy('numba').vectorize(['float64(float64)'], target='parallel')(func)
+    except Exception:
+        ufunc = None
+    _numba_ufuncs[func] = ufunc
+    return ufunc
+
+
+def _parse_expression(expression):
+    """Parse a string expression (cached); SymPy objects pass through."""
+    if isinstance(expression, str):
+        try:
+            return _cached_sympify(expression)
+        except Exception:
+            raise ValidationError(f"Invalid mathematical expression: {expression}")
+    return expression
+
+
+def _count_symbolic_call():
+    """
+    Count a symbolic entry-point call, clearing SymPy's cache every N calls.
+    
+    Runs before any parsing so the cache is never cleared while a
+    computation is still using it.
+    """
+    global _CALL_COUNT
+    if _CLEAR_CACHE_EVERY <= 0:
+        return
+    _CALL_COUNT += 1
+    if _CALL_COUNT >= _CLEAR_CACHE_EVERY:
+        _CALL_COUNT = 0
+        sp.core.cache.clear_cache()
+
+
+def _prepare(expression, variable):
+    """Validate and parse an (expression, variable name) pair."""
+    _count_symbolic_call()
+    expr = _parse_expression(expression)
+    if not isinstance(variable, str):
+        raise ValidationError("Variable must be a string")
+    return expr, _cached_symbol(variable)
+
+
+def _prepare_many(expression, variables):
+    """Validate and parse an expression with a list of variable names."""
+    _count_symbolic_call()
+    expr = _parse_expression(expression)
+    if not isinstance(variables, list) or len(variables) == 0:
+        raise ValidationError("Variables must be a non-empty list")
+    for var in variables:
+        if not isinstance(var, str):
+            raise ValidationError("All variables must be strings")
+    return expr, [_cached_symbol(var) for var in variables]
+
+
+def _quad_expression(expr, var, lower_bound, upper_bound):
+    """
+    Integrate a one-variable expression with QUADPACK.
+    
+    Returns None when the expression cannot be evaluated numerically or the
+    quadrature reports a problem (divergence, slow convergence, ...).
+    """
+    try:
+        func = _compile_cached(expr, (var,), 'numpy')
+        with np.errstate(all='ignore'):
+            value, _, _, *message = quad(func, lower_bound, upper_bound, full_output=1)
+    except Exception:
+        return None
+    if message or not np.isfinite(value):
+        return None
+    return float(value)
+
+
+def _cached_taylor(expr, var, point, order):
+    """
+    Taylor expansion that slices a cached higher-order expansion when possible.
+    
+    The expansion is stored about 0 in the shifted variable, as (term, power)
+    pairs, which is also how SymPy expands about a nonzero point.
+    """
+    key = (expr, var, point)
+    cached = _taylor_cache.get(key)
+    if cached is None or cached[0] < order:
+        shifted = expr.subs(var, var + point) if point != 0 else expr
+        expansion = series(shifted, var, 0, order + 1).removeO()
+        terms = []
+        for term in sp.Add.make_args(expansion):
+            coeff, power = term.as_coeff_exponent(var)
+            if coeff.has(var):  # e.g. log terms: powers are not separable
+                terms = None
+                break
+            terms.append((term, power))
+        if terms is None:
+            return expansion.subs(var, var - point) if point != 0 else expansion
+        if len(_taylor_cache) >= _TAYLOR_CACHE_SIZE:
+            _taylor_cache.pop(next(iter(_taylor_cache)))
+        cached = _taylor_cache[key] = (order, terms)
+        
+    result = sp.Add(*[term for term, power in cached[1] if power < order + 1])
+    return result.subs(var, var - point) if point != 0 else result
+
+
+def _polynomial_taylor(expr, var, point, order):
+    """Truncate a polynomial, re-centred on point, to the given order."""
+    shifted = expr.subs(var, var + point) if point != 0 else expr
+    poly = sp.Poly(shifted, var)
+    return sp.Add(*[coeff * (var - point)**k
+                    for (k,), coeff in poly.terms() if k <= order])
+
 
 def differentiate(expression, variable='x', order=1):
     """
@@ -28,23 +384,11 @@ def differentiate(expression, variable='x', order=1):
         if not isinstance(order, int) or order < 1:
             raise ValidationError("Order must be a positive integer")
             
-        # Parse expression if it's a string
-        if isinstance(expression, str):
-            try:
-                expr = sp.sympify(expression)
-            except Exception:
-                raise ValidationError(f"Invalid mathematical expression: {expression}")
-        else:
-            expr = expression
-            
-        # Validate variable
-        if not isinstance(variable, str):
-            raise ValidationError("Variable must be a string")
-            
-        var = symbols(variable)
+        # Parse expression and variable
+        expr, var = _prepare(expression, variable)
         
         # Compute derivative
-        result = diff(expr, var, order)
+        result = _cached_diff(expr, var, order)
         return result
         
     except ValidationError:
@@ -53,15 +397,20 @@ def differentiate(expression, variable='x', order=1):
         raise CalculationError(f"Failed to compute derivative: {str(e)}")
 
 
-def integrate_definite(expression, variable='x', lower_bound=0, upper_bound=1):
+def integrate_definite(expression, variable='x', lower_bound=0, upper_bound=1, symbolic=False):
     """
     Compute definite integral of an expression.
     
+    Expressions in the integration variable alone are integrated numerically
+    with adaptive quadrature; others, or any the quadrature cannot resolve,
+    go through SymPy's symbolic integrator.
+    
     Args:
         expression (str|sympy.Expr): Mathematical expression to integrate
         variable (str): Variable to integrate with respect to
         lower_bound (float): Lower bound of integration
         upper_bound (float): Upper bound of integration
+        symbolic (bool): Always integrate symbolically
         
     Returns:
         sympy.Expr|float: Definite integral value
@@ -74,24 +423,22 @@ def integrate_definite(expression, variable='x', lower_bound=0, upper_bound=1):
         # Validate bounds
         validate_numbers(lower_bound, upper_bound)
         
-        # Parse expression if it's a string
-        if isinstance(expression, str):
-            try:
-                expr = sp.sympify(expression)
-            except Exception:
-                raise ValidationError(f"Invalid mathematical expression: {expression}")
-        else:
-            expr = expression
-            
-        # Validate variable
-        if not isinstance(variable, str):
-            raise ValidationError("Variable must be a string")
-            
-        var = symbols(variable)
+        # Parse expression and variable
+        expr, var = _prepare(expression, variable)
         
+        # Numeric quadrature avoids building an antiderivative
+        if not symbolic and expr.free_symbols <= {var}:
+            numerical_result = _quad_expression(expr, var, lower_bound, upper_bound)
+            if numerical_result is not None:
+                return numerical_result
+                
         # Compute definite integral
         result = integrate(expr, (var, lower_bound, upper_bound))
         
+        # Plain numbers convert directly, without an evalf round-trip
+        if isinstance(result, sp.Number):
+            return float(result)
+            
         # Try to evaluate numerically if possible
         try:
             numerical_result = float(result.evalf())
@@ -121,23 +468,11 @@ def integrate_indefinite(expression, variable='x'):
         CalculationError: If integration fails
     """
     try:
-        # Parse expression if it's a string
-        if isinstance(expression, str):
-            try:
-                expr = sp.sympify(expression)
-            except Exception:
-                raise ValidationError(f"Invalid mathematical expression: {expression}")
-        else:
-            expr = expression
-            
-        # Validate variable
-        if not isinstance(variable, str):
-            raise ValidationError("Variable must be a string")
-            
-        var = symbols(variable)
+        # Parse expression and variable
+        expr, var = _prepare(expression, variable)
         
         # Compute indefinite integral
-        result = integrate(expr, var)
+        result = _cached_integrate(expr, var)
         return result
         
     except ValidationError:
@@ -164,20 +499,8 @@ def compute_limit(expression, variable='x', point=0, direction='+'):
         CalculationError: If limit calculation fails
     """
     try:
-        # Parse expression if it's a string
-        if isinstance(expression, str):
-            try:
-                expr = sp.sympify(expression)
-            except Exception:
-                raise ValidationError(f"Invalid mathematical expression: {expression}")
-        else:
-            expr = expression
-            
-        # Validate variable
-        if not isinstance(variable, str):
-            raise ValidationError("Variable must be a string")
-            
-        var = symbols(variable)
+        # Parse expression and variable
+        expr, var = _prepare(expression, variable)
         
         # Parse point
         if isinstance(point, str):
@@ -201,6 +524,13 @@ def compute_limit(expression, variable='x', point=0, direction='+'):
         # Compute limit
         result = limit(expr, var, point_val, direction)
         
+        # Numbers and infinities are recognised by type, skipping the
+        # assumptions system
+        if isinstance(result, sp.Number):
+            return float(result) if result.is_finite else result
+        if result is zoo:
+            return result
+            
         # Try to evaluate numerically if possible
         try:
             if result.is_real and result.is_finite:
@@ -240,21 +570,17 @@ def taylor_series(expression, variable='x', point=0, order=6):
         if not isinstance(order, int) or order < 0:
             raise ValidationError("Order must be a non-negative integer")
             
-        # Parse expression if it's a string
-        if isinstance(expression, str):
-            try:
-                expr = sp.sympify(expression)
-            except Exception:
-                raise ValidationError(f"Invalid mathematical expression: {expression}")
-        else:
-            expr = expression
+        # Parse expression and variable
+        expr, var = _prepare(expression, variable)
+        
+        # Polynomials are their own Taylor series: truncate the coefficients
+        if expr.is_polynomial(var):
+            return _polynomial_taylor(expr, var, point, order)
             
-        # Validate variable
-        if not isinstance(variable, str):
-            raise ValidationError("Variable must be a string")
+        # Exact expansion points reuse the highest-order expansion computed so far
+        if isinstance(point, int):
+            return _cached_taylor(expr, var, point, order)
             
-        var = symbols(variable)
-        
         # Compute Taylor series
         result = series(expr, var, point, order + 1).removeO()
         return result
@@ -286,23 +612,11 @@ def partial_derivative(expression, variable='x', order=1):
         if not isinstance(order, int) or order < 1:
             raise ValidationError("Order must be a positive integer")
             
-        # Parse expression if it's a string
-        if isinstance(expression, str):
-            try:
-                expr = sp.sympify(expression)
-            except Exception:
-                raise ValidationError(f"Invalid mathematical expression: {expression}")
-        else:
-            expr = expression
-            
-        # Validate variable
-        if not isinstance(variable, str):
-            raise ValidationError("Variable must be a string")
-            
-        var = symbols(variable)
+        # Parse expression and variable
+        expr, var = _prepare(expression, variable)
         
         # Compute partial derivative
-        result = diff(expr, var, order)
+        result = _cached_diff(expr, var, order)
         return result
         
     except ValidationError:
@@ -311,46 +625,46 @@ def partial_derivative(expression, variable='x', order=1):
         raise CalculationError(f"Failed to compute partial derivative: {str(e)}")
 
 
-def gradient(expression, variables=['x', 'y']):
+def gradient(expression, variables=['x', 'y'], common_subexpression_elimination=False,
+             return_callable=False):
     """
     Compute gradient of a multivariable expression.
     
     Args:
         expression (str|sympy.Expr): Mathematical expression
         variables (list): List of variables to compute gradient with respect to
+        common_subexpression_elimination (bool): Return the gradient as
+            ``sympy.cse`` output, sharing repeated subexpressions between components
+        return_callable (bool): Also return a compiled function evaluating all
+            components at once
         
     Returns:
-        list: List of partial derivatives (gradient components)
+        list: List of partial derivatives (gradient components), or a
+        ``(replacements, reduced_components)`` tuple when CSE is requested.
+        With return_callable, a ``(gradient, grad_fn)`` pair where
+        ``grad_fn(*point)`` returns the components as a NumPy array.
         
     Raises:
         ValidationError: If expression or variables are invalid
         CalculationError: If gradient computation fails
     """
     try:
-        # Parse expression if it's a string
-        if isinstance(expression, str):
-            try:
-                expr = sp.sympify(expression)
-            except Exception:
-                raise ValidationError(f"Invalid mathematical expression: {expression}")
-        else:
-            expr = expression
-            
-        # Validate variables
-        if not isinstance(variables, list) or len(variables) == 0:
-            raise ValidationError("Variables must be a non-empty list")
+        # Parse expression and variables
+        expr, var_symbols = _prepare_many(expression, variables)
             
-        for var in variables:
-            if not isinstance(var, str):
-                raise ValidationError("All variables must be strings")
-                
         # Compute gradient
         grad = []
-        for var_name in variables:
-            var = symbols(var_name)
-            partial = diff(expr, var)
+        for var in var_symbols:
+            partial = _cached_diff(expr, var, 1)
             grad.append(partial)
             
+        if return_callable:
+            # One lambdified function with CSE shared across all components
+            grad_fn = _compile_cached(sp.Array(grad), tuple(var_symbols), 'numpy')
+        if common_subexpression_elimination:
+            grad = sp.cse(grad)
+        if return_callable:
+            return grad, grad_fn
         return grad
         
     except ValidationError:
@@ -359,46 +673,93 @@ def gradient(expression, variables=['x', 'y']):
         raise CalculationError(f"Failed to compute gradient: {str(e)}")
 
 
-def hessian_matrix(expression, variables=['x', 'y']):
+def gradient_at(expression, variables, points):
+    """
+    Evaluate the gradient of an expression at a batch of points.
+    
+    The gradient is lambdified once, with subexpressions shared between its
+    components, and evaluated over all points in one broadcast call.
+    
+    Args:
+        expression (str|sympy.Expr): Mathematical expression
+        variables (list): Variable names, in the order of the point coordinates
+        points (array_like): Points of shape (m, n) for n variables, or a
+            single point of shape (n,)
+        
+    Returns:
+        numpy.ndarray: Gradients with the same shape as points
+        
+    Raises:
+        ValidationError: If expression, variables, or points are invalid
+        CalculationError: If gradient evaluation fails
+    """
+    try:
+        # Parse expression and variables
+        expr, var_symbols = _prepare_many(expression, variables)
+        
+        # Validate points
+        try:
+            pts = np.asarray(points, dtype=float)
+        except (TypeError, ValueError):
+            raise ValidationError("Points must be numeric")
+        if pts.ndim not in (1, 2) or pts.shape[-1] != len(var_symbols):
+            raise ValidationError(
+                "Points must have shape (m, n) or (n,) for n variables")
+        
+        grad = tuple(_cached_diff(expr, var, 1) for var in var_symbols)
+        grad_fn = _compile_cached(grad, tuple(var_symbols), 'numpy')
+        components = grad_fn(*pts.T)
+        # Constant components come back as scalars; broadcast them over the batch
+        batch_shape = pts.shape[:-1]
+        return np.stack([np.broadcast_to(c, batch_shape) for c in components],
+                        axis=-1).astype(float)
+        
+    except ValidationError:
+        raise
+    except Exception as e:
+        raise CalculationError(f"Failed to evaluate gradient: {str(e)}")
+
+
+def hessian_matrix(expression, variables=['x', 'y'], assume_symmetric=True,
+                   return_callable=False):
     """
     Compute Hessian matrix of a multivariable expression.
     
     Args:
         expression (str|sympy.Expr): Mathematical expression
         variables (list): List of variables
+        assume_symmetric (bool): Mirror the upper triangle instead of computing
+            the lower one (valid when mixed partials commute)
+        return_callable (bool): Also return a compiled function evaluating the
+            whole matrix at once
         
     Returns:
-        sympy.Matrix: Hessian matrix
+        sympy.Matrix: Hessian matrix, or a ``(hessian, hess_fn)`` pair with
+        return_callable, where ``hess_fn(*point)`` returns a NumPy array
         
     Raises:
         ValidationError: If expression or variables are invalid
         CalculationError: If Hessian computation fails
     """
     try:
-        # Parse expression if it's a string
-        if isinstance(expression, str):
-            try:
-                expr = sp.sympify(expression)
-            except Exception:
-                raise ValidationError(f"Invalid mathematical expression: {expression}")
-        else:
-            expr = expression
-            
-        # Validate variables
-        if not isinstance(variables, list) or len(variables) == 0:
-            raise ValidationError("Variables must be a non-empty list")
-            
-        for var in variables:
-            if not isinstance(var, str):
-                raise ValidationError("All variables must be strings")
-                
-        # Create symbol variables
-        var_symbols = [symbols(var) for var in variables]
+        # Parse expression and variables
+        expr, var_symbols = _prepare_many(expression, variables)
         
-        # Compute Hessian matrix
+        # Differentiate each first partial instead of re-deriving it per entry
         n = len(var_symbols)
-        hess = sp.Matrix(n, n, lambda i, j: diff(expr, var_symbols[i], var_symbols[j]))
+        firsts = [_cached_diff(expr, var, 1) for var in var_symbols]
+        hess = sp.zeros(n, n)
+        for i in range(n):
+            if assume_symmetric:
+                for j in range(i, n):
+                    hess[i, j] = hess[j, i] = diff(firsts[i], var_symbols[j])
+            else:
+                for j in range(n):
+                    hess[i, j] = diff(firsts[i], var_symbols[j])
         
+        if return_callable:
+            hess_fn = _compile_cached(sp.ImmutableMatrix(hess), tuple(var_symbols), 'numpy')
+            return hess, hess_fn
         return hess
         
     except ValidationError:
@@ -407,10 +768,13 @@ def hessian_matrix(expression, variables=['x', 'y']):
         raise CalculationError(f"Failed to compute Hessian matrix: {str(e)}")
 
 
-def numerical_derivative(func, point, h=1e-8):
+def numerical_derivative(func, point, h=1e-3):
     """
     Compute numerical derivative using finite differences.
     
+    Central differences at steps h and h/2 are combined by Richardson
+    extrapolation, giving O(h**4) truncation error.
+    
     Args:
         func (callable): Function to differentiate
         point (float): Point at which to compute derivative
@@ -431,17 +795,21 @@ def numerical_derivative(func, point, h=1e-8):
         if h <= 0:
             raise ValidationError("Step size must be positive")
             
-        # Compute numerical derivative using central difference
+        # Compute numerical derivative using extrapolated central differences
         try:
-            f_plus = func(point + h)
-            f_minus = func(point - h)
-            derivative = (f_plus - f_minus) / (2 * h)
+            pts = np.array([point + h, point - h, point + h / 2, point - h / 2])
+            ys = _evaluate_points(func, pts)
+            d_h = (ys[0] - ys[1]) / (2 * h)
+            d_half = (ys[2] - ys[3]) / h
+            derivative = (4 * d_half - d_h) / 3
             return derivative
         except Exception:
-            # Fall back to forward difference if central difference fails
-            f_plus = func(point + h)
-            f_point = func(point)
-            derivative = (f_plus - f_point) / h
+            # Fall back to extrapolated forward differences if func fails below point
+            pts = np.array([point, point + h, point + h / 2, point + h / 4])
+            ys = _evaluate_points(func, pts)
+            d_h, d_half, d_quarter = (ys[1:] - ys[0]) / np.array([h, h / 2, h / 4])
+            first, second = 2 * d_half - d_h, 2 * d_quarter - d_half
+            derivative = (4 * second - first) / 3
             return derivative
             
     except ValidationError:
@@ -450,16 +818,25 @@ def numerical_derivative(func, point, h=1e-8):
         raise CalculationError(f"Failed to compute numerical derivative: {str(e)}")
 
 
-def numerical_integral(func, lower_bound, upper_bound, method='simpson', n=1000):
+def numerical_integral(func, lower_bound, upper_bound, method='simpson', n=1000, jit=False):
     """
     Compute numerical integral using various methods.
     
+    Scalar-only Python functions are evaluated point by point unless jit is
+    set, in which case they are compiled with numba (when installed) once per
+    function object. A compiled function keeps the values its globals and
+    closure variables had when it was compiled, and floating-point overflow
+    gives inf or nan instead of raising, so only enable jit for
+    self-contained functions.
+    
     Args:
         func (callable): Function to integrate
         lower_bound (float): Lower bound of integration
         upper_bound (float): Upper bound of integration
-        method (str): Integration method ('simpson', 'trapezoidal', 'midpoint')
-        n (int): Number of intervals
+        method (str): Integration method ('simpson', 'trapezoidal', 'midpoint',
+            'gauss' for n-point Gauss-Legendre, or 'adaptive' for QUADPACK)
+        n (int): Number of intervals (nodes for 'gauss'; unused by 'adaptive')
+        jit (bool): Compile scalar-only Python functions with numba
         
     Returns:
         float: Numerical integral value
@@ -475,48 +852,35 @@ def numerical_integral(func, lower_bound, upper_bound, method='simpson', n=1000)
             raise ValidationError("Function must be callable")
         if not isinstance(n, int) or n <= 0:
             raise ValidationError("Number of intervals must be a positive integer")
-        if method not in ['simpson', 'trapezoidal', 'midpoint']:
-            raise ValidationError("Method must be 'simpson', 'trapezoidal', or 'midpoint'")
+        if method not in ['simpson', 'trapezoidal', 'midpoint', 'gauss', 'adaptive']:
+            raise ValidationError(
+                "Method must be 'simpson', 'trapezoidal', 'midpoint', 'gauss', or 'adaptive'"
+            )
+            
+        if method == 'adaptive':
+            # Adaptive Gauss-Kronrod quadrature
+            integral, _ = quad(func, lower_bound, upper_bound)
+            return integral
+            
+        if method == 'gauss':
+            # Gauss-Legendre nodes mapped from [-1, 1] to the bounds
+            nodes, weights = _gauss_legendre(n)
+            half_width = (upper_bound - lower_bound) / 2
+            xs = lower_bound + half_width * (nodes + 1)
+            return half_width * np.dot(weights, _evaluate_on_grid(func, xs, jit))
             
         # Compute numerical integral
+        if method == 'simpson':
+            n += n & 1  # Ensure n is even for Simpson's rule
         h = (upper_bound - lower_bound) / n
         
-        if method == 'simpson':
-            # Simpson's rule
-            if n % 2 == 1:
-                n += 1  # Ensure n is even for Simpson's rule
-                h = (upper_bound - lower_bound) / n
-                
-            integral = func(lower_bound) + func(upper_bound)
-            
-            for i in range(1, n):
-                x = lower_bound + i * h
-                if i % 2 == 0:
-                    integral += 2 * func(x)
-                else:
-                    integral += 4 * func(x)
-                    
-            integral *= h / 3
-            
-        elif method == 'trapezoidal':
-            # Trapezoidal rule
-            integral = (func(lower_bound) + func(upper_bound)) / 2
-            
-            for i in range(1, n):
-                x = lower_bound + i * h
-                integral += func(x)
-                
-            integral *= h
-            
-        elif method == 'midpoint':
+        if method == 'midpoint':
             # Midpoint rule
-            integral = 0
-            
-            for i in range(n):
-                x = lower_bound + (i + 0.5) * h
-                integral += func(x)
-                
-            integral *= h
+            integral = _midpoint_sum(func, lower_bound, h, n, jit)
+        else:
+            # Simpson's or trapezoidal rule as a weighted sum over the grid
+            xs = np.linspace(lower_bound, upper_bound, n + 1)
+            integral = h * np.dot(_quadrature_weights(n, method), _evaluate_on_grid(func, xs, jit))
             
         return integral
         
@@ -524,3 +888,75 @@ def numerical_integral(func, lower_bound, upper_bound, method='simpson', n=1000)
         raise
     except Exception as e:
         raise CalculationError(f"Failed to compute numerical integral: {str(e)}")
+
+
+@lru_cache(maxsize=256)
+def _compile_cached(expr, var_symbols, backend):
+    """Lambdify (and optionally JIT- or C-compile) an expression once."""
+    if not isinstance(expr, sp.Expr):
+        # numba cannot stack per-component arrays, so vector-valued
+        # expressions (gradients, Hessians) stay on NumPy
+        backend = 'numpy'
+    if backend == 'numba':
+        # numba cannot type SymPy's exact integer arithmetic, so use floats
+        expr = expr.xreplace({k: sp.Float(k) for k in expr.atoms(sp.Integer)})
+    func = sp.lambdify(var_symbols, expr, modules='numpy', cse=True)
+    if backend == 'numpy':
+        return func
+    if backend == 'c':
+        try:
+            # Generated C wrapped as a NumPy ufunc; needs a C compiler
+            return _lazy('sympy.utilities.autowrap').ufuncify(var_symbols, expr)
+        except Exception:
+            return func
+    numba = _lazy('numba')
+    jitted = numba.njit(func)
+    try:
+        # Compile the scalar float64 specialization now so failures surface here
+        jitted.compile((numba.float64,) * len(var_symbols))
+    except Exception:
+        return func
+    return jitted
+
+
+def compile_expression(expression, variables=['x'], backend='auto'):
+    """
+    Compile an expression into a fast numerical function.
+    
+    The expression is lambdified once with common subexpression elimination
+    and, for the numba backend, JIT-compiled. The 'c' backend generates C
+    code and builds it into a NumPy ufunc, which takes about a second but
+    evaluates fastest; without a working C compiler it falls back to NumPy.
+    Compiled functions are cached, so compiling the same expression again
+    is a dictionary lookup.
+    
+    Args:
+        expression (str|sympy.Expr): Mathematical expression to compile
+        variables (list): Variable names, in the order the function takes them
+        backend (str): 'numpy', 'numba', 'c', or 'auto' (numba when installed)
+        
+    Returns:
+        callable: Function of one argument per variable, accepting scalars or arrays
+        
+    Raises:
+        ValidationError: If expression, variables, or backend are invalid
+        CalculationError: If compilation fails
+    """
+    try:
+        # Parse expression and variables
+        expr, var_symbols = _prepare_many(expression, variables)
+            
+        # Validate backend
+        if backend not in ['auto', 'numpy', 'numba', 'c']:
+            raise ValidationError("Backend must be 'auto', 'numpy', 'numba', or 'c'")
+        if backend == 'numba' and not _HAS_NUMBA:
+            raise CalculationError("The numba backend requires numba to be installed")
+        if backend == 'auto':
+            backend = 'numba' if _HAS_NUMBA else 'numpy'
+            
+        return _compile_cached(expr, tuple(var_symbols), backend)
+        
+    except (ValidationError, CalculationError):
+        raise
+    except Exception as e:
+        raise CalculationError(f"Failed to compile expression: {str(e)}")
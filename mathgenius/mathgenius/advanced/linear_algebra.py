@@ -1,10 +1,125 @@
-"""Linear algebra operations module for advanced mathematical computations."""
+"""Linear algebra operations module for advanced mathematical computations.
+
+Inputs are converted with np.asarray, so ndarray arguments are used without
+copying and results such as matrix_transpose may share memory with them.
+QR and SVD convert straight to Fortran order, sparing SciPy a copy.
+LAPACK routines may overwrite only the arrays created here from lists or
+by converting an ndarray, never the caller's arrays or views of them.
+Float inputs are checked for infs and NaNs once, up front, instead of by
+each SciPy call.
+NumPy and SciPy release the GIL inside BLAS and LAPACK, so calls from
+concurrent threads run their numerical work in parallel.
+"""
+import importlib
+import importlib.util
+import warnings
+from functools import lru_cache
+
 import numpy as np
-from scipy.linalg import solve, det, inv, eig, svd, qr, lu, lstsq
+from scipy.linalg import solve, det, inv, eig, eigh, svd, qr, lu, lstsq, lu_factor, lu_solve, solve_triangular, LinAlgWarning
+from scipy.linalg.blas import dasum, dnrm2, idamax
 from scipy.sparse import csr_matrix, linalg as sparse_linalg
 from mathgenius.core.validation import validate_numbers
 from mathgenius.core.errors import ValidationError, CalculationError
 
+# numba is an optional accelerator, imported on first use. Its compiled
+# kernels beat NumPy's per-call dispatch only for small float vectors.
+_HAS_NUMBA = importlib.util.find_spec('numba') is not None
+_KERNEL_DTYPES = (np.float32, np.float64)
+_KERNEL_MAX_SIZE = 4096
+
+# Squared norms at or below this per element mean a zero vector.
+_TINY = np.finfo(np.float64).tiny
+
+# BLAS nrm2 avoids overflow by scaling as it goes, which makes it slower
+# than NumPy's dot-based 2-norm on long vectors.
+_NRM2_MAX_SIZE = 4096
+
+# Matrices up to this many bytes have their LU factors cached between
+# solves; each cache entry holds the matrix contents and its factors.
+_LU_CACHE_MAX_BYTES = 1 << 20
+
+
+@lru_cache(maxsize=1)
+def _projection_kernel():
+    """
+    The numba vector projection kernel, built on first use.
+    
+    It is compiled (and disk-cached) for float32 and float64 vectors when
+    built, so the first projection does not pay JIT latency.
+    """
+    numba = importlib.import_module('numba')
+    
+    @numba.njit(
+        [numba.types.Tuple((dtype[:], numba.float64))(dtype[:], dtype[:])
+         for dtype in (numba.float32, numba.float64)],
+        cache=True, fastmath=True, error_model='numpy',
+    )
+    def projection_kernel(a, b):
+        """Project a onto b, accumulating a.b and b.b in one pass; returns (projection, b.b)."""
+        ab = 0.0
+        bb = 0.0
+        for i in range(b.size):
+            ai = a[i]
+            bi = b[i]
+            ab += ai * bi
+            bb += bi * bi
+        scale = ab / bb
+        out = np.empty_like(b)
+        for i in range(b.size):
+            out[i] = scale * b[i]
+        return out, bb
+    
+    return projection_kernel
+
+
+def _require_matrix(a):
+    """Raise ValidationError unless a is a 2D array."""
+    if a.ndim != 2:
+        raise ValidationError("Input must be a 2D matrix")
+
+
+def _owned(a, source):
+    """
+    Whether a is a temporary created from source, safe for LAPACK to overwrite.
+    
+    np.asarray returns views of array-likes such as np.matrix, memoryviews
+    and DataFrames, so only arrays built from Python sequences, or ndarray
+    conversions that share no memory with the input, count as owned.
+    """
+    if isinstance(source, (list, tuple)):
+        return True
+    return isinstance(source, np.ndarray) and not np.may_share_memory(a, source)
+
+
+def _require_finite(*arrays):
+    """Raise CalculationError if a float or complex array holds infs or NaNs."""
+    for a in arrays:
+        if a.dtype.kind in 'fc' and not np.isfinite(a).all():
+            raise CalculationError("array must not contain infs or NaNs")
+
+
+def _singular_pivots(pivots):
+    """
+    Whether the diagonal of a triangular factor makes the matrix singular.
+    
+    A pivot counts as zero relative to the largest one, n * eps * max|pivot|,
+    so uniformly scaled matrices (e.g. 1e-15 * I) are not mistaken for
+    singular, while nearly dependent rows of large entries are caught.
+    """
+    pivots = np.abs(pivots)
+    if pivots.size == 0:
+        return False
+    eps = np.finfo(np.result_type(pivots.dtype, np.float32)).eps
+    return pivots.min() <= pivots.size * eps * pivots.max()
+
+
+def _require_square(a, operation):
+    """Raise ValidationError unless a is a square 2D array."""
+    _require_matrix(a)
+    if a.shape[0] != a.shape[1]:
+        raise ValidationError(f"Matrix must be square for {operation}")
+
 
 def matrix_add(matrix_a, matrix_b):
     """
@@ -23,8 +138,8 @@ def matrix_add(matrix_a, matrix_b):
     """
     try:
         # Convert to numpy arrays
-        a = np.array(matrix_a)
-        b = np.array(matrix_b)
+        a = np.asarray(matrix_a)
+        b = np.asarray(matrix_b)
         
         # Validate dimensions
         if a.shape != b.shape:
@@ -37,16 +152,19 @@ def matrix_add(matrix_a, matrix_b):
     except ValidationError:
         raise
     except Exception as e:
-        raise CalculationError(f"Failed to add matrices: {str(e)}")
+        raise CalculationError(f"Failed to add matrices: {str(e)}") from e
 
 
-def matrix_multiply(matrix_a, matrix_b):
+def matrix_multiply(matrix_a, matrix_b, dtype=None):
     """
     Multiply two matrices using matrix multiplication.
     
     Args:
         matrix_a (list|np.ndarray): First matrix
         matrix_b (list|np.ndarray): Second matrix
+        dtype (np.dtype|str): Element type to compute in, such as np.float32
+            to halve memory traffic on large inputs; None keeps the inputs'
+            type
         
     Returns:
         np.ndarray: Product of the matrices
@@ -57,24 +175,26 @@ def matrix_multiply(matrix_a, matrix_b):
     """
     try:
         # Convert to numpy arrays
-        a = np.array(matrix_a)
-        b = np.array(matrix_b)
+        a = np.asarray(matrix_a, dtype=dtype)
+        b = np.asarray(matrix_b, dtype=dtype)
         
         # Validate dimensions for matrix multiplication
-        if len(a.shape) != 2 or len(b.shape) != 2:
+        if a.ndim != 2 or b.ndim != 2:
             raise ValidationError("Both inputs must be 2D matrices")
             
         if a.shape[1] != b.shape[0]:
             raise ValidationError(f"Matrix dimensions incompatible for multiplication: {a.shape} and {b.shape}")
             
-        # Perform multiplication
+        # Perform multiplication; np.dot already calls BLAS gemm for float
+        # arrays, and does so faster than scipy.linalg.blas.dgemm, which
+        # copies C-ordered inputs to Fortran order first
         result = np.dot(a, b)
         return result
         
     except ValidationError:
         raise
     except Exception as e:
-        raise CalculationError(f"Failed to multiply matrices: {str(e)}")
+        raise CalculationError(f"Failed to multiply matrices: {str(e)}") from e
 
 
 def matrix_transpose(matrix):
@@ -93,11 +213,10 @@ def matrix_transpose(matrix):
     """
     try:
         # Convert to numpy array
-        a = np.array(matrix)
+        a = np.asarray(matrix)
         
         # Validate dimensions
-        if len(a.shape) != 2:
-            raise ValidationError("Input must be a 2D matrix")
+        _require_matrix(a)
             
         # Perform transpose
         result = a.T
@@ -106,15 +225,18 @@ def matrix_transpose(matrix):
     except ValidationError:
         raise
     except Exception as e:
-        raise CalculationError(f"Failed to transpose matrix: {str(e)}")
+        raise CalculationError(f"Failed to transpose matrix: {str(e)}") from e
 
 
-def matrix_inverse(matrix):
+def matrix_inverse(matrix, dtype=None):
     """
     Compute inverse of a square matrix.
     
     Args:
         matrix (list|np.ndarray): Input square matrix
+        dtype (np.dtype|str): Element type to compute in, such as np.float32
+            to halve memory traffic on large inputs; None keeps the input's
+            type
         
     Returns:
         np.ndarray: Inverse of the matrix
@@ -125,27 +247,42 @@ def matrix_inverse(matrix):
     """
     try:
         # Convert to numpy array
-        a = np.array(matrix)
+        a = np.asarray(matrix, dtype=dtype)
         
         # Validate dimensions
-        if len(a.shape) != 2:
-            raise ValidationError("Input must be a 2D matrix")
+        _require_square(a, "inversion")
+        _require_finite(a)
+        if a.shape[0] == 0:
+            return np.empty((0, 0), dtype=np.result_type(a.dtype, np.float32))
             
-        if a.shape[0] != a.shape[1]:
-            raise ValidationError("Matrix must be square for inversion")
+        # Diagonal and triangular matrices are their own LU factors
+        lower = not np.triu(a, 1).any()
+        upper = not np.tril(a, -1).any()
+        if lower or upper:
+            diagonal = np.diag(a)
+            if _singular_pivots(diagonal):
+                raise CalculationError("Matrix is singular (determinant is zero)")
+            if lower and upper:
+                return np.diag(1.0 / diagonal)
+            identity = np.eye(a.shape[0], dtype=np.result_type(a.dtype, np.float32))
+            return solve_triangular(a, identity, lower=lower, overwrite_b=True, check_finite=False)
             
-        # Check if matrix is singular
-        if np.abs(np.linalg.det(a)) < 1e-14:
+        # Factorize once; a (relatively) zero pivot means the matrix is singular
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", LinAlgWarning)
+            lu_piv = lu_factor(a, overwrite_a=_owned(a, matrix), check_finite=False)
+        if _singular_pivots(np.diag(lu_piv[0])):
             raise CalculationError("Matrix is singular (determinant is zero)")
             
-        # Perform inversion
-        result = inv(a)
+        # Perform inversion by solving against the identity
+        result = lu_solve(lu_piv, np.eye(a.shape[0], dtype=lu_piv[0].dtype), overwrite_b=True,
+                          check_finite=False)
         return result
         
     except ValidationError:
         raise
     except Exception as e:
-        raise CalculationError(f"Failed to compute matrix inverse: {str(e)}")
+        raise CalculationError(f"Failed to compute matrix inverse: {str(e)}") from e
 
 
 def matrix_determinant(matrix):
@@ -164,24 +301,83 @@ def matrix_determinant(matrix):
     """
     try:
         # Convert to numpy array
-        a = np.array(matrix)
+        a = np.asarray(matrix)
         
         # Validate dimensions
-        if len(a.shape) != 2:
-            raise ValidationError("Input must be a 2D matrix")
-            
-        if a.shape[0] != a.shape[1]:
-            raise ValidationError("Matrix must be square for determinant")
+        _require_square(a, "determinant")
+        _require_finite(a)
             
         # Compute determinant
-        result = det(a)
+        result = det(a, overwrite_a=_owned(a, matrix), check_finite=False)
         return float(result)
         
     except ValidationError:
         raise
     except Exception as e:
-        raise CalculationError(f"Failed to compute determinant: {str(e)}")
+        raise CalculationError(f"Failed to compute determinant: {str(e)}") from e
+
+
 
+def _validate_square_stack(stack):
+    """Convert a stack of square matrices to an array of shape (B, n, n)."""
+    a = np.asarray(stack)
+    if a.ndim != 3:
+        raise ValidationError("Input must be a 3D stack of matrices")
+    if a.shape[1] != a.shape[2]:
+        raise ValidationError("Matrices in the stack must be square")
+    return a
+
+
+def matrix_determinant_batched(stack):
+    """
+    Compute determinants of a stack of square matrices in one call.
+    
+    Args:
+        stack (list|np.ndarray): Matrices of shape (B, n, n)
+        
+    Returns:
+        np.ndarray: Determinants, shape (B,)
+        
+    Raises:
+        ValidationError: If the stack is invalid
+        CalculationError: If determinant computation fails
+    """
+    try:
+        a = _validate_square_stack(stack)
+        
+        # LAPACK runs per matrix inside one gufunc call
+        return np.linalg.det(a)
+        
+    except ValidationError:
+        raise
+    except Exception as e:
+        raise CalculationError(f"Failed to compute determinants: {str(e)}") from e
+
+
+def matrix_inverse_batched(stack):
+    """
+    Compute inverses of a stack of square matrices in one call.
+    
+    Args:
+        stack (list|np.ndarray): Matrices of shape (B, n, n)
+        
+    Returns:
+        np.ndarray: Inverses, shape (B, n, n)
+        
+    Raises:
+        ValidationError: If the stack is invalid
+        CalculationError: If any matrix is singular or inversion fails
+    """
+    try:
+        a = _validate_square_stack(stack)
+        
+        # LAPACK runs per matrix inside one gufunc call
+        return np.linalg.inv(a)
+        
+    except ValidationError:
+        raise
+    except Exception as e:
+        raise CalculationError(f"Failed to compute matrix inverses: {str(e)}") from e
 
 def eigenvalues_eigenvectors(matrix):
     """
@@ -191,7 +387,8 @@ def eigenvalues_eigenvectors(matrix):
         matrix (list|np.ndarray): Input square matrix
         
     Returns:
-        tuple: (eigenvalues, eigenvectors) as numpy arrays
+        tuple: (eigenvalues, eigenvectors) as numpy arrays; for exactly
+            Hermitian matrices the eigenvalues are real and in ascending order
         
     Raises:
         ValidationError: If matrix is invalid or not square
@@ -199,24 +396,56 @@ def eigenvalues_eigenvectors(matrix):
     """
     try:
         # Convert to numpy array
-        a = np.array(matrix)
+        a = np.asarray(matrix)
         
         # Validate dimensions
-        if len(a.shape) != 2:
-            raise ValidationError("Input must be a 2D matrix")
-            
-        if a.shape[0] != a.shape[1]:
-            raise ValidationError("Matrix must be square for eigenvalue computation")
+        _require_square(a, "eigenvalue computation")
+        _require_finite(a)
             
-        # Compute eigenvalues and eigenvectors
-        eigenvals, eigenvecs = eig(a)
+        # Compute eigenvalues and eigenvectors; exactly Hermitian matrices use
+        # the much faster divide-and-conquer symmetric solver, which reads only
+        # one triangle, so near-symmetry at any scale is not enough
+        if np.array_equal(a, a.conj().T):
+            eigenvals, eigenvecs = eigh(a, driver='evd', overwrite_a=_owned(a, matrix), check_finite=False)
+        else:
+            eigenvals, eigenvecs = eig(a, overwrite_a=_owned(a, matrix), check_finite=False)
         
         return eigenvals, eigenvecs
         
     except ValidationError:
         raise
     except Exception as e:
-        raise CalculationError(f"Failed to compute eigenvalues/eigenvectors: {str(e)}")
+        raise CalculationError(f"Failed to compute eigenvalues/eigenvectors: {str(e)}") from e
+
+
+def _lu_factor(a, overwrite_a=False):
+    """
+    LU-factorize a square matrix, rejecting numerically singular ones.
+    
+    Raises:
+        CalculationError: If the matrix is singular
+    """
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", LinAlgWarning)
+        lu_piv = lu_factor(a, overwrite_a=overwrite_a, check_finite=False)
+    if _singular_pivots(np.diag(lu_piv[0])):
+        raise CalculationError("Matrix is singular")
+    return lu_piv
+
+
+@lru_cache(maxsize=32)
+def _cached_lu_factor(shape, dtype, data):
+    """
+    LU-factorize the matrix with the given raw contents, memoized.
+    
+    Repeated solves with the same matrix then cost two triangular solves
+    each instead of a new factorization. Only matrices of at most
+    _LU_CACHE_MAX_BYTES are cached, bounding the cache's memory.
+    
+    Raises:
+        CalculationError: If the matrix is singular
+    """
+    return _lu_factor(np.frombuffer(data, dtype=dtype).reshape(shape))
 
 
 def solve_linear_system(matrix_a, vector_b):
@@ -236,35 +465,105 @@ def solve_linear_system(matrix_a, vector_b):
     """
     try:
         # Convert to numpy arrays
-        a = np.array(matrix_a)
-        b = np.array(vector_b)
+        a = np.asarray(matrix_a)
+        b = np.asarray(vector_b)
         
         # Validate dimensions
-        if len(a.shape) != 2:
+        if a.ndim != 2:
             raise ValidationError("Matrix A must be 2D")
             
-        if len(b.shape) != 1:
+        if b.ndim != 1:
             raise ValidationError("Vector b must be 1D")
             
         if a.shape[0] != b.shape[0]:
             raise ValidationError(f"Matrix and vector dimensions incompatible: {a.shape[0]} vs {b.shape[0]}")
+        _require_finite(a, b)
             
         # Solve linear system
-        if a.shape[0] == a.shape[1]:
+        if a.shape[0] == a.shape[1] and a.dtype.kind in 'iufc':
+            # Square numeric system; the LU factors of recent small matrices are reused
+            if a.nbytes <= _LU_CACHE_MAX_BYTES:
+                lu_piv = _cached_lu_factor(a.shape, a.dtype.str, a.tobytes())
+            else:
+                lu_piv = _lu_factor(a, overwrite_a=_owned(a, matrix_a))
+            x = lu_solve(lu_piv, b, overwrite_b=_owned(b, vector_b), check_finite=False)
+        elif a.shape[0] == a.shape[1]:
             # Square system
-            x = solve(a, b)
+            x = solve(a, b, overwrite_a=_owned(a, matrix_a), overwrite_b=_owned(b, vector_b),
+                      check_finite=False)
         else:
             # Overdetermined/underdetermined system - use least squares
-            x, residuals, rank, s = lstsq(a, b)
+            x, residuals, rank, s = lstsq(a, b, overwrite_a=_owned(a, matrix_a),
+                                          overwrite_b=_owned(b, vector_b), check_finite=False)
             
         return x
         
     except ValidationError:
         raise
     except Exception as e:
-        raise CalculationError(f"Failed to solve linear system: {str(e)}")
+        raise CalculationError(f"Failed to solve linear system: {str(e)}") from e
+
 
 
+def solve_linear_system_batched(matrix_a, matrix_b):
+    """
+    Solve linear systems AX = B for several right-hand sides at once.
+    
+    Args:
+        matrix_a (list|np.ndarray): Coefficient matrix A
+        matrix_b (list|np.ndarray): Right-hand sides as the columns of B
+        
+    Returns:
+        np.ndarray: Solutions as the columns of X
+        
+    Raises:
+        ValidationError: If inputs are invalid
+        CalculationError: If the systems cannot be solved
+    """
+    try:
+        # Convert to numpy arrays
+        a = np.asarray(matrix_a)
+        b = np.asarray(matrix_b)
+        
+        # Validate dimensions
+        if a.ndim != 2:
+            raise ValidationError("Matrix A must be 2D")
+            
+        if b.ndim != 2:
+            raise ValidationError("Matrix B must be 2D")
+            
+        if a.shape[0] != b.shape[0]:
+            raise ValidationError(f"Matrix dimensions incompatible: {a.shape[0]} vs {b.shape[0]}")
+        _require_finite(a, b)
+            
+        # Solve all systems in one LAPACK call
+        if a.shape[0] == a.shape[1]:
+            x = solve(a, b, overwrite_a=_owned(a, matrix_a), overwrite_b=_owned(b, matrix_b),
+                      check_finite=False)
+        else:
+            x, residuals, rank, s = lstsq(a, b, overwrite_a=_owned(a, matrix_a),
+                                          overwrite_b=_owned(b, matrix_b), check_finite=False)
+            
+        return x
+        
+    except ValidationError:
+        raise
+    except Exception as e:
+        raise CalculationError(f"Failed to solve linear systems: {str(e)}") from e
+
+
+def _qr_rank(r, shape):
+    """
+    Numerical rank from the R factor of a column-pivoted QR of a matrix.
+    
+    Uses the tolerance np.linalg.matrix_rank applies to singular values.
+    """
+    diagonal = np.abs(np.diag(r))
+    if diagonal.size == 0:
+        return 0
+    tolerance = max(shape) * np.finfo(r.dtype).eps * diagonal[0]
+    return int(np.sum(diagonal > tolerance))
+
 def matrix_rank(matrix):
     """
     Compute rank of a matrix.
@@ -281,20 +580,23 @@ def matrix_rank(matrix):
     """
     try:
         # Convert to numpy array
-        a = np.array(matrix)
+        a = np.asarray(matrix)
         
         # Validate dimensions
-        if len(a.shape) != 2:
-            raise ValidationError("Input must be a 2D matrix")
+        _require_matrix(a)
+        _require_finite(a)
+            
+        if a.size == 0:
+            return 0
             
-        # Compute rank
-        rank = np.linalg.matrix_rank(a)
-        return int(rank)
+        # Compute rank from a column-pivoted QR
+        r, _ = qr(a, overwrite_a=_owned(a, matrix), mode='r', pivoting=True, check_finite=False)
+        return _qr_rank(r, a.shape)
         
     except ValidationError:
         raise
     except Exception as e:
-        raise CalculationError(f"Failed to compute matrix rank: {str(e)}")
+        raise CalculationError(f"Failed to compute matrix rank: {str(e)}") from e
 
 
 def matrix_nullspace(matrix):
@@ -313,29 +615,24 @@ def matrix_nullspace(matrix):
     """
     try:
         # Convert to numpy array
-        a = np.array(matrix)
+        a = np.asarray(matrix)
         
         # Validate dimensions
-        if len(a.shape) != 2:
-            raise ValidationError("Input must be a 2D matrix")
+        _require_matrix(a)
+        _require_finite(a)
             
-        # Compute null space using SVD
-        u, s, vh = svd(a)
-        
-        # Find null space vectors (where singular values are effectively zero)
-        tolerance = 1e-10
-        null_mask = s <= tolerance
-        
-        # Extract null space from right singular vectors
-        # The null space consists of the right singular vectors corresponding to zero singular values
-        null_space = vh[len(s) - np.sum(null_mask):, :].T
+        # The first rank columns of Q from a column-pivoted QR of A^H span
+        # the row space of A; the remaining columns span its null space
+        q, r, _ = qr(a.conj().T, overwrite_a=_owned(a, matrix), mode='full', pivoting=True,
+                     check_finite=False)
+        null_space = q[:, _qr_rank(r, a.shape):]
         
         return null_space
         
     except ValidationError:
         raise
     except Exception as e:
-        raise CalculationError(f"Failed to compute null space: {str(e)}")
+        raise CalculationError(f"Failed to compute null space: {str(e)}") from e
 
 
 def lu_decomposition(matrix):
@@ -354,29 +651,32 @@ def lu_decomposition(matrix):
     """
     try:
         # Convert to numpy array
-        a = np.array(matrix)
+        a = np.asarray(matrix)
         
         # Validate dimensions
-        if len(a.shape) != 2:
-            raise ValidationError("Input must be a 2D matrix")
+        _require_matrix(a)
+        _require_finite(a)
             
         # Compute LU decomposition
-        p, l, u = lu(a)
+        p, l, u = lu(a, overwrite_a=_owned(a, matrix), check_finite=False)
         
         return p, l, u
         
     except ValidationError:
         raise
     except Exception as e:
-        raise CalculationError(f"Failed to compute LU decomposition: {str(e)}")
+        raise CalculationError(f"Failed to compute LU decomposition: {str(e)}") from e
 
 
-def qr_decomposition(matrix):
+def qr_decomposition(matrix, dtype=None):
     """
     Compute QR decomposition of a matrix.
     
     Args:
         matrix (list|np.ndarray): Input matrix
+        dtype (np.dtype|str): Element type to compute in, such as np.float32
+            to halve memory traffic on large inputs; None keeps the input's
+            type
         
     Returns:
         tuple: (Q, R) where A = QR
@@ -386,30 +686,35 @@ def qr_decomposition(matrix):
         CalculationError: If QR decomposition fails
     """
     try:
-        # Convert to numpy array
-        a = np.array(matrix)
+        # Convert to a Fortran-ordered array, as LAPACK expects
+        a = np.asarray(matrix, dtype=dtype, order='F')
         
         # Validate dimensions
-        if len(a.shape) != 2:
-            raise ValidationError("Input must be a 2D matrix")
+        _require_matrix(a)
+        _require_finite(a)
             
         # Compute QR decomposition
-        q, r = qr(a)
+        q, r = qr(a, overwrite_a=_owned(a, matrix), check_finite=False)
         
         return q, r
         
     except ValidationError:
         raise
     except Exception as e:
-        raise CalculationError(f"Failed to compute QR decomposition: {str(e)}")
+        raise CalculationError(f"Failed to compute QR decomposition: {str(e)}") from e
 
 
-def svd_decomposition(matrix):
+def svd_decomposition(matrix, full_matrices=False, dtype=None):
     """
     Compute Singular Value Decomposition (SVD) of a matrix.
     
     Args:
         matrix (list|np.ndarray): Input matrix
+        full_matrices (bool): Return square U and Vt instead of the reduced
+            (m, k) and (k, n) factors, k = min(m, n)
+        dtype (np.dtype|str): Element type to compute in, such as np.float32
+            to halve memory traffic on large inputs; None keeps the input's
+            type
         
     Returns:
         tuple: (U, S, Vt) where A = U * S * Vt
@@ -419,22 +724,23 @@ def svd_decomposition(matrix):
         CalculationError: If SVD computation fails
     """
     try:
-        # Convert to numpy array
-        a = np.array(matrix)
+        # Convert to a Fortran-ordered array, as LAPACK expects
+        a = np.asarray(matrix, dtype=dtype, order='F')
         
         # Validate dimensions
-        if len(a.shape) != 2:
-            raise ValidationError("Input must be a 2D matrix")
+        _require_matrix(a)
+        _require_finite(a)
             
         # Compute SVD
-        u, s, vt = svd(a)
+        u, s, vt = svd(a, full_matrices=full_matrices, overwrite_a=_owned(a, matrix),
+                       check_finite=False, lapack_driver='gesdd')
         
         return u, s, vt
         
     except ValidationError:
         raise
     except Exception as e:
-        raise CalculationError(f"Failed to compute SVD: {str(e)}")
+        raise CalculationError(f"Failed to compute SVD: {str(e)}") from e
 
 
 def vector_norm(vector, ord=2):
@@ -454,20 +760,28 @@ def vector_norm(vector, ord=2):
     """
     try:
         # Convert to numpy array
-        v = np.array(vector)
+        v = np.asarray(vector)
         
         # Validate dimensions
-        if len(v.shape) != 1:
+        if v.ndim != 1:
             raise ValidationError("Input must be a 1D vector")
             
-        # Compute norm
+        # Compute norm; the common orders of non-empty float64 vectors call
+        # BLAS directly (f2py rejects empty ones)
+        if v.dtype == np.float64 and v.size:
+            if ord == 2 and v.size <= _NRM2_MAX_SIZE:
+                return float(dnrm2(v))
+            if ord == 1:
+                return float(dasum(v))
+            if ord == np.inf:
+                return float(abs(v[idamax(v)]))
         norm = np.linalg.norm(v, ord=ord)
         return float(norm)
         
     except ValidationError:
         raise
     except Exception as e:
-        raise CalculationError(f"Failed to compute vector norm: {str(e)}")
+        raise CalculationError(f"Failed to compute vector norm: {str(e)}") from e
 
 
 def matrix_condition_number(matrix):
@@ -486,11 +800,10 @@ def matrix_condition_number(matrix):
     """
     try:
         # Convert to numpy array
-        a = np.array(matrix)
+        a = np.asarray(matrix)
         
         # Validate dimensions
-        if len(a.shape) != 2:
-            raise ValidationError("Input must be a 2D matrix")
+        _require_matrix(a)
             
         # Compute condition number
         cond = np.linalg.cond(a)
@@ -499,7 +812,7 @@ def matrix_condition_number(matrix):
     except ValidationError:
         raise
     except Exception as e:
-        raise CalculationError(f"Failed to compute condition number: {str(e)}")
+        raise CalculationError(f"Failed to compute condition number: {str(e)}") from e
 
 
 def matrix_trace(matrix):
@@ -518,23 +831,19 @@ def matrix_trace(matrix):
     """
     try:
         # Convert to numpy array
-        a = np.array(matrix)
+        a = np.asarray(matrix)
         
         # Validate dimensions
-        if len(a.shape) != 2:
-            raise ValidationError("Input must be a 2D matrix")
+        _require_square(a, "trace computation")
             
-        if a.shape[0] != a.shape[1]:
-            raise ValidationError("Matrix must be square for trace computation")
-            
-        # Compute trace
-        trace = np.trace(a)
+        # Compute trace from a strided view of the n diagonal elements
+        trace = a.diagonal().sum()
         return float(trace)
         
     except ValidationError:
         raise
     except Exception as e:
-        raise CalculationError(f"Failed to compute trace: {str(e)}")
+        raise CalculationError(f"Failed to compute trace: {str(e)}") from e
 
 
 def vector_projection(vector_a, vector_b):
@@ -554,25 +863,34 @@ def vector_projection(vector_a, vector_b):
     """
     try:
         # Convert to numpy arrays
-        a = np.array(vector_a)
-        b = np.array(vector_b)
+        a = np.asarray(vector_a)
+        b = np.asarray(vector_b)
         
         # Validate dimensions
-        if len(a.shape) != 1 or len(b.shape) != 1:
+        if a.ndim != 1 or b.ndim != 1:
             raise ValidationError("Both inputs must be 1D vectors")
             
         if a.shape[0] != b.shape[0]:
             raise ValidationError(f"Vector dimensions must match: {a.shape[0]} vs {b.shape[0]}")
             
+        # Compute b.b, with the projection when small float vectors can skip
+        # NumPy's dispatch
+        if (_HAS_NUMBA and a.dtype == b.dtype and a.dtype in _KERNEL_DTYPES
+                and a.size < _KERNEL_MAX_SIZE):
+            projection, bb = _projection_kernel()(a, b)
+        else:
+            projection, bb = None, np.dot(b, b)
+            
         # Check if b is zero vector
-        if np.allclose(b, 0):
+        if abs(bb) <= _TINY * b.size:
             raise CalculationError("Cannot project onto zero vector")
             
         # Compute projection
-        projection = (np.dot(a, b) / np.dot(b, b)) * b
+        if projection is None:
+            projection = (np.dot(a, b) / bb) * b
         return projection
         
     except ValidationError:
         raise
     except Exception as e:
-        raise CalculationError(f"Failed to compute vector projection: {str(e)}")
+        raise CalculationError(f"Failed to compute vector projection: {str(e)}") from e
@@ -1,23 +1,178 @@
 """Statistics and probability operations module for advanced mathematical computations."""
+import importlib
+import importlib.util
+import math
+from functools import lru_cache
+
 import numpy as np
-from scipy import stats
-from scipy.stats import norm, binom, poisson, chi2, t, f
-from sklearn.linear_model import LinearRegression
-from sklearn.preprocessing import PolynomialFeatures
-from sklearn.pipeline import Pipeline
+from scipy.special import chdtrc, ndtr, stdtr, stdtrit
 from mathgenius.core.validation import validate_numbers
 from mathgenius.core.errors import ValidationError, CalculationError
 
+# scipy.stats takes most of a second to import, so it is only imported by
+# the few functions that still need it; t-distribution values come from the
+# scipy.special routines it wraps.
+
+# The distribution functions below are evaluated in closed form with the
+# math module: for a single value, scipy.stats' argument handling costs
+# about 100 times more than the arithmetic itself.
+_SQRT_2 = math.sqrt(2.0)
+_SQRT_2PI = math.sqrt(2.0 * math.pi)
+
+
+def _asarray(data):
+    """
+    View data as an ndarray without copying, promoting integer and real data to float64.
+    
+    Existing float64 arrays are returned as-is; complex and other dtypes are left
+    for the caller's numpy routine to handle as before.
+    """
+    arr = np.asarray(data)
+    if arr.dtype != np.float64 and arr.dtype.kind in 'biuf':
+        arr = arr.astype(np.float64)
+    return arr
+
+
+def _axis_length(arr, axis):
+    """Number of values each reduction along axis sees, validating the axis."""
+    if not isinstance(axis, (int, np.integer)) or not -arr.ndim <= axis < arr.ndim:
+        raise ValidationError(f"Invalid axis {axis} for data with {arr.ndim} dimension(s)")
+    return arr.shape[axis]
+
+
+# numba is an optional accelerator, imported on first use.
+_HAS_NUMBA = importlib.util.find_spec('numba') is not None
+
+
+@lru_cache(maxsize=1)
+def _mean_variance_kernel():
+    """
+    The numba mean/variance kernel, built on first use.
+    
+    It makes the textbook two passes (mean, then squared deviations) like
+    np.var, but without materializing the deviations array.
+    """
+    numba = importlib.import_module('numba')
+    signature = numba.types.UniTuple(numba.float64, 2)(numba.float64[::1], numba.float64)
+    
+    @numba.njit(signature, cache=True, fastmath=True)
+    def mean_variance_kernel(arr, ddof):
+        """Mean and variance of arr with ddof delta degrees of freedom."""
+        n = arr.size
+        total = 0.0
+        for i in range(n):
+            total += arr[i]
+        mean = total / n
+        squares = 0.0
+        for i in range(n):
+            deviation = arr[i] - mean
+            squares += deviation * deviation
+        return mean, squares / (n - ddof)
+    
+    return mean_variance_kernel
+
+
+def _mean_variance(arr, ddof):
+    """Mean and variance of an array, through the numba kernel for real data when available."""
+    if _HAS_NUMBA and arr.dtype.kind in 'biuf':
+        return _mean_variance_kernel()(np.ascontiguousarray(arr, dtype=np.float64).ravel(), float(ddof))
+    return np.mean(arr), np.var(arr, ddof=ddof)
+
+
+def _variance(arr, ddof):
+    """Variance of an array."""
+    return _mean_variance(arr, ddof)[1]
+
+
+# Below this many elements the threading overhead of a parallel reduction
+# outweighs the gain.
+_PARALLEL_MIN_SIZE = 100_000
+
+
+@lru_cache(maxsize=2)
+def _centered_moments_kernel(parallel):
+    """
+    The numba paired-moments kernel, built on first use for serial or parallel execution.
+    
+    Like _mean_variance_kernel it makes two passes, means first and then the
+    centered sums, reading each (x, y) pair once per pass without temporaries.
+    """
+    numba = importlib.import_module('numba')
+    signature = numba.types.UniTuple(numba.float64, 5)(numba.float64[::1], numba.float64[::1])
+    
+    @numba.njit(signature, parallel=parallel, cache=True, fastmath=True)
+    def centered_moments_kernel(x, y):
+        """Means of x and y and their centered sums of squares and cross products."""
+        n = x.size
+        sum_x = 0.0
+        sum_y = 0.0
+        for i in numba.prange(n):
+            sum_x += x[i]
+            sum_y += y[i]
+        x_mean = sum_x / n
+        y_mean = sum_y / n
+        sxx = 0.0
+        syy = 0.0
+        sxy = 0.0
+        for i in numba.prange(n):
+            dx = x[i] - x_mean
+            dy = y[i] - y_mean
+            sxx += dx * dx
+            syy += dy * dy
+            sxy += dx * dy
+        return x_mean, y_mean, sxx, syy, sxy
+    
+    return centered_moments_kernel
+
+
+def _centered_moments(x, y):
+    """
+    Means and centered sums (x_mean, y_mean, sxx, syy, sxy) of two equal-length 1-D arrays.
+    
+    Large float64 inputs are reduced in parallel when numba has more than one thread.
+    """
+    if _HAS_NUMBA and x.dtype == np.float64 and y.dtype == np.float64:
+        parallel = x.size >= _PARALLEL_MIN_SIZE and importlib.import_module('numba').get_num_threads() > 1
+        return _centered_moments_kernel(parallel)(np.ascontiguousarray(x), np.ascontiguousarray(y))
+    x_mean = x.mean()
+    y_mean = y.mean()
+    dx = x - x_mean
+    dy = y - y_mean
+    return x_mean, y_mean, np.dot(dx, dx), np.dot(dy, dy), np.dot(dx, dy)
+
+
+@lru_cache(maxsize=4096)
+def _t_critical(df, confidence_level):
+    """Two-sided critical value of Student's t with df degrees of freedom."""
+    return float(stdtrit(df, 1 - (1 - confidence_level) / 2))
+
+
+def _t_test_p_value(t_statistic, df):
+    """Two-sided p-value of a t statistic with df degrees of freedom."""
+    return 2 * stdtr(df, -abs(t_statistic))
+
 
-def mean(data):
+def _standardize(values, mean, std):
+    """Real values as a new float64 array of (values - mean) / std."""
+    arr = np.asarray(values)
+    if arr.dtype.kind not in 'biuf':
+        raise ValidationError("Values must be real numbers")
+    z = np.subtract(arr, mean, dtype=np.float64)
+    z /= std
+    return z
+
+
+def mean(data, axis=None):
     """
     Calculate arithmetic mean of a dataset.
     
     Args:
         data (list|np.ndarray): Dataset
+        axis (int, optional): Axis to reduce along for a stack of datasets;
+            None reduces over all values
         
     Returns:
-        float: Mean value
+        float|np.ndarray: Mean value, or an array of means when axis is given
         
     Raises:
         ValidationError: If data is invalid
@@ -25,31 +180,36 @@ def mean(data):
     """
     try:
         # Convert to numpy array
-        arr = np.array(data)
+        arr = _asarray(data)
         
         # Validate data
         if arr.size == 0:
             raise ValidationError("Dataset cannot be empty")
             
         # Calculate mean
+        if axis is not None:
+            _axis_length(arr, axis)
+            return np.mean(arr, axis=axis)
         result = np.mean(arr)
         return float(result)
         
     except ValidationError:
         raise
     except Exception as e:
-        raise CalculationError(f"Failed to calculate mean: {str(e)}")
+        raise CalculationError(f"Failed to calculate mean: {str(e)}") from e
 
 
-def median(data):
+def median(data, axis=None):
     """
     Calculate median of a dataset.
     
     Args:
         data (list|np.ndarray): Dataset
+        axis (int, optional): Axis to reduce along for a stack of datasets;
+            None reduces over all values
         
     Returns:
-        float: Median value
+        float|np.ndarray: Median value, or an array of medians when axis is given
         
     Raises:
         ValidationError: If data is invalid
@@ -57,20 +217,23 @@ def median(data):
     """
     try:
         # Convert to numpy array
-        arr = np.array(data)
+        arr = _asarray(data)
         
         # Validate data
         if arr.size == 0:
             raise ValidationError("Dataset cannot be empty")
             
         # Calculate median
+        if axis is not None:
+            _axis_length(arr, axis)
+            return np.median(arr, axis=axis)
         result = np.median(arr)
         return float(result)
         
     except ValidationError:
         raise
     except Exception as e:
-        raise CalculationError(f"Failed to calculate median: {str(e)}")
+        raise CalculationError(f"Failed to calculate median: {str(e)}") from e
 
 
 def mode(data):
@@ -89,32 +252,47 @@ def mode(data):
     """
     try:
         # Convert to numpy array
-        arr = np.array(data)
+        arr = np.asarray(data)
         
         # Validate data
         if arr.size == 0:
             raise ValidationError("Dataset cannot be empty")
             
+        # Integer data over a narrow range is counted in one pass; the smallest
+        # of tied values wins, as with stats.mode
+        if arr.ndim == 1 and np.issubdtype(arr.dtype, np.integer):
+            # The offset is taken in intp, so narrow types cannot wrap around;
+            # non-negative int64 data is counted directly, without a copy
+            lo = min(int(arr.min()), 0)
+            hi = int(arr.max())
+            if hi - lo < max(1024, arr.size):
+                counts = np.bincount(np.subtract(arr, lo, dtype=np.intp) if lo
+                                     else arr.astype(np.intp, copy=False))
+                return float(counts.argmax() + lo)
+            
         # Calculate mode
+        from scipy import stats
         mode_result = stats.mode(arr, keepdims=True)
         return float(mode_result.mode[0])
         
     except ValidationError:
         raise
     except Exception as e:
-        raise CalculationError(f"Failed to calculate mode: {str(e)}")
+        raise CalculationError(f"Failed to calculate mode: {str(e)}") from e
 
 
-def variance(data, ddof=1):
+def variance(data, ddof=1, axis=None):
     """
     Calculate variance of a dataset.
     
     Args:
         data (list|np.ndarray): Dataset
         ddof (int): Delta degrees of freedom (0 for population, 1 for sample)
+        axis (int, optional): Axis to reduce along for a stack of datasets;
+            None reduces over all values
         
     Returns:
-        float: Variance value
+        float|np.ndarray: Variance value, or an array of values when axis is given
         
     Raises:
         ValidationError: If data is invalid
@@ -122,34 +300,39 @@ def variance(data, ddof=1):
     """
     try:
         # Convert to numpy array
-        arr = np.array(data)
+        arr = _asarray(data)
         
         # Validate data
         if arr.size == 0:
             raise ValidationError("Dataset cannot be empty")
-        if arr.size <= ddof:
-            raise ValidationError(f"Dataset size ({arr.size}) must be greater than ddof ({ddof})")
+        size = arr.size if axis is None else _axis_length(arr, axis)
+        if size <= ddof:
+            raise ValidationError(f"Dataset size ({size}) must be greater than ddof ({ddof})")
             
         # Calculate variance
-        result = np.var(arr, ddof=ddof)
+        if axis is not None:
+            return np.var(arr, axis=axis, ddof=ddof)
+        result = _variance(arr, ddof)
         return float(result)
         
     except ValidationError:
         raise
     except Exception as e:
-        raise CalculationError(f"Failed to calculate variance: {str(e)}")
+        raise CalculationError(f"Failed to calculate variance: {str(e)}") from e
 
 
-def standard_deviation(data, ddof=1):
+def standard_deviation(data, ddof=1, axis=None):
     """
     Calculate standard deviation of a dataset.
     
     Args:
         data (list|np.ndarray): Dataset
         ddof (int): Delta degrees of freedom (0 for population, 1 for sample)
+        axis (int, optional): Axis to reduce along for a stack of datasets;
+            None reduces over all values
         
     Returns:
-        float: Standard deviation value
+        float|np.ndarray: Standard deviation value, or an array of values when axis is given
         
     Raises:
         ValidationError: If data is invalid
@@ -157,22 +340,25 @@ def standard_deviation(data, ddof=1):
     """
     try:
         # Convert to numpy array
-        arr = np.array(data)
+        arr = _asarray(data)
         
         # Validate data
         if arr.size == 0:
             raise ValidationError("Dataset cannot be empty")
-        if arr.size <= ddof:
-            raise ValidationError(f"Dataset size ({arr.size}) must be greater than ddof ({ddof})")
+        size = arr.size if axis is None else _axis_length(arr, axis)
+        if size <= ddof:
+            raise ValidationError(f"Dataset size ({size}) must be greater than ddof ({ddof})")
             
         # Calculate standard deviation
-        result = np.std(arr, ddof=ddof)
+        if axis is not None:
+            return np.std(arr, axis=axis, ddof=ddof)
+        result = math.sqrt(_variance(arr, ddof))
         return float(result)
         
     except ValidationError:
         raise
     except Exception as e:
-        raise CalculationError(f"Failed to calculate standard deviation: {str(e)}")
+        raise CalculationError(f"Failed to calculate standard deviation: {str(e)}") from e
 
 
 def correlation_coefficient(data_x, data_y):
@@ -192,8 +378,8 @@ def correlation_coefficient(data_x, data_y):
     """
     try:
         # Convert to numpy arrays
-        x = np.array(data_x)
-        y = np.array(data_y)
+        x = np.asarray(data_x, dtype=np.float64).ravel()
+        y = np.asarray(data_y, dtype=np.float64).ravel()
         
         # Validate data
         if x.size == 0 or y.size == 0:
@@ -203,16 +389,63 @@ def correlation_coefficient(data_x, data_y):
         if x.size < 2:
             raise ValidationError("Datasets must have at least 2 data points")
             
-        # Calculate correlation coefficient
-        correlation_matrix = np.corrcoef(x, y)
-        correlation = correlation_matrix[0, 1]
+        # Calculate correlation coefficient from the centered sums,
+        # clipped to [-1, 1] against rounding as np.corrcoef does
+        _, _, sxx, syy, sxy = _centered_moments(x, y)
+        correlation = sxy / np.sqrt(sxx * syy)
         
-        return float(correlation)
+        return float(np.clip(correlation, -1.0, 1.0))
         
     except ValidationError:
         raise
     except Exception as e:
-        raise CalculationError(f"Failed to calculate correlation coefficient: {str(e)}")
+        raise CalculationError(f"Failed to calculate correlation coefficient: {str(e)}") from e
+
+
+def correlation_matrix(data):
+    """
+    Calculate the Pearson correlation matrix of several variables.
+    
+    Args:
+        data (list|np.ndarray): 2-D dataset with one observation per row and one variable per column
+        
+    Returns:
+        np.ndarray: Matrix of pairwise correlation coefficients between the columns
+        
+    Raises:
+        ValidationError: If data is invalid
+        CalculationError: If calculation fails
+    """
+    try:
+        # Convert to numpy array
+        arr = _asarray(data)
+        
+        # Validate data
+        if arr.ndim != 2:
+            raise ValidationError("Data must be a 2-D array of observations by variables")
+        if arr.dtype != np.float64:
+            raise ValidationError("Data must contain real numbers")
+        if arr.shape[1] == 0:
+            raise ValidationError("Dataset must have at least one variable")
+        if arr.shape[0] < 2:
+            raise ValidationError("Dataset must have at least 2 observations")
+            
+        # All pairwise centered cross products in one Gram matrix product,
+        # normalized in place and clipped to [-1, 1] as np.corrcoef does
+        centered = arr - arr.mean(axis=0)
+        corr = centered.T @ centered
+        scale = np.sqrt(corr.diagonal())
+        with np.errstate(divide='ignore', invalid='ignore'):
+            corr /= scale
+            corr /= scale[:, None]
+        np.clip(corr, -1.0, 1.0, out=corr)
+        
+        return corr
+        
+    except ValidationError:
+        raise
+    except Exception as e:
+        raise CalculationError(f"Failed to calculate correlation matrix: {str(e)}") from e
 
 
 def covariance(data_x, data_y, ddof=1):
@@ -233,8 +466,8 @@ def covariance(data_x, data_y, ddof=1):
     """
     try:
         # Convert to numpy arrays
-        x = np.array(data_x)
-        y = np.array(data_y)
+        x = np.asarray(data_x, dtype=np.float64).ravel()
+        y = np.asarray(data_y, dtype=np.float64).ravel()
         
         # Validate data
         if x.size == 0 or y.size == 0:
@@ -244,16 +477,15 @@ def covariance(data_x, data_y, ddof=1):
         if x.size <= ddof:
             raise ValidationError(f"Dataset size ({x.size}) must be greater than ddof ({ddof})")
             
-        # Calculate covariance
-        covariance_matrix = np.cov(x, y, ddof=ddof)
-        cov = covariance_matrix[0, 1]
+        # Calculate covariance from the centered cross product
+        cov = _centered_moments(x, y)[4] / (x.size - ddof)
         
         return float(cov)
         
     except ValidationError:
         raise
     except Exception as e:
-        raise CalculationError(f"Failed to calculate covariance: {str(e)}")
+        raise CalculationError(f"Failed to calculate covariance: {str(e)}") from e
 
 
 def normal_distribution_pdf(x, mean=0, std=1):
@@ -261,12 +493,12 @@ def normal_distribution_pdf(x, mean=0, std=1):
     Calculate probability density function of normal distribution.
     
     Args:
-        x (float): Value to evaluate
+        x (float|list|np.ndarray): Value or array of values to evaluate
         mean (float): Mean of the distribution
         std (float): Standard deviation of the distribution
         
     Returns:
-        float: PDF value
+        float|np.ndarray: PDF value, or an array of values for array input
         
     Raises:
         ValidationError: If parameters are invalid
@@ -274,18 +506,30 @@ def normal_distribution_pdf(x, mean=0, std=1):
     """
     try:
         # Validate inputs
-        validate_numbers(x, mean, std)
+        validate_numbers(mean, std)
         if std <= 0:
             raise ValidationError("Standard deviation must be positive")
             
+        # Arrays are evaluated with vectorized ufuncs in a single buffer
+        if isinstance(x, (list, tuple, np.ndarray)):
+            z = _standardize(x, mean, std)
+            np.square(z, out=z)
+            z *= -0.5
+            np.exp(z, out=z)
+            z /= std * _SQRT_2PI
+            return z
+        
+        validate_numbers(x)
+        
         # Calculate PDF
-        result = norm.pdf(x, loc=mean, scale=std)
+        z = (x - mean) / std
+        result = math.exp(-0.5 * z * z) / (std * _SQRT_2PI)
         return float(result)
         
     except ValidationError:
         raise
     except Exception as e:
-        raise CalculationError(f"Failed to calculate normal PDF: {str(e)}")
+        raise CalculationError(f"Failed to calculate normal PDF: {str(e)}") from e
 
 
 def normal_distribution_cdf(x, mean=0, std=1):
@@ -293,12 +537,12 @@ def normal_distribution_cdf(x, mean=0, std=1):
     Calculate cumulative distribution function of normal distribution.
     
     Args:
-        x (float): Value to evaluate
+        x (float|list|np.ndarray): Value or array of values to evaluate
         mean (float): Mean of the distribution
         std (float): Standard deviation of the distribution
         
     Returns:
-        float: CDF value
+        float|np.ndarray: CDF value, or an array of values for array input
         
     Raises:
         ValidationError: If parameters are invalid
@@ -306,18 +550,25 @@ def normal_distribution_cdf(x, mean=0, std=1):
     """
     try:
         # Validate inputs
-        validate_numbers(x, mean, std)
+        validate_numbers(mean, std)
         if std <= 0:
             raise ValidationError("Standard deviation must be positive")
             
+        # Arrays are evaluated with the vectorized normal CDF ufunc
+        if isinstance(x, (list, tuple, np.ndarray)):
+            z = _standardize(x, mean, std)
+            return ndtr(z, out=z)
+        
+        validate_numbers(x)
+        
         # Calculate CDF
-        result = norm.cdf(x, loc=mean, scale=std)
+        result = 0.5 * math.erfc((mean - x) / (std * _SQRT_2))
         return float(result)
         
     except ValidationError:
         raise
     except Exception as e:
-        raise CalculationError(f"Failed to calculate normal CDF: {str(e)}")
+        raise CalculationError(f"Failed to calculate normal CDF: {str(e)}") from e
 
 
 def binomial_distribution_pmf(k, n, p):
@@ -346,14 +597,20 @@ def binomial_distribution_pmf(k, n, p):
         if p < 0 or p > 1:
             raise ValidationError("Probability p must be between 0 and 1")
             
-        # Calculate PMF
-        result = binom.pmf(k, n, p)
+        # Calculate PMF, in log space to avoid overflow of the binomial
+        # coefficient and underflow of the powers
+        if p == 0 or p == 1:
+            result = 1.0 if k == (0 if p == 0 else n) else 0.0
+        else:
+            log_pmf = (math.lgamma(n + 1) - math.lgamma(k + 1) - math.lgamma(n - k + 1)
+                       + k * math.log(p) + (n - k) * math.log1p(-p))
+            result = math.exp(log_pmf)
         return float(result)
         
     except ValidationError:
         raise
     except Exception as e:
-        raise CalculationError(f"Failed to calculate binomial PMF: {str(e)}")
+        raise CalculationError(f"Failed to calculate binomial PMF: {str(e)}") from e
 
 
 def poisson_distribution_pmf(k, mu):
@@ -379,14 +636,14 @@ def poisson_distribution_pmf(k, mu):
         if mu <= 0:
             raise ValidationError("Rate parameter mu must be positive")
             
-        # Calculate PMF
-        result = poisson.pmf(k, mu)
+        # Calculate PMF in log space
+        result = math.exp(k * math.log(mu) - mu - math.lgamma(k + 1))
         return float(result)
         
     except ValidationError:
         raise
     except Exception as e:
-        raise CalculationError(f"Failed to calculate Poisson PMF: {str(e)}")
+        raise CalculationError(f"Failed to calculate Poisson PMF: {str(e)}") from e
 
 
 def t_test_one_sample(data, population_mean, alpha=0.05):
@@ -407,7 +664,7 @@ def t_test_one_sample(data, population_mean, alpha=0.05):
     """
     try:
         # Convert to numpy array
-        arr = np.array(data)
+        arr = _asarray(data)
         
         # Validate data
         if arr.size == 0:
@@ -418,8 +675,13 @@ def t_test_one_sample(data, population_mean, alpha=0.05):
         if alpha <= 0 or alpha >= 1:
             raise ValidationError("Alpha must be between 0 and 1")
             
-        # Perform t-test
-        t_statistic, p_value = stats.ttest_1samp(arr, population_mean)
+        # Perform t-test from a single mean/variance reduction; constant data
+        # gives an infinite or undefined statistic, as with stats.ttest_1samp
+        n = arr.size
+        sample_mean, sample_var = _mean_variance(arr, 1)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            t_statistic = np.float64(sample_mean - population_mean) / np.sqrt(sample_var / n)
+        p_value = _t_test_p_value(t_statistic, n - 1)
         
         # Determine conclusion
         reject_null = p_value < alpha
@@ -435,7 +697,7 @@ def t_test_one_sample(data, population_mean, alpha=0.05):
     except ValidationError:
         raise
     except Exception as e:
-        raise CalculationError(f"Failed to perform one-sample t-test: {str(e)}")
+        raise CalculationError(f"Failed to perform one-sample t-test: {str(e)}") from e
 
 
 def t_test_two_sample(data1, data2, alpha=0.05, equal_var=True):
@@ -457,8 +719,8 @@ def t_test_two_sample(data1, data2, alpha=0.05, equal_var=True):
     """
     try:
         # Convert to numpy arrays
-        arr1 = np.array(data1)
-        arr2 = np.array(data2)
+        arr1 = _asarray(data1)
+        arr2 = _asarray(data2)
         
         # Validate data
         if arr1.size == 0 or arr2.size == 0:
@@ -469,8 +731,28 @@ def t_test_two_sample(data1, data2, alpha=0.05, equal_var=True):
         if alpha <= 0 or alpha >= 1:
             raise ValidationError("Alpha must be between 0 and 1")
             
-        # Perform t-test
-        t_statistic, p_value = stats.ttest_ind(arr1, arr2, equal_var=equal_var)
+        # Perform t-test from the two samples' means and variances
+        n1 = arr1.size
+        n2 = arr2.size
+        mean1, var1 = _mean_variance(arr1, 1)
+        mean2, var2 = _mean_variance(arr2, 1)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            if equal_var:
+                # Student's t with the pooled variance
+                df = n1 + n2 - 2
+                pooled_var = ((n1 - 1) * var1 + (n2 - 1) * var2) / df
+                se = np.sqrt(pooled_var * (1 / n1 + 1 / n2))
+            else:
+                # Welch's t with the Welch-Satterthwaite degrees of freedom
+                v1 = var1 / n1
+                v2 = var2 / n2
+                df = np.float64(v1 + v2) ** 2 / (v1 ** 2 / (n1 - 1) + v2 ** 2 / (n2 - 1))
+                if np.isnan(df):
+                    # Both samples constant; scipy falls back to one degree of freedom
+                    df = 1.0
+                se = np.sqrt(v1 + v2)
+            t_statistic = np.float64(mean1 - mean2) / se
+        p_value = _t_test_p_value(t_statistic, df)
         
         # Determine conclusion
         reject_null = p_value < alpha
@@ -487,7 +769,7 @@ def t_test_two_sample(data1, data2, alpha=0.05, equal_var=True):
     except ValidationError:
         raise
     except Exception as e:
-        raise CalculationError(f"Failed to perform two-sample t-test: {str(e)}")
+        raise CalculationError(f"Failed to perform two-sample t-test: {str(e)}") from e
 
 
 def chi_square_test(observed, expected=None, alpha=0.05):
@@ -508,7 +790,7 @@ def chi_square_test(observed, expected=None, alpha=0.05):
     """
     try:
         # Convert to numpy arrays
-        obs = np.array(observed)
+        obs = _asarray(observed)
         
         # Validate data
         if obs.size == 0:
@@ -521,17 +803,23 @@ def chi_square_test(observed, expected=None, alpha=0.05):
             
         # Handle expected frequencies
         if expected is None:
-            # Uniform distribution
-            exp = np.full(obs.size, np.sum(obs) / obs.size)
+            # Against a uniform expectation the statistic is sum((obs - m)^2) / m
+            # with m the mean count, i.e. n * var(obs) / m: one streamed
+            # reduction, without building the expected array
+            obs_mean, obs_var = _mean_variance(obs, 0)
+            with np.errstate(divide='ignore', invalid='ignore'):
+                chi2_statistic = obs.size * np.float64(obs_var) / obs_mean
+            p_value = chdtrc(obs.size - 1, chi2_statistic)
         else:
-            exp = np.array(expected)
+            exp = _asarray(expected)
             if exp.size != obs.size:
                 raise ValidationError("Observed and expected frequencies must have same length")
             if np.any(exp <= 0):
                 raise ValidationError("Expected frequencies must be positive")
                 
-        # Perform chi-square test
-        chi2_statistic, p_value = stats.chisquare(obs, exp)
+            # Perform chi-square test
+            from scipy import stats
+            chi2_statistic, p_value = stats.chisquare(obs, exp)
         
         # Determine conclusion
         reject_null = p_value < alpha
@@ -548,19 +836,21 @@ def chi_square_test(observed, expected=None, alpha=0.05):
     except ValidationError:
         raise
     except Exception as e:
-        raise CalculationError(f"Failed to perform chi-square test: {str(e)}")
+        raise CalculationError(f"Failed to perform chi-square test: {str(e)}") from e
 
 
-def linear_regression(x_data, y_data):
+def linear_regression(x_data, y_data, return_residuals=True):
     """
     Perform linear regression analysis.
     
     Args:
         x_data (list|np.ndarray): Independent variable data
         y_data (list|np.ndarray): Dependent variable data
+        return_residuals (bool): Whether to include the residuals in the results
         
     Returns:
         dict: Regression results including slope, intercept, R-squared, and predictions
+            and residuals as arrays
         
     Raises:
         ValidationError: If data is invalid
@@ -568,8 +858,8 @@ def linear_regression(x_data, y_data):
     """
     try:
         # Convert to numpy arrays
-        x = np.array(x_data)
-        y = np.array(y_data)
+        x = _asarray(x_data)
+        y = _asarray(y_data)
         
         # Validate data
         if x.size == 0 or y.size == 0:
@@ -579,34 +869,44 @@ def linear_regression(x_data, y_data):
         if x.size < 2:
             raise ValidationError("Datasets must have at least 2 data points")
             
-        # Reshape for sklearn
-        X = x.reshape(-1, 1)
-        
-        # Perform linear regression
-        model = LinearRegression()
-        model.fit(X, y)
+        # Least squares in closed form from the centered sums
+        x = x.ravel()
+        y = y.ravel()
+        x_mean, y_mean, sxx, syy, sxy = _centered_moments(x, y)
+        
+        # A constant x leaves the slope undetermined; take the minimum-norm solution
+        slope = sxy / sxx if sxx > 0 else 0.0
+        intercept = y_mean - slope * x_mean
+        
+        # R-squared is the squared correlation; a constant y is fit perfectly
+        if syy == 0:
+            r_squared = 1.0
+        elif sxx == 0:
+            r_squared = 0.0
+        else:
+            r_squared = sxy * sxy / (sxx * syy)
         
         # Get predictions
-        y_pred = model.predict(X)
+        y_pred = slope * x
+        y_pred += intercept
         
-        # Calculate R-squared
-        r_squared = model.score(X, y)
+        results = {
+            'slope': float(slope),
+            'intercept': float(intercept),
+            'r_squared': float(r_squared),
+            'predictions': y_pred
+        }
         
         # Calculate residuals
-        residuals = y - y_pred
+        if return_residuals:
+            results['residuals'] = y - y_pred
         
-        return {
-            'slope': float(model.coef_[0]),
-            'intercept': float(model.intercept_),
-            'r_squared': float(r_squared),
-            'predictions': y_pred.tolist(),
-            'residuals': residuals.tolist()
-        }
+        return results
         
     except ValidationError:
         raise
     except Exception as e:
-        raise CalculationError(f"Failed to perform linear regression: {str(e)}")
+        raise CalculationError(f"Failed to perform linear regression: {str(e)}") from e
 
 
 def confidence_interval(data, confidence_level=0.95):
@@ -626,7 +926,7 @@ def confidence_interval(data, confidence_level=0.95):
     """
     try:
         # Convert to numpy array
-        arr = np.array(data)
+        arr = _asarray(data)
         
         # Validate data
         if arr.size == 0:
@@ -638,13 +938,12 @@ def confidence_interval(data, confidence_level=0.95):
             raise ValidationError("Confidence level must be between 0 and 1")
             
         # Calculate statistics
-        sample_mean = np.mean(arr)
-        sample_std = np.std(arr, ddof=1)
-        n = len(arr)
+        sample_mean, sample_var = _mean_variance(arr, 1)
+        sample_std = math.sqrt(sample_var)
+        n = arr.size
         
         # Calculate confidence interval using t-distribution
-        alpha = 1 - confidence_level
-        t_critical = stats.t.ppf(1 - alpha/2, n - 1)
+        t_critical = _t_critical(n - 1, confidence_level)
         margin_of_error = t_critical * (sample_std / np.sqrt(n))
         
         lower_bound = sample_mean - margin_of_error
@@ -662,7 +961,7 @@ def confidence_interval(data, confidence_level=0.95):
     except ValidationError:
         raise
     except Exception as e:
-        raise CalculationError(f"Failed to calculate confidence interval: {str(e)}")
+        raise CalculationError(f"Failed to calculate confidence interval: {str(e)}") from e
 
 
 def z_score(value, mean, std):
@@ -670,18 +969,32 @@ def z_score(value, mean, std):
     Calculate z-score (standard score).
     
     Args:
-        value (float): Value to standardize
-        mean (float): Mean of the distribution
-        std (float): Standard deviation of the distribution
+        value (float|list|np.ndarray): Value or array of values to standardize
+        mean (float|np.ndarray): Mean of the distribution; for array values, may be
+            an array broadcastable against them (e.g. per-row means)
+        std (float|np.ndarray): Standard deviation of the distribution; broadcasts like mean
         
     Returns:
-        float: Z-score
+        float|np.ndarray: Z-score, or an array of z-scores for array input
         
     Raises:
         ValidationError: If parameters are invalid
         CalculationError: If calculation fails
     """
     try:
+        # Arrays are standardized in one vectorized pass
+        if isinstance(value, (list, tuple, np.ndarray)):
+            arr = np.asarray(value)
+            loc = np.asarray(mean)
+            scale = np.asarray(std)
+            if any(a.dtype.kind not in 'biuf' for a in (arr, loc, scale)):
+                raise ValidationError("Values, mean and standard deviation must be real numbers")
+            if np.any(scale <= 0):
+                raise ValidationError("Standard deviation must be positive")
+            z = np.subtract(arr, loc, dtype=np.float64)
+            z /= scale
+            return z
+        
         # Validate inputs
         validate_numbers(value, mean, std)
         if std <= 0:
@@ -694,7 +1007,7 @@ def z_score(value, mean, std):
     except ValidationError:
         raise
     except Exception as e:
-        raise CalculationError(f"Failed to calculate z-score: {str(e)}")
+        raise CalculationError(f"Failed to calculate z-score: {str(e)}") from e
 
 
 def percentile(data, percentile_value):
@@ -703,10 +1016,11 @@ def percentile(data, percentile_value):
     
     Args:
         data (list|np.ndarray): Dataset
-        percentile_value (float): Percentile to calculate (0-100)
+        percentile_value (float|list|np.ndarray): Percentile to calculate (0-100),
+            or a sequence of percentiles
         
     Returns:
-        float: Percentile value
+        float|np.ndarray: Percentile value, or an array of values for a sequence of percentiles
         
     Raises:
         ValidationError: If data is invalid
@@ -714,11 +1028,22 @@ def percentile(data, percentile_value):
     """
     try:
         # Convert to numpy array
-        arr = np.array(data)
+        arr = _asarray(data)
         
         # Validate data
         if arr.size == 0:
             raise ValidationError("Dataset cannot be empty")
+        
+        # A sequence of percentiles is answered by a single partition over all
+        # of their order statistics instead of one np.percentile call each
+        if isinstance(percentile_value, (list, tuple, np.ndarray)):
+            q = np.asarray(percentile_value, dtype=np.float64)
+            if q.size == 0:
+                raise ValidationError("Percentiles cannot be empty")
+            if np.any(q < 0) or np.any(q > 100):
+                raise ValidationError("Percentile must be between 0 and 100")
+            return np.percentile(arr, q)
+        
         validate_numbers(percentile_value)
         if percentile_value < 0 or percentile_value > 100:
             raise ValidationError("Percentile must be between 0 and 100")
@@ -730,4 +1055,4 @@ def percentile(data, percentile_value):
     except ValidationError:
         raise
     except Exception as e:
-        raise CalculationError(f"Failed to calculate percentile: {str(e)}")
+        raise CalculationError(f"Failed to calculate percentile: {str(e)}") from e
@@ -13,16 +13,314 @@ Example usage:
     x**3/3
 """
 
+import atexit
+import functools
+import hashlib
+import numbers
+import os
+import pickle
+import sqlite3
+import threading
+from collections import namedtuple
+from functools import lru_cache
+
+import numpy as np
 import sympy as sp
 from sympy import symbols, sympify, expand, factor, simplify, collect, solve, dsolve
 from sympy import latex, pprint, pretty, Rational, oo, I, pi, E
 from sympy.parsing.sympy_parser import parse_expr, standard_transformations, implicit_multiplication_application
+from sympy.concrete.expr_with_limits import ExprWithLimits
+from sympy.functions.elementary.trigonometric import TrigonometricFunction
 from sympy.solvers import solve as sympy_solve
 from sympy.solvers.ode import dsolve as sympy_dsolve
+from mathgenius import __version__
 from mathgenius.core.validation import validate_numbers
 from mathgenius.core.errors import ValidationError, CalculationError
 
+try:
+    import symengine as se
+    _HAS_SYMENGINE = True
+except ImportError:  # symengine is an optional accelerator
+    se = None
+    _HAS_SYMENGINE = False
+
+
+# Result of common subexpression elimination, as strings: ``replacements``
+# is a list of (symbol name, subexpression) pairs, each of which may use
+# earlier names, and ``expr`` is the reduced expression.
+CSEResult = namedtuple('CSEResult', ['replacements', 'expr'])
+
+
+def _cse_result(result):
+    """Apply common subexpression elimination to a result expression."""
+    replacements, (reduced,) = sp.cse(result)
+    return CSEResult([(str(sym), str(sub)) for sym, sub in replacements], str(reduced))
+
+
+@lru_cache(maxsize=4096)
+def _cached_parse(expression_string):
+    """
+    Parse an expression string with parse_expr, memoizing the result.
+    
+    SymPy expressions are immutable, so sharing the parsed result between
+    calls is safe. Use ``_cached_parse.cache_clear()`` to reset it.
+    """
+    return parse_expr(expression_string)
+
+
+@lru_cache(maxsize=2048)
+def _sym(name, assumptions_key=()):
+    """
+    Return symbols(name), memoized on the name and assumptions.
+    
+    SymPy sets up a symbol's assumptions when it is created, so each
+    (name, assumptions) combination pays that cost once. At most 2048
+    combinations are kept, least recently used first out.
+    
+    Args:
+        name (str): Symbol name(s), as accepted by ``symbols``
+        assumptions_key (tuple): Sorted (assumption, value) pairs
+    """
+    if assumptions_key:
+        return symbols(name, **dict(assumptions_key))
+    return symbols(name)
+
+
+def _symengine_apply(operation, expr, *args):
+    """
+    Run an operation on the SymEngine form of expr and its arguments.
+    
+    Returns the result converted back to SymPy, or None when SymEngine is
+    not installed, is switched off with MATHGENIUS_USE_SYMENGINE=0, or
+    cannot represent the inputs.
+    """
+    if not _HAS_SYMENGINE or os.environ.get('MATHGENIUS_USE_SYMENGINE') == '0':
+        return None
+    try:
+        return sp.sympify(operation(se.sympify(expr), *[se.sympify(arg) for arg in args]))
+    except Exception:
+        return None
+
+
+def _se_diff(expr, var, order):
+    """Differentiate a SymEngine expression order times."""
+    for _ in range(order):
+        expr = expr.diff(var)
+    return expr
+
+
+@lru_cache(maxsize=1024)
+def _cached_expand(expr):
+    """
+    Expand a (hashable) expression, memoizing the result.
+    
+    Only polynomials go through SymEngine: SymPy's expand also rewrites
+    functions (exp(x + y) -> exp(x)*exp(y)) and SymEngine's does not, so
+    other expressions would expand differently depending on the backend.
+    """
+    result = None
+    if isinstance(expr, sp.Expr) and expr.is_polynomial():
+        result = _symengine_apply(lambda e: e.expand(), expr)
+    return expand(expr) if result is None else result
+
+
+@lru_cache(maxsize=1024)
+def _cached_factor(expr):
+    """Factor a (hashable) expression, memoizing the result."""
+    return factor(expr)
+
+
+@lru_cache(maxsize=1024)
+def _cached_simplify(expr):
+    """Simplify a (hashable) expression, memoizing the result."""
+    return _tiered_simplify(expr)
+
+
+@lru_cache(maxsize=1024)
+def _cached_integrate(expr, var, limits=None):
+    """Integrate a (hashable) expression, memoizing the result; limits is a SymPy Tuple or None."""
+    if limits is None:
+        return sp.integrate(expr, var)
+    return sp.integrate(expr, (var, *limits))
+
+
+@lru_cache(maxsize=1024)
+def _cached_diff(expr, var, order):
+    """Differentiate a (hashable) expression order times, memoizing the result."""
+    result = _symengine_apply(lambda e, v: _se_diff(e, v, order), expr, var)
+    return sp.diff(expr, var, order) if result is None else result
+
+
+@lru_cache(maxsize=1024)
+def _cached_series(expr, var, point, order):
+    """Truncated series of a (hashable) expression about a SymPy point, memoizing the result."""
+    return sp.series(expr, var, point, order + 1).removeO()
+
+
+def _tiered_simplify(expr):
+    """
+    Simplify with the cheapest rewrite that suits the expression.
+    
+    Polynomials and rational functions only need cancelling and their
+    common factors pulled out, and purely trigonometric expressions
+    trigsimp; anything else goes through the general (and much slower)
+    ``simplify``. As with ``simplify``, a rewrite is kept only if it is not
+    more complex than the input.
+    """
+    if not isinstance(expr, sp.Expr):
+        return simplify(expr)
+    functions = expr.atoms(sp.Function)
+    if expr.is_polynomial():
+        return _factor_common_terms(_shorter(sp.cancel(expr), expr))
+    if expr.is_rational_function():
+        return _factor_common_terms(_shorter(sp.cancel(sp.together(expr)), expr))
+    if functions and all(isinstance(f, TrigonometricFunction) for f in functions):
+        return _shorter(sp.trigsimp(expr), expr)
+    return simplify(expr)
+
 
+def _shorter(candidate, expr):
+    """Return candidate unless it has more operations than expr."""
+    return candidate if sp.count_ops(candidate) <= sp.count_ops(expr) else expr
+
+
+def _factor_common_terms(expr):
+    """
+    Pull common symbolic factors out of a sum, as ``simplify`` does.
+    
+    A bare numeric content is distributed back (``2*x + 2`` stays as is),
+    and the factored form is kept only if it is not more complex.
+    """
+    factored = sp.Mul(*sp.factor_terms(expr).as_coeff_Mul())
+    return _shorter(factored, expr)
+
+
+@lru_cache(maxsize=1024)
+def _is_polynomial_in(expr, var=None):
+    """
+    Check that expr is a polynomial in var, memoizing the result.
+    
+    Without a variable, expr must be a polynomial in all of its free symbols
+    at once, which a single Poly construction decides.
+    """
+    if var is not None:
+        return bool(expr.is_polynomial(var))
+    free_vars = expr.free_symbols
+    if len(free_vars) <= 1:
+        return bool(expr.is_polynomial(*free_vars))
+    try:
+        sp.Poly(expr, *sorted(free_vars, key=sp.default_sort_key))
+    except sp.PolynomialError:
+        return False
+    return True
+
+
+def clear_symbolic_caches():
+    """
+    Clear the memoized parsing and rewriting results of this module.
+    
+    Useful for tests and for bounding memory in long-running processes.
+    """
+    _cached_parse.cache_clear()
+    _parse_expression_with_transformations.cache_clear()
+    _sym.cache_clear()
+    _cached_expand.cache_clear()
+    _cached_factor.cache_clear()
+    _cached_simplify.cache_clear()
+    _cached_integrate.cache_clear()
+    _cached_diff.cache_clear()
+    _cached_series.cache_clear()
+    _is_polynomial_in.cache_clear()
+    _canonical_sub_items.cache_clear()
+    _cached_lambdify.cache_clear()
+
+
+# Results of the slow solvers can also be kept on disk, across processes:
+# set MATHGENIUS_DISK_CACHE to the path of an SQLite database to enable it.
+# SQLite locks the file, so several processes can share one database.
+_DISK_CACHE_LOCK = threading.Lock()
+
+
+@lru_cache(maxsize=None)
+def _open_disk_cache(path):
+    """Open (creating if needed) the SQLite cache at path, closing it again at exit."""
+    connection = sqlite3.connect(path, timeout=30, check_same_thread=False)
+    with connection:
+        connection.execute(
+            "CREATE TABLE IF NOT EXISTS results (key TEXT PRIMARY KEY, value BLOB NOT NULL)"
+        )
+    atexit.register(connection.close)
+    return connection
+
+
+def _disk_cache_key(namespace, args, kwargs):
+    """Hash a call canonically: SymPy arguments by srepr, others by repr."""
+    def canonical(value):
+        if isinstance(value, sp.Basic):
+            return sp.srepr(value)
+        if isinstance(value, (list, tuple)):
+            return type(value).__name__, tuple(canonical(v) for v in value)
+        return repr(value)
+    
+    key = (namespace, __version__, sp.__version__, canonical(args),
+           tuple(sorted((name, canonical(value)) for name, value in kwargs.items())))
+    return hashlib.sha256(repr(key).encode()).hexdigest()
+
+
+def _persistent_cache(namespace):
+    """
+    Memoize a function's results in the MATHGENIUS_DISK_CACHE database.
+    
+    Only successful results are stored, one row per call. Keys include the
+    mathgenius and SymPy versions, so upgrading either never serves stale
+    results. Without the environment variable the function is called
+    directly.
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            path = os.environ.get('MATHGENIUS_DISK_CACHE')
+            if not path:
+                return func(*args, **kwargs)
+            key = _disk_cache_key(namespace, args, kwargs)
+            with _DISK_CACHE_LOCK:
+                connection = _open_disk_cache(path)
+                row = connection.execute(
+                    "SELECT value FROM results WHERE key = ?", (key,)
+                ).fetchone()
+            if row is not None:
+                return pickle.loads(row[0])
+            result = func(*args, **kwargs)
+            with _DISK_CACHE_LOCK, connection:
+                connection.execute(
+                    "INSERT OR REPLACE INTO results (key, value) VALUES (?, ?)",
+                    (key, pickle.dumps(result)),
+                )
+            return result
+        return wrapper
+    return decorator
+
+
+def _coerce_expr(value, parse=_cached_parse):
+    """Parse a string into a SymPy expression; other values pass through."""
+    if not isinstance(value, str):
+        return value
+    if not value.strip():
+        raise ValidationError("Expression cannot be empty")
+    return parse(value)
+
+
+def _coerce_symbol(value):
+    """Turn a variable name into its SymPy symbol; other values pass through."""
+    return _sym(value) if isinstance(value, str) else value
+
+
+# SymPy's standard parser transformations plus implicit multiplication
+# ("2x", "x y") and application ("sin x"), for user-typed notation
+_TRANSFORMATIONS = standard_transformations + (implicit_multiplication_application,)
+
+
+@lru_cache(maxsize=4096)
 def _parse_expression_with_transformations(expression_string):
     """
     Parse a mathematical expression string with common transformations.
@@ -32,6 +330,9 @@ def _parse_expression_with_transformations(expression_string):
     - Implicit multiplication
     - Standard mathematical transformations
     
+    Results are memoized on the string, like ``_cached_parse``; failed
+    parses are not cached.
+    
     Args:
         expression_string (str): Mathematical expression as string
         
@@ -45,13 +346,9 @@ def _parse_expression_with_transformations(expression_string):
     # This is a simple preprocessing step
     processed_expr = expression_string.replace('^', '**')
     
-    # Use SymPy's transformations for better parsing
-    transformations = (standard_transformations + 
-                      (implicit_multiplication_application,))
-    
     try:
         # Try with transformations first
-        expr = parse_expr(processed_expr, transformations=transformations)
+        expr = parse_expr(processed_expr, transformations=_TRANSFORMATIONS)
         return expr
     except Exception:
         # Fallback to basic parsing
@@ -95,7 +392,7 @@ def parse_expression(expression_string):
     except ValidationError:
         raise
     except Exception as e:
-        raise CalculationError(f"Failed to parse expression: {str(e)}")
+        raise CalculationError(f"Failed to parse expression: {str(e)}") from e
 
 
 def create_symbol(symbol_name, assumptions=None):
@@ -129,17 +426,18 @@ def create_symbol(symbol_name, assumptions=None):
             raise ValidationError("Symbol name cannot be empty")
             
         # Create symbol with assumptions
-        if assumptions is None:
-            symbol = symbols(symbol_name)
+        if not assumptions:
+            symbol = _sym(symbol_name)
         else:
-            symbol = symbols(symbol_name, **assumptions)
+            # Frozen into a sorted tuple so equal dicts share a cache entry
+            symbol = _sym(symbol_name, tuple(sorted(assumptions.items())))
             
         return str(symbol)
         
     except ValidationError:
         raise
     except Exception as e:
-        raise CalculationError(f"Failed to create symbol: {str(e)}")
+        raise CalculationError(f"Failed to create symbol: {str(e)}") from e
 
 
 def expand_expression(expression):
@@ -166,13 +464,10 @@ def expand_expression(expression):
     """
     try:
         # Parse expression if it's a string
-        if isinstance(expression, str):
-            expr = _parse_expression_with_transformations(expression)
-        else:
-            expr = expression
+        expr = _coerce_expr(expression, _parse_expression_with_transformations)
             
         # Expand expression
-        result = expand(expr)
+        result = _cached_expand(expr)
         
         # Convert to string for JSON serialization
         return str(result)
@@ -180,7 +475,7 @@ def expand_expression(expression):
     except ValidationError:
         raise
     except Exception as e:
-        raise CalculationError(f"Failed to expand expression: {str(e)}")
+        raise CalculationError(f"Failed to expand expression: {str(e)}") from e
 
 
 def factor_expression(expression):
@@ -207,13 +502,10 @@ def factor_expression(expression):
     """
     try:
         # Parse expression if it's a string
-        if isinstance(expression, str):
-            expr = _parse_expression_with_transformations(expression)
-        else:
-            expr = expression
+        expr = _coerce_expr(expression, _parse_expression_with_transformations)
             
         # Factor expression
-        result = factor(expr)
+        result = _cached_factor(expr)
         
         # Convert to string for JSON serialization
         return str(result)
@@ -221,9 +513,10 @@ def factor_expression(expression):
     except ValidationError:
         raise
     except Exception as e:
-        raise CalculationError(f"Failed to factor expression: {str(e)}")
+        raise CalculationError(f"Failed to factor expression: {str(e)}") from e
 
 
+@_persistent_cache('simplify')
 def simplify_expression(expression):
     """
     Simplify a mathematical expression.
@@ -248,13 +541,10 @@ def simplify_expression(expression):
     """
     try:
         # Parse expression if it's a string
-        if isinstance(expression, str):
-            expr = _parse_expression_with_transformations(expression)
-        else:
-            expr = expression
+        expr = _coerce_expr(expression, _parse_expression_with_transformations)
             
         # Simplify expression
-        result = simplify(expr)
+        result = _cached_simplify(expr)
         
         # Convert to string for JSON serialization
         return str(result)
@@ -262,7 +552,7 @@ def simplify_expression(expression):
     except ValidationError:
         raise
     except Exception as e:
-        raise CalculationError(f"Failed to simplify expression: {str(e)}")
+        raise CalculationError(f"Failed to simplify expression: {str(e)}") from e
 
 
 def collect_terms(expression, variable):
@@ -290,14 +580,11 @@ def collect_terms(expression, variable):
     """
     try:
         # Parse expression if it's a string
-        if isinstance(expression, str):
-            expr = parse_expr(expression)
-        else:
-            expr = expression
+        expr = _coerce_expr(expression)
             
         # Parse variable if it's a string
         if isinstance(variable, str):
-            var = symbols(variable)
+            var = _sym(variable)
         elif isinstance(variable, sp.Symbol):
             var = variable
         else:
@@ -310,9 +597,50 @@ def collect_terms(expression, variable):
     except ValidationError:
         raise
     except Exception as e:
-        raise CalculationError(f"Failed to collect terms: {str(e)}")
+        raise CalculationError(f"Failed to collect terms: {str(e)}") from e
 
 
+def _solve_system_with_cse(equations, unknowns):
+    """
+    Solve a system after factoring out subexpressions free of the unknowns.
+    
+    Such subexpressions act as constants for the solver, so they are replaced
+    by symbols before solving and substituted back into the solutions.
+    Subexpressions involving an unknown are left inline.
+    """
+    replacements, reduced = sp.cse(equations)
+    unknown_set = set(unknowns)
+    expanded = {}
+    inline = {}
+    kept = []
+    for sym, sub in replacements:
+        expanded[sym] = sub.xreplace(expanded)
+        if expanded[sym].free_symbols & unknown_set:
+            inline[sym] = expanded[sym]
+        else:
+            kept.append((sym, sub))
+    if not kept:
+        return sympy_solve(equations, unknowns)
+    reduced = [eq.xreplace(inline) for eq in reduced]
+    
+    solutions = sympy_solve(reduced, unknowns)
+    
+    def back_substitute(sol):
+        for sym, sub in reversed(kept):
+            sol = sol.subs(sym, sub)
+        return sol
+    
+    if isinstance(solutions, dict):
+        return {k: back_substitute(v) for k, v in solutions.items()}
+    if isinstance(solutions, list):
+        return [{k: back_substitute(v) for k, v in sol.items()} if isinstance(sol, dict)
+                else tuple(back_substitute(v) for v in sol) if isinstance(sol, tuple)
+                else back_substitute(sol)
+                for sol in solutions]
+    return solutions
+
+
+@_persistent_cache('solve')
 def solve_equation(equation, variable=None):
     """
     Solve an equation or system of equations.
@@ -340,25 +668,22 @@ def solve_equation(equation, variable=None):
     """
     try:
         # Parse equation if it's a string
-        if isinstance(equation, str):
-            eq = parse_expr(equation)
-        elif isinstance(equation, list):
-            eq = [parse_expr(e) if isinstance(e, str) else e for e in equation]
+        if isinstance(equation, list):
+            eq = [_coerce_expr(e) for e in equation]
         else:
-            eq = equation
+            eq = _coerce_expr(equation)
             
         # Parse variable if it's a string
-        if variable is None:
-            var = None
-        elif isinstance(variable, str):
-            var = symbols(variable)
-        elif isinstance(variable, list):
-            var = [symbols(v) if isinstance(v, str) else v for v in variable]
+        if isinstance(variable, list):
+            var = [_coerce_symbol(v) for v in variable]
         else:
-            var = variable
+            var = _coerce_symbol(variable)
             
-        # Solve equation
-        solutions = sympy_solve(eq, var)
+        # Solve equation; larger systems share their common subexpressions
+        if isinstance(eq, list) and len(eq) >= 3 and isinstance(var, list):
+            solutions = _solve_system_with_cse(eq, var)
+        else:
+            solutions = sympy_solve(eq, var)
         
         # Convert solutions to list format and string for JSON serialization
         if isinstance(solutions, dict):
@@ -371,9 +696,10 @@ def solve_equation(equation, variable=None):
     except ValidationError:
         raise
     except Exception as e:
-        raise CalculationError(f"Failed to solve equation: {str(e)}")
+        raise CalculationError(f"Failed to solve equation: {str(e)}") from e
 
 
+@_persistent_cache('dsolve')
 def solve_differential_equation(equation, function=None):
     """
     Solve a differential equation.
@@ -399,17 +725,14 @@ def solve_differential_equation(equation, function=None):
     """
     try:
         # Parse equation if it's a string
-        if isinstance(equation, str):
-            eq = parse_expr(equation)
-        else:
-            eq = equation
+        eq = _coerce_expr(equation)
             
         # Parse function if it's a string
         if function is None:
             func = None
         elif isinstance(function, str):
             # Create a function symbol like y(x)
-            x = symbols('x')
+            x = _sym('x')
             func = sp.Function(function)(x)
         else:
             func = function
@@ -421,7 +744,53 @@ def solve_differential_equation(equation, function=None):
     except ValidationError:
         raise
     except Exception as e:
-        raise CalculationError(f"Failed to solve differential equation: {str(e)}")
+        raise CalculationError(f"Failed to solve differential equation: {str(e)}") from e
+
+
+# Expressions that bind their own variables, where substituting a symbol
+# needs subs() rather than a blind xreplace()
+_BINDING_TYPES = (ExprWithLimits, sp.Derivative, sp.Subs, sp.Lambda, sp.Limit, sp.Order)
+
+
+@lru_cache(maxsize=2048)
+def _canonical_sub_items(items):
+    """Parse sorted (variable, value) pairs into a symbol-keyed dict."""
+    return {_coerce_symbol(var): sympify(_coerce_expr(value)) for var, value in items}
+
+
+def _canonical_substitutions(substitutions):
+    """
+    Turn a substitutions dict into {symbol: expression}, memoized.
+    
+    Sweeps often apply the same substitutions to many expressions; the
+    parsing is done once per distinct dict. The returned dict is shared,
+    so callers must not mutate it.
+    """
+    items = tuple(sorted(substitutions.items(), key=lambda item: str(item[0])))
+    try:
+        return _canonical_sub_items(items)
+    except TypeError:  # unhashable values
+        return {_coerce_symbol(var): sympify(_coerce_expr(value)) for var, value in items}
+
+
+def _substitute(expr, substitutions):
+    """
+    Apply a substitutions dict to a parsed expression, returning a SymPy expression.
+    
+    Plain symbols outside of binding constructs are swapped by a direct tree
+    rewrite, without pattern matching. That rewrite is simultaneous, so it
+    is only used when no value mentions a substituted symbol; otherwise
+    ``subs`` applies the substitutions in sequence.
+    """
+    if not isinstance(substitutions, dict):
+        raise ValidationError("Substitutions must be a dictionary")
+    sub_dict = _canonical_substitutions(substitutions)
+    keys = sub_dict.keys()
+    if (all(isinstance(var, sp.Symbol) for var in keys)
+            and not any(keys & value.free_symbols for value in sub_dict.values())
+            and not expr.has(*_BINDING_TYPES)):
+        return expr.xreplace(sub_dict)
+    return expr.subs(sub_dict)
 
 
 def substitute_expression(expression, substitutions):
@@ -449,38 +818,155 @@ def substitute_expression(expression, substitutions):
     """
     try:
         # Parse expression if it's a string
-        if isinstance(expression, str):
-            expr = parse_expr(expression)
-        else:
-            expr = expression
-            
-        # Validate substitutions
-        if not isinstance(substitutions, dict):
-            raise ValidationError("Substitutions must be a dictionary")
-            
-        # Convert string variables to symbols
-        sub_dict = {}
-        for var, value in substitutions.items():
-            if isinstance(var, str):
-                var_symbol = symbols(var)
-            else:
-                var_symbol = var
-                
-            if isinstance(value, str):
-                value_expr = parse_expr(value)
-            else:
-                value_expr = value
-                
-            sub_dict[var_symbol] = value_expr
+        expr = _coerce_expr(expression)
             
         # Perform substitution
-        result = expr.subs(sub_dict)
+        result = _substitute(expr, substitutions)
         return str(result)
         
     except ValidationError:
         raise
     except Exception as e:
-        raise CalculationError(f"Failed to substitute expression: {str(e)}")
+        raise CalculationError(f"Failed to substitute expression: {str(e)}") from e
+
+
+# Expressions with more nodes than this are lambdified piecewise, in pieces
+# of at most _LAMBDIFY_PIECE_SIZE nodes. A single function compiled from
+# ~30k nodes already overflows the recursion limit of Python's compiler.
+_SPLIT_LAMBDIFY_SIZE = 20_000
+_LAMBDIFY_PIECE_SIZE = 2_000
+
+
+def _tree_size(expr):
+    """Number of nodes in an expression tree."""
+    return sum(1 for _ in sp.preorder_traversal(expr))
+
+
+def _split_expression(expr, max_size):
+    """
+    Split an expression into pieces of at most about max_size nodes.
+    
+    Returns ``(pieces, top)``: ``pieces`` is a list of ``(placeholder, piece)``
+    pairs in evaluation order, each piece referring only to the original
+    symbols and earlier placeholders, and ``top`` combines the last of them.
+    Long sums and products are cut into groups of terms.
+    """
+    pieces = []
+    
+    def placeholder(piece):
+        sym = sp.Dummy()
+        pieces.append((sym, piece))
+        return sym
+    
+    def split(node):
+        if node.is_Atom or _tree_size(node) <= max_size:
+            return node
+        args = [split(arg) for arg in node.args]
+        if not (node.is_Add or node.is_Mul):
+            return node.func(*[placeholder(arg) if isinstance(arg, sp.Expr) and not arg.is_Atom
+                               else arg for arg in args])
+        while True:
+            groups, group, total = [], [], 0
+            for arg in args:
+                size = _tree_size(arg)
+                if group and total + size > max_size:
+                    groups.append(group)
+                    group, total = [], 0
+                group.append(arg)
+                total += size
+            groups.append(group)
+            if len(groups) == 1:
+                return node.func(*groups[0], evaluate=False)
+            args = [placeholder(node.func(*g, evaluate=False)) if len(g) > 1 else g[0]
+                    for g in groups]
+    
+    return pieces, split(expr)
+
+
+def _fast_lambdify(args, expr, modules):
+    """
+    Lambdify an expression, as a chain of small functions if it is large.
+    
+    Compiling one function for a huge expression is slow and eventually
+    fails with a RecursionError in Python's compiler. Large expressions
+    are therefore split into pieces that are lambdified on their own and
+    evaluated in order, each feeding the next.
+    """
+    if _tree_size(expr) <= _SPLIT_LAMBDIFY_SIZE:
+        # Array evaluation computes each repeated subexpression once, over
+        # the whole array; for scalars the elimination is not worth it
+        cse = 'numpy' in modules
+        try:
+            return sp.lambdify(args, expr, modules=modules, cse=cse)
+        except RecursionError:
+            pass
+    pieces, top = _split_expression(expr, _LAMBDIFY_PIECE_SIZE)
+    placeholders = {sym for sym, _ in pieces}
+    steps = []
+    for sym, piece in pieces + [(None, top)]:
+        inputs = [dep for dep in piece.free_symbols if dep in placeholders]
+        steps.append((sym, inputs, sp.lambdify(list(args) + inputs, piece, modules=modules)))
+    
+    def evaluate(*values):
+        results = {}
+        for sym, inputs, func in steps:
+            value = func(*values, *[results[dep] for dep in inputs])
+            results[sym] = value
+        return value
+    
+    return evaluate
+
+
+@lru_cache(maxsize=1024)
+def _cached_lambdify(expr, names, modules=("math", "mpmath")):
+    """Lambdify an expression over its free symbols, given sorted by name."""
+    by_name = {sym.name: sym for sym in expr.free_symbols}
+    return _fast_lambdify([by_name[name] for name in names], expr, list(modules))
+
+
+def _evaluate_array(expr, substitutions):
+    """
+    Evaluate an expression over array-valued substitutions with NumPy.
+    
+    The values are broadcast against each other and the expression is
+    evaluated in one vectorized call, returning an array of that shape.
+    """
+    if not isinstance(expr, sp.Basic):
+        expr = sympify(expr)
+    names = tuple(sorted(sym.name for sym in expr.free_symbols))
+    missing = [name for name in names if name not in substitutions]
+    if missing:
+        raise ValidationError(f"No values given for: {', '.join(missing)}")
+    values = np.broadcast_arrays(*[np.asarray(substitutions[name]) for name in names])
+    result = _cached_lambdify(expr, names, ("numpy",))(*values)
+    # Constant expressions still get one value per point
+    shape = np.broadcast_shapes(*[np.shape(value) for value in substitutions.values()])
+    return np.broadcast_to(result, shape).copy()
+
+
+def _evaluate_numeric(expr, substitutions):
+    """
+    Evaluate an expression through a cached lambdified function.
+    
+    Returns None when the fast path does not apply: non-numeric or missing
+    substitution values, or a value outside the real math domain (which
+    evalf handles).
+    """
+    if not isinstance(expr, sp.Basic):
+        return None
+    substitutions = substitutions or {}
+    names = tuple(sorted(sym.name for sym in expr.free_symbols))
+    try:
+        values = [substitutions[name] for name in names]
+    except KeyError:
+        return None
+    if not all(isinstance(value, numbers.Number) for value in values):
+        return None
+    try:
+        result = complex(_cached_lambdify(expr, names)(*values))
+    except (ValueError, TypeError, ZeroDivisionError, OverflowError):
+        return None
+    return result.real if result.imag == 0 else result
 
 
 def evaluate_expression(expression, substitutions=None):
@@ -488,11 +974,14 @@ def evaluate_expression(expression, substitutions=None):
     Evaluate an expression numerically.
     
     Args:
-        expression (str): Expression to evaluate as string
-        substitutions (dict): Dictionary of variable values
+        expression (str|CSEResult): Expression to evaluate as string, or a
+            result reduced by common subexpression elimination
+        substitutions (dict): Dictionary of variable values; array-like
+            values are broadcast and evaluated in one vectorized call
         
     Returns:
-        float|complex: Numerical value of the expression
+        float|complex|numpy.ndarray: Numerical value of the expression, or
+        an array of values for array-like substitutions
         
     Raises:
         ValidationError: If expression is invalid
@@ -509,15 +998,29 @@ def evaluate_expression(expression, substitutions=None):
         4.0
     """
     try:
+        # Reduced results are evaluated one subexpression at a time
+        if isinstance(expression, CSEResult):
+            values = dict(substitutions or {})
+            for name, sub in expression.replacements:
+                values[name] = evaluate_expression(sub, values)
+            return evaluate_expression(expression.expr, values)
+            
         # Parse expression if it's a string
-        if isinstance(expression, str):
-            expr = parse_expr(expression)
-        else:
-            expr = expression
+        expr = _coerce_expr(expression)
+            
+        # Array-valued substitutions are evaluated in one vectorized call
+        if isinstance(substitutions, dict) and any(
+                isinstance(value, (list, tuple, np.ndarray)) for value in substitutions.values()):
+            return _evaluate_array(expr, substitutions)
             
-        # Apply substitutions if provided
+        # Numeric substitutions go through a cached lambdified function
+        result = _evaluate_numeric(expr, substitutions)
+        if result is not None:
+            return result
+            
+        # Apply substitutions if provided, on the already parsed expression
         if substitutions is not None:
-            expr = substitute_expression(expr, substitutions)
+            expr = _substitute(sympify(expr), substitutions)
             
         # Evaluate expression numerically
         result = expr.evalf()
@@ -531,10 +1034,10 @@ def evaluate_expression(expression, substitutions=None):
         except (TypeError, ValueError):
             return result
             
-    except ValidationError:
+    except (ValidationError, CalculationError):
         raise
     except Exception as e:
-        raise CalculationError(f"Failed to evaluate expression: {str(e)}")
+        raise CalculationError(f"Failed to evaluate expression: {str(e)}") from e
 
 
 def expression_to_latex(expression):
@@ -561,10 +1064,7 @@ def expression_to_latex(expression):
     """
     try:
         # Parse expression if it's a string
-        if isinstance(expression, str):
-            expr = parse_expr(expression)
-        else:
-            expr = expression
+        expr = _coerce_expr(expression)
             
         # Convert to LaTeX
         latex_str = latex(expr)
@@ -573,7 +1073,7 @@ def expression_to_latex(expression):
     except ValidationError:
         raise
     except Exception as e:
-        raise CalculationError(f"Failed to convert to LaTeX: {str(e)}")
+        raise CalculationError(f"Failed to convert to LaTeX: {str(e)}") from e
 
 
 def expression_to_string(expression, pretty_print=False):
@@ -599,10 +1099,7 @@ def expression_to_string(expression, pretty_print=False):
     """
     try:
         # Parse expression if it's a string
-        if isinstance(expression, str):
-            expr = parse_expr(expression)
-        else:
-            expr = expression
+        expr = _coerce_expr(expression)
             
         # Convert to string
         if pretty_print:
@@ -615,10 +1112,11 @@ def expression_to_string(expression, pretty_print=False):
     except ValidationError:
         raise
     except Exception as e:
-        raise CalculationError(f"Failed to convert to string: {str(e)}")
+        raise CalculationError(f"Failed to convert to string: {str(e)}") from e
 
 
-def symbolic_integrate(expression, variable, limits=None):
+@_persistent_cache('integrate')
+def symbolic_integrate(expression, variable, limits=None, common_subexpression_elimination=False):
     """
     Perform symbolic integration.
     
@@ -626,9 +1124,11 @@ def symbolic_integrate(expression, variable, limits=None):
         expression (str): Expression to integrate as string
         variable (str): Variable to integrate with respect to
         limits (tuple): Integration limits (lower, upper) for definite integral
+        common_subexpression_elimination (bool): Return the result as a
+            ``CSEResult``, sharing repeated subexpressions
         
     Returns:
-        str: Integrated expression as string
+        str|CSEResult: Integrated expression as string
         
     Raises:
         ValidationError: If expression or variable is invalid
@@ -646,34 +1146,30 @@ def symbolic_integrate(expression, variable, limits=None):
     """
     try:
         # Parse expression if it's a string
-        if isinstance(expression, str):
-            expr = parse_expr(expression)
-        else:
-            expr = expression
+        expr = _coerce_expr(expression)
             
         # Parse variable if it's a string
-        if isinstance(variable, str):
-            var = symbols(variable)
-        else:
-            var = variable
+        var = _coerce_symbol(variable)
             
         # Perform integration
         if limits is None:
             # Indefinite integral
-            result = sp.integrate(expr, var)
+            result = _cached_integrate(expr, var)
         else:
             # Definite integral
             if len(limits) != 2:
                 raise ValidationError("Limits must be a tuple of two values")
             lower, upper = limits
-            result = sp.integrate(expr, (var, lower, upper))
+            result = _cached_integrate(expr, var, sp.Tuple(lower, upper))
             
+        if common_subexpression_elimination:
+            return _cse_result(result)
         return str(result)
         
     except ValidationError:
         raise
     except Exception as e:
-        raise CalculationError(f"Failed to integrate symbolically: {str(e)}")
+        raise CalculationError(f"Failed to integrate symbolically: {str(e)}") from e
 
 
 def symbolic_differentiate(expression, variable, order=1):
@@ -704,29 +1200,23 @@ def symbolic_differentiate(expression, variable, order=1):
     """
     try:
         # Parse expression if it's a string
-        if isinstance(expression, str):
-            expr = parse_expr(expression)
-        else:
-            expr = expression
+        expr = _coerce_expr(expression)
             
         # Parse variable if it's a string
-        if isinstance(variable, str):
-            var = symbols(variable)
-        else:
-            var = variable
+        var = _coerce_symbol(variable)
             
         # Validate order
         if not isinstance(order, int) or order < 1:
             raise ValidationError("Order must be a positive integer")
             
-        # Perform differentiation
-        result = sp.diff(expr, var, order)
+        # Perform differentiation, in SymEngine when available
+        result = _cached_diff(expr, var, order)
         return str(result)
         
     except ValidationError:
         raise
     except Exception as e:
-        raise CalculationError(f"Failed to differentiate symbolically: {str(e)}")
+        raise CalculationError(f"Failed to differentiate symbolically: {str(e)}") from e
 
 
 def symbolic_limit(expression, variable, point, direction='+'):
@@ -758,16 +1248,10 @@ def symbolic_limit(expression, variable, point, direction='+'):
     """
     try:
         # Parse expression if it's a string
-        if isinstance(expression, str):
-            expr = parse_expr(expression)
-        else:
-            expr = expression
+        expr = _coerce_expr(expression)
             
         # Parse variable if it's a string
-        if isinstance(variable, str):
-            var = symbols(variable)
-        else:
-            var = variable
+        var = _coerce_symbol(variable)
             
         # Parse point
         if isinstance(point, str):
@@ -776,7 +1260,7 @@ def symbolic_limit(expression, variable, point, direction='+'):
             elif point.lower() in ['-oo', '-inf', '-infinity']:
                 point_val = -oo
             else:
-                point_val = parse_expr(point)
+                point_val = _cached_parse(point)
         else:
             point_val = point
             
@@ -791,10 +1275,10 @@ def symbolic_limit(expression, variable, point, direction='+'):
     except ValidationError:
         raise
     except Exception as e:
-        raise CalculationError(f"Failed to compute symbolic limit: {str(e)}")
+        raise CalculationError(f"Failed to compute symbolic limit: {str(e)}") from e
 
 
-def symbolic_series(expression, variable, point=0, order=6):
+def symbolic_series(expression, variable, point=0, order=6, common_subexpression_elimination=False):
     """
     Compute symbolic series expansion.
     
@@ -803,9 +1287,11 @@ def symbolic_series(expression, variable, point=0, order=6):
         variable (str): Variable for expansion
         point (number): Point around which to expand
         order (int): Order of expansion
+        common_subexpression_elimination (bool): Return the result as a
+            ``CSEResult``, sharing repeated subexpressions
         
     Returns:
-        str: Series expansion as string
+        str|CSEResult: Series expansion as string
         
     Raises:
         ValidationError: If expression, variable, or parameters are invalid
@@ -823,29 +1309,25 @@ def symbolic_series(expression, variable, point=0, order=6):
     """
     try:
         # Parse expression if it's a string
-        if isinstance(expression, str):
-            expr = parse_expr(expression)
-        else:
-            expr = expression
+        expr = _coerce_expr(expression)
             
         # Parse variable if it's a string
-        if isinstance(variable, str):
-            var = symbols(variable)
-        else:
-            var = variable
+        var = _coerce_symbol(variable)
             
         # Validate parameters
         if not isinstance(order, int) or order < 0:
             raise ValidationError("Order must be a non-negative integer")
             
         # Compute series
-        result = sp.series(expr, var, point, order + 1).removeO()
+        result = _cached_series(expr, var, sympify(point), order)
+        if common_subexpression_elimination:
+            return _cse_result(result)
         return str(result)
         
     except ValidationError:
         raise
     except Exception as e:
-        raise CalculationError(f"Failed to compute symbolic series: {str(e)}")
+        raise CalculationError(f"Failed to compute symbolic series: {str(e)}") from e
 
 
 def create_rational(numerator, denominator):
@@ -887,7 +1369,7 @@ def create_rational(numerator, denominator):
     except ValidationError:
         raise
     except Exception as e:
-        raise CalculationError(f"Failed to create rational number: {str(e)}")
+        raise CalculationError(f"Failed to create rational number: {str(e)}") from e
 
 
 def is_polynomial(expression, variable=None):
@@ -919,38 +1401,15 @@ def is_polynomial(expression, variable=None):
     """
     try:
         # Parse expression if it's a string
-        if isinstance(expression, str):
-            expr = parse_expr(expression)
-        else:
-            expr = expression
+        expr = _coerce_expr(expression)
             
         # Parse variable if it's a string
-        if variable is None:
-            var = None
-        elif isinstance(variable, str):
-            var = symbols(variable)
-        else:
-            var = variable
+        var = _coerce_symbol(variable)
             
-        # Check if polynomial
-        if var is None:
-            # Check if polynomial in any variable
-            free_vars = expr.free_symbols
-            if len(free_vars) == 0:
-                return True
-            elif len(free_vars) == 1:
-                var = list(free_vars)[0]
-                result = expr.is_polynomial(var)
-                return result if result is not None else False
-            else:
-                # Multiple variables - check if polynomial in all
-                results = [expr.is_polynomial(v) for v in free_vars]
-                return all(r if r is not None else False for r in results)
-        else:
-            result = expr.is_polynomial(var)
-            return result if result is not None else False
+        # Check if polynomial, in all free symbols when no variable is given
+        return _is_polynomial_in(expr, var)
             
     except ValidationError:
         raise
     except Exception as e:
-        raise CalculationError(f"Failed to check if polynomial: {str(e)}")
+        raise CalculationError(f"Failed to check if polynomial: {str(e)}") from e
@@ -13,11 +13,55 @@ Example usage:
     [1.0, 2.0, 3.0]
 """
 
+import math
+from functools import lru_cache
+
 from sympy import symbols, Eq, solve, sympify
 from sympy.parsing.sympy_parser import parse_expr, standard_transformations, implicit_multiplication_application
 from mathgenius.core.validation import validate_numbers
 from mathgenius.core.errors import ValidationError
 
+# Unknown of the fixed-form polynomial solvers, created once at import
+_X = symbols('x')
+
+
+@lru_cache(maxsize=256)
+def _symbols(names):
+    """Return symbols(names), memoized so each variable name is parsed once."""
+    return symbols(names)
+
+
+def _finite_or_none(compute):
+    """
+    Run a floating-point computation, returning None if it overflows.
+    
+    compute returns a float or a list of floats; infinite or NaN results
+    count as overflow, as do huge integers and divisions by an underflowed zero.
+    """
+    try:
+        result = compute()
+        values = result if isinstance(result, list) else [result]
+        if all(math.isfinite(value) for value in values):
+            return result
+    except (OverflowError, ZeroDivisionError):
+        pass
+    return None
+
+
+def _real_quadratic_roots(a, b, c):
+    """
+    Real roots of ax² + bx + c from the cancellation-free quadratic formula.
+    
+    Roots are sorted like SymPy's; an empty list means the roots are complex.
+    """
+    disc = b * b - 4 * a * c
+    if disc == 0:
+        return [-b / (2 * a) + 0.0]
+    if disc < 0:
+        return []
+    q = -0.5 * (b + math.copysign(math.sqrt(disc), b))
+    return sorted([q / a + 0.0, c / q + 0.0])
+
 
 def solve_linear(a, b):
     """
@@ -46,10 +90,13 @@ def solve_linear(a, b):
         if a == 0:
             raise ValidationError("Coefficient 'a' cannot be zero for linear equation")
             
-        x = symbols('x')
-        eq = Eq(a * x + b, 0)
-        solutions = solve(eq, x)
-        
+        # Closed form; adding 0.0 turns a -0.0 root into 0.0
+        root = _finite_or_none(lambda: -b / a + 0.0)
+        if root is not None:
+            return root
+            
+        # The quotient overflows a float; solve exactly instead
+        solutions = solve(Eq(a * _X + b, 0), _X)
         if not solutions:
             return None
             
@@ -98,9 +145,16 @@ def solve_quadratic(a, b, c):
         if a == 0:
             raise ValidationError("Coefficient 'a' cannot be zero for quadratic equation")
             
-        x = symbols('x')
-        eq = Eq(a * x**2 + b * x + c, 0)
-        solutions = solve(eq, x)
+        # Real roots come straight from the quadratic formula when it
+        # stays within float range
+        roots = _finite_or_none(lambda: _real_quadratic_roots(a, b, c))
+        if roots:
+            return roots
+            
+        # Complex roots, and coefficients whose products overflow a float,
+        # go through SymPy; complex roots keep its exact string form
+        eq = Eq(a * _X**2 + b * _X + c, 0)
+        solutions = solve(eq, _X)
         
         # Convert solutions to float when possible for better JSON serialization
         result = []
@@ -154,7 +208,7 @@ def solve_equation(equation_str, variable='x'):
     """
     try:
         # Create symbolic variable
-        var = symbols(variable)
+        var = _symbols(variable)
         
         # Handle equation parsing more robustly
         try:
@@ -251,9 +305,8 @@ def solve_cubic(a, b, c, d):
         if a == 0:
             raise ValidationError("Coefficient 'a' cannot be zero for cubic equation")
         
-        x = symbols('x')
-        eq = Eq(a * x**3 + b * x**2 + c * x + d, 0)
-        solutions = solve(eq, x)
+        eq = Eq(a * _X**3 + b * _X**2 + c * _X + d, 0)
+        solutions = solve(eq, _X)
         
         # Convert to float when possible
         result = []
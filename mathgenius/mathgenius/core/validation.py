@@ -1,12 +1,19 @@
 """Input validation utilities for mathgenius modules."""
 from .errors import ValidationError
 
+_NUM_TYPES = (int, float)
+
 def validate_number(value):
-    if not isinstance(value, (int, float)):
+    if not isinstance(value, _NUM_TYPES):
         raise ValidationError(f"Invalid input: {value} is not a number.")
     return value
 
 def validate_numbers(*values):
     for v in values:
-        validate_number(v)
+        # Exact int/float is by far the common case; subclasses take the isinstance path
+        t = type(v)
+        if t is int or t is float:
+            continue
+        if not isinstance(v, _NUM_TYPES):
+            raise ValidationError(f"Invalid input: {v} is not a number.")
     return values
@@ -2,10 +2,12 @@
 import pytest
 import math
 import numpy as np
+import sympy as sp
 from mathgenius.advanced.calculus import (
     differentiate, integrate_definite, integrate_indefinite, compute_limit,
     taylor_series, partial_derivative, gradient, hessian_matrix,
-    numerical_derivative, numerical_integral
+    numerical_derivative, numerical_integral, clear_caches, compile_expression,
+    gradient_at
 )
 from mathgenius.core.errors import ValidationError, CalculationError
 
@@ -37,6 +39,17 @@ class TestDifferentiation:
         result = differentiate("x**3", "x", order=3)
         assert str(result) == "6"
     
+    def test_differentiate_high_order(self):
+        """Test derivatives of order three and above."""
+        result = differentiate("x**5 + 3*x**2*y", "x", order=3)
+        assert str(result) == "60*x**2"
+        
+        result = differentiate("sin(2*x)", "x", order=4)
+        assert str(result) == "16*sin(2*x)"
+        
+        result = partial_derivative("x**2*y**4", "y", order=4)
+        assert str(result) == "24*x**2"
+    
     def test_differentiate_invalid_order(self):
         """Test differentiation with invalid order."""
         with pytest.raises(ValidationError):
@@ -64,6 +77,15 @@ class TestIntegration:
         result = integrate_indefinite("x**2", "x")
         assert str(result) == "x**3/3"
     
+    def test_integrate_indefinite_polynomial_and_rational(self):
+        """Test the polynomial fast path and rational antiderivatives."""
+        x, y = sp.symbols("x y")
+        assert integrate_indefinite("3*x**4 - 2*x + y", "x") == 3*x**5/5 - x**2 + x*y
+        
+        for expression in ["1/(x**2 - 1)", "(x**3 + 1)/(x**2 + 1)", "x/(x**2 + 2*x + 5)"]:
+            result = integrate_indefinite(expression, "x")
+            assert sp.simplify(sp.diff(result, x) - sp.sympify(expression)) == 0
+    
     def test_integrate_definite_basic(self):
         """Test basic definite integration."""
         # Test integral of x from 0 to 1 -> 1/2
@@ -74,6 +96,22 @@ class TestIntegration:
         result = integrate_definite("x**2", "x", 0, 2)
         assert abs(result - 8/3) < 1e-10
     
+    def test_integrate_definite_numeric_and_symbolic(self):
+        """Test the numeric fast path against symbolic integration."""
+        numeric = integrate_definite("x*exp(x)", "x", 0, 2)
+        symbolic = integrate_definite("x*exp(x)", "x", 0, 2, symbolic=True)
+        assert isinstance(numeric, float)
+        assert abs(numeric - (math.e**2 + 1)) < 1e-10
+        assert abs(symbolic - (math.e**2 + 1)) < 1e-10
+        
+        # Divergent integrals fall back to the symbolic result
+        result = integrate_definite("1/x**2", "x", 0, 1)
+        assert result == float("inf")
+        
+        # Other free symbols keep the symbolic result
+        result = integrate_definite("a*x", "x", 0, 2)
+        assert str(result) == "2*a"
+    
     def test_integrate_definite_invalid_bounds(self):
         """Test definite integration with invalid bounds."""
         with pytest.raises(ValidationError):
@@ -104,6 +142,19 @@ class TestLimits:
         result = compute_limit("1/x", "x", "oo")
         assert result == 0
     
+    def test_compute_limit_result_types(self):
+        """Test numeric conversion of limit results."""
+        result = compute_limit("sin(x)/x", "x", 0)
+        assert isinstance(result, float) and result == 1.0
+        
+        result = compute_limit("(1 + 1/x)**x", "x", "oo")
+        assert isinstance(result, float)
+        assert abs(result - math.e) < 1e-12
+        
+        assert compute_limit("1/x", "x", 0, "+") == sp.oo
+        assert compute_limit("1/x", "x", 0, "-") == -sp.oo
+        assert str(compute_limit("y*x", "x", 2)) == "2*y"
+    
     def test_compute_limit_invalid_direction(self):
         """Test limit with invalid direction."""
         with pytest.raises(ValidationError):
@@ -129,6 +180,25 @@ class TestTaylorSeries:
         assert "x" in result_str
         assert "x**2" in result_str
     
+    def test_taylor_series_polynomial(self):
+        """Test Taylor series of polynomial expressions."""
+        result = taylor_series("x**3 + 2*x + 1", "x", 0, 2)
+        assert str(result) == "2*x + 1"
+        
+        result = taylor_series("x**3 + 2*x + 1", "x", 1, 2)
+        assert result.equals(sp.series(sp.sympify("x**3 + 2*x + 1"),
+                                       sp.Symbol("x"), 1, 3).removeO())
+    
+    def test_taylor_series_reuses_higher_order(self):
+        """Test that lower orders are sliced from a cached expansion."""
+        x = sp.Symbol("x")
+        for expression, point in [("exp(x)", 0), ("sin(x)/(1 - x)", 0), ("log(x)", 1)]:
+            expr = sp.sympify(expression)
+            taylor_series(expression, "x", point, 8)
+            for order in (0, 2, 5):
+                expected = sp.series(expr, x, point, order + 1).removeO()
+                assert taylor_series(expression, "x", point, order) == expected
+    
     def test_taylor_series_invalid_order(self):
         """Test Taylor series with invalid order."""
         with pytest.raises(ValidationError):
@@ -171,6 +241,53 @@ class TestMultivariableCalculus:
         assert str(result[0, 1]) == "0"
         assert str(result[1, 0]) == "0"
     
+    def test_hessian_matrix_mixed_partials(self):
+        """Test Hessian entries with mixed partial derivatives."""
+        result = hessian_matrix("x**2*y + sin(x*y*z)", ["x", "y", "z"])
+        unsymmetric = hessian_matrix("x**2*y + sin(x*y*z)", ["x", "y", "z"],
+                                     assume_symmetric=False)
+        assert result == unsymmetric
+        assert result == result.T
+        assert str(result[0, 1]) == str(unsymmetric[1, 0])
+    
+    def test_gradient_common_subexpression_elimination(self):
+        """Test gradient returned in CSE form."""
+        replacements, reduced = gradient("sin(x*y) + cos(x*y)", ["x", "y"],
+                                         common_subexpression_elimination=True)
+        assert len(reduced) == 2
+        assert len(replacements) > 0
+        expanded = [r.subs(list(reversed(replacements))) for r in reduced]
+        assert expanded == gradient("sin(x*y) + cos(x*y)", ["x", "y"])
+    
+    def test_gradient_and_hessian_callables(self):
+        """Test compiled gradient and Hessian evaluators."""
+        grad, grad_fn = gradient("x**2*y + sin(x*y)", ["x", "y"], return_callable=True)
+        assert [str(g) for g in grad] == ["2*x*y + y*cos(x*y)", "x**2 + x*cos(x*y)"]
+        expected = [2*1*2 + 2*math.cos(2), 1 + math.cos(2)]
+        assert np.allclose(grad_fn(1.0, 2.0), expected)
+        
+        hess, hess_fn = hessian_matrix("x**2*y + sin(x*y)", ["x", "y"], return_callable=True)
+        values = np.asarray(hess_fn(1.0, 2.0), dtype=float)
+        assert values.shape == (2, 2)
+        assert np.allclose(values, np.array(hess.subs({"x": 1, "y": 2}), dtype=float))
+    
+    def test_gradient_at_points(self):
+        """Test batched gradient evaluation, including constant components."""
+        points = np.array([[1.0, 2.0], [3.0, 4.0], [-1.0, 0.5]])
+        result = gradient_at("x**2*y + 3*x", ["x", "y"], points)
+        x, y = points.T
+        assert result.shape == (3, 2)
+        assert np.allclose(result, np.column_stack([2*x*y + 3, x**2]))
+        
+        result = gradient_at("x + 2*y", ["x", "y"], points)
+        assert result.shape == (3, 2)
+        assert np.allclose(result, [[1.0, 2.0]] * 3)
+        assert gradient_at("x + 2*y", ["x", "y"], [1.0, 1.0]).shape == (2,)
+        assert np.allclose(gradient_at("x*y", ["x", "y"], [2.0, 5.0]), [5.0, 2.0])
+        
+        with pytest.raises(ValidationError):
+            gradient_at("x*y", ["x", "y"], np.zeros((3, 3)))
+    
     def test_gradient_invalid_variables(self):
         """Test gradient with invalid variables."""
         with pytest.raises(ValidationError):
@@ -192,6 +309,22 @@ class TestNumericalMethods:
         result = numerical_derivative(f, 2)
         assert abs(result - 4) < 1e-6
     
+    def test_numerical_derivative_accuracy(self):
+        """Test extrapolated derivatives of scalar and vectorized callables."""
+        assert abs(numerical_derivative(math.sin, 1.0) - math.cos(1.0)) < 1e-10
+        assert abs(numerical_derivative(np.exp, 0.5) - math.exp(0.5)) < 1e-10
+        assert abs(numerical_derivative(lambda t: t**3, 2) - 12) < 1e-10
+    
+    def test_numerical_derivative_one_sided(self):
+        """Test fallback when the function is undefined below the point."""
+        def f(x):
+            if x < 1:
+                raise ValueError("math domain error")
+            return math.exp(x)
+        
+        result = numerical_derivative(f, 1.0)
+        assert abs(result - math.e) < 1e-7
+    
     def test_numerical_derivative_invalid_function(self):
         """Test numerical derivative with invalid function."""
         with pytest.raises(ValidationError):
@@ -226,6 +359,66 @@ class TestNumericalMethods:
         result = numerical_integral(f, 0, 1, method='midpoint', n=1000)
         assert abs(result - 1/3) < 1e-4
     
+    def test_numerical_integral_scalar_only_function(self):
+        """Test integration of callables that cannot take arrays."""
+        def f(x):
+            return math.sin(x) if x > 0 else 0.0
+        
+        for method in ('simpson', 'trapezoidal', 'midpoint'):
+            result = numerical_integral(f, 0, math.pi, method=method, n=1001)
+            assert abs(result - 2) < 1e-4
+    
+    def test_numerical_integral_large_scalar_grid(self):
+        """Test that large grids of scalar-only callables stay accurate."""
+        def f(x):
+            return math.exp(x) if x >= 0 else 0.0
+        
+        for jit in (False, True):
+            result = numerical_integral(f, 0, 1, method='simpson', n=100000, jit=jit)
+            assert abs(result - (math.e - 1)) < 1e-10
+            
+            result = numerical_integral(f, 0, 1, method='midpoint', n=100000, jit=jit)
+            assert abs(result - (math.e - 1)) < 1e-9
+    
+    def test_numerical_integral_sees_rebound_variables(self):
+        """Test that without jit each call uses the current closure values."""
+        scale = 3.0
+        
+        def f(x):
+            return scale * x if x >= 0 else 0.0
+        
+        assert abs(numerical_integral(f, 0, 1, n=100000) - 1.5) < 1e-9
+        scale = 5.0
+        assert abs(numerical_integral(f, 0, 1, n=100000) - 2.5) < 1e-9
+        assert abs(numerical_integral(f, 0, 1, n=1000) - 2.5) < 1e-9
+    
+    def test_numerical_integral_overflow_without_jit(self):
+        """Test that overflow in a scalar function raises CalculationError."""
+        def f(x):
+            return math.exp(1000 * x) if x >= 0 else 0.0
+        
+        with pytest.raises(CalculationError):
+            numerical_integral(f, 0, 1, n=100000)
+    
+    def test_numerical_integral_vectorized_function(self):
+        """Test integration of NumPy-aware callables."""
+        result = numerical_integral(np.exp, 0, 1, method='simpson', n=100)
+        assert abs(result - (math.e - 1)) < 1e-8
+        
+        result = numerical_integral(lambda x: 3.0, 0, 2, method='trapezoidal', n=10)
+        assert abs(result - 6) < 1e-12
+    
+    def test_numerical_integral_gauss_and_adaptive(self):
+        """Test Gauss-Legendre and adaptive quadrature."""
+        result = numerical_integral(math.sin, 0, math.pi, method='gauss', n=20)
+        assert abs(result - 2) < 1e-12
+        
+        result = numerical_integral(np.exp, 0, 1, method='gauss', n=10)
+        assert abs(result - (math.e - 1)) < 1e-12
+        
+        result = numerical_integral(lambda x: 1 / math.sqrt(x), 0, 1, method='adaptive')
+        assert abs(result - 2) < 1e-8
+    
     def test_numerical_integral_invalid_method(self):
         """Test numerical integration with invalid method."""
         def f(x):
@@ -251,5 +444,72 @@ class TestNumericalMethods:
             numerical_integral(f, 0, 1, n=-1)
 
 
+class TestCompileExpression:
+    """Test compilation of expressions into numerical functions."""
+    
+    def test_compile_expression_scalar_and_array(self):
+        """Test that compiled functions match direct evaluation."""
+        f = compile_expression("sin(x*y) + sin(x*y)**2 + x**2/3", ["x", "y"])
+        expected = math.sin(2) + math.sin(2)**2 + 1/3
+        assert abs(f(1.0, 2.0) - expected) < 1e-12
+        
+        xs = np.array([1.0, 2.0])
+        ys = np.array([2.0, 1.0])
+        assert np.allclose(f(xs, ys), [expected, expected + 1])
+    
+    def test_compile_expression_numpy_backend(self):
+        """Test the plain NumPy backend and result caching."""
+        f = compile_expression("x**2 + 1", ["x"], backend="numpy")
+        assert f(3) == 10
+        assert compile_expression("x**2 + 1", ["x"], backend="numpy") is f
+    
+    def test_compile_expression_c_backend(self):
+        """Test the C backend, which falls back to NumPy without a compiler."""
+        f = compile_expression("x**2*y + 3", ["x", "y"], backend="c")
+        xs = np.linspace(0, 1, 5)
+        assert np.allclose(f(xs, 2.0), xs**2 * 2 + 3)
+    
+    def test_compile_expression_invalid_inputs(self):
+        """Test compilation with invalid inputs."""
+        with pytest.raises(ValidationError):
+            compile_expression("x**2", [])
+        
+        with pytest.raises(ValidationError):
+            compile_expression("x**2", ["x"], backend="invalid")
+
+
+class TestCaching:
+    """Test memoization of parsed expressions and symbolic results."""
+    
+    def test_repeated_calls_reuse_results(self):
+        """Test that identical symbolic queries return the cached result."""
+        first = differentiate("x**3 + sin(x)", "x")
+        second = differentiate("x**3 + sin(x)", "x")
+        assert first is second
+        
+        first = integrate_indefinite("x**2", "x")
+        assert integrate_indefinite("x**2", "x") is first
+    
+    def test_clear_caches(self):
+        """Test that clearing the caches keeps results correct."""
+        first = partial_derivative("x**2*y", "y")
+        clear_caches()
+        second = partial_derivative("x**2*y", "y")
+        assert second == first
+        assert str(second) == "x**2"
+    
+    def test_periodic_sympy_cache_clear(self, monkeypatch):
+        """Test that SymPy's cache is cleared every N symbolic calls."""
+        import mathgenius.advanced.calculus as calculus
+        cleared = []
+        monkeypatch.setattr(calculus, "_CLEAR_CACHE_EVERY", 3)
+        monkeypatch.setattr(calculus, "_CALL_COUNT", 0)
+        monkeypatch.setattr(sp.core.cache, "clear_cache", lambda: cleared.append(1))
+        
+        for _ in range(7):
+            assert str(differentiate("x**2", "x")) == "2*x"
+        assert len(cleared) == 2
+
+
 if __name__ == "__main__":
     pytest.main([__file__])
@@ -3,7 +3,9 @@ import pytest
 import numpy as np
 from mathgenius.advanced.linear_algebra import (
     matrix_add, matrix_multiply, matrix_transpose, matrix_inverse,
-    matrix_determinant, eigenvalues_eigenvectors, solve_linear_system,
+    matrix_determinant, matrix_determinant_batched, matrix_inverse_batched,
+    eigenvalues_eigenvectors, solve_linear_system,
+    solve_linear_system_batched,
     matrix_rank, matrix_nullspace, lu_decomposition, qr_decomposition,
     svd_decomposition, vector_norm, matrix_condition_number, matrix_trace,
     vector_projection
@@ -51,6 +53,12 @@ class TestMatrixOperations:
         expected = np.array([[1, 4], [2, 5], [3, 6]])
         np.testing.assert_array_equal(result, expected)
     
+    def test_ndarray_inputs_are_not_copied(self):
+        """Test that ndarray inputs are used without a copy."""
+        a = np.arange(6.0).reshape(2, 3)
+        assert np.shares_memory(matrix_transpose(a), a)
+        np.testing.assert_array_equal(matrix_add(a, a), 2 * a)
+    
     def test_matrix_transpose_invalid_input(self):
         """Test matrix transpose with invalid input."""
         with pytest.raises(ValidationError):
@@ -106,6 +114,13 @@ class TestMatrixProperties:
         result = matrix_rank(a)
         expected = 1
         assert result == expected
+    
+    def test_matrix_rank_low_rank_product(self):
+        """Test rank of a product of thin random factors and of zeros."""
+        rng = np.random.default_rng(0)
+        a = rng.random((50, 5)) @ rng.random((5, 40))
+        assert matrix_rank(a) == 5
+        assert matrix_rank(np.zeros((3, 2))) == 0
 
 
 class TestMatrixInverse:
@@ -126,6 +141,46 @@ class TestMatrixInverse:
         with pytest.raises(CalculationError):
             matrix_inverse(a)
     
+    def test_matrix_inverse_small_scale(self):
+        """Test that a well-conditioned matrix with a tiny determinant inverts."""
+        a = 1e-8 * np.eye(3)
+        np.testing.assert_allclose(matrix_inverse(a), 1e8 * np.eye(3))
+    
+    def test_matrix_inverse_relative_singularity(self):
+        """Test that singularity is judged relative to the matrix's scale."""
+        a = 1e-15 * np.array([[2.0, 1.0], [1.0, 2.0]])
+        np.testing.assert_allclose(matrix_inverse(a) @ a, np.eye(2), atol=1e-12)
+        with pytest.raises(CalculationError):
+            matrix_inverse([[1e10, 1e10], [1e10, np.nextafter(1e10, np.inf)]])
+        assert matrix_inverse(np.empty((0, 0))).shape == (0, 0)
+    
+    @pytest.mark.parametrize("a", [
+        [[2, 0, 0], [0, 4, 0], [0, 0, -5]],
+        [[2, 1, 3], [0, 4, 1], [0, 0, -5]],
+        [[2, 0, 0], [1, 4, 0], [3, 1, -5]],
+    ])
+    def test_matrix_inverse_structured(self, a):
+        """Test inversion of diagonal and triangular matrices."""
+        result = matrix_inverse(a)
+        np.testing.assert_array_almost_equal(np.dot(a, result), np.eye(3))
+    
+    def test_matrix_inverse_scaled_structured(self):
+        """Test that tiny-scaled diagonal and triangular matrices invert."""
+        np.testing.assert_allclose(matrix_inverse(1e-15 * np.eye(3)), 1e15 * np.eye(3))
+        a = 1e-15 * np.array([[2.0, 1.0], [0.0, 4.0]])
+        np.testing.assert_allclose(matrix_inverse(a) @ a, np.eye(2), atol=1e-12)
+    
+    def test_matrix_inverse_singular_triangular(self):
+        """Test inversion of a triangular matrix with a zero on its diagonal."""
+        with pytest.raises(CalculationError):
+            matrix_inverse([[1, 2], [0, 0]])
+    
+    def test_matrix_inverse_singular_keeps_cause(self):
+        """Test that LAPACK failures are chained to the CalculationError."""
+        with pytest.raises(CalculationError) as exc_info:
+            matrix_inverse_batched([[[0, 0], [0, 0]]])
+        assert isinstance(exc_info.value.__cause__, np.linalg.LinAlgError)
+    
     def test_matrix_inverse_non_square(self):
         """Test inversion of non-square matrix."""
         a = [[1, 2, 3], [4, 5, 6]]
@@ -133,6 +188,33 @@ class TestMatrixInverse:
             matrix_inverse(a)
 
 
+class TestBatchedMatrices:
+    """Test determinants and inverses of matrix stacks."""
+    
+    def test_matrix_determinant_batched(self):
+        """Test determinants of a stack of matrices."""
+        stack = [[[1, 2], [3, 4]], [[2, 0], [0, 3]]]
+        np.testing.assert_array_almost_equal(matrix_determinant_batched(stack), [-2, 6])
+    
+    def test_matrix_inverse_batched(self):
+        """Test inverses of a stack of matrices."""
+        stack = np.array([[[1.0, 2.0], [3.0, 4.0]], [[2.0, 0.0], [0.0, 3.0]]])
+        result = matrix_inverse_batched(stack)
+        np.testing.assert_array_almost_equal(stack @ result, np.broadcast_to(np.eye(2), (2, 2, 2)))
+    
+    def test_matrix_inverse_batched_singular(self):
+        """Test that a singular matrix in the stack is reported."""
+        with pytest.raises(CalculationError):
+            matrix_inverse_batched([[[1, 2], [2, 4]]])
+    
+    def test_batched_invalid_stack(self):
+        """Test stacks of the wrong shape."""
+        with pytest.raises(ValidationError):
+            matrix_determinant_batched([[1, 2], [3, 4]])
+        with pytest.raises(ValidationError):
+            matrix_inverse_batched([[[1, 2, 3], [4, 5, 6]]])
+
+
 class TestEigenvalues:
     """Test eigenvalue and eigenvector calculations."""
     
@@ -152,6 +234,23 @@ class TestEigenvalues:
             rhs = eigenvals[i] * v
             np.testing.assert_array_almost_equal(lhs, rhs)
     
+    def test_eigenvalues_eigenvectors_symmetric(self):
+        """Test that symmetric matrices get real, sorted eigenvalues."""
+        eigenvals, eigenvecs = eigenvalues_eigenvectors([[2, 1], [1, 2]])
+        assert np.isrealobj(eigenvals)
+        np.testing.assert_array_almost_equal(eigenvals, [1, 3])
+        np.testing.assert_array_almost_equal(eigenvecs.T @ eigenvecs, np.eye(2))
+    
+    def test_eigenvalues_eigenvectors_nonsymmetric(self):
+        """Test a non-symmetric matrix with complex eigenvalues."""
+        eigenvals, _ = eigenvalues_eigenvectors([[0, -1], [1, 0]])
+        np.testing.assert_array_almost_equal(sorted(eigenvals.imag), [-1, 1])
+    
+    def test_eigenvalues_eigenvectors_small_scale_nonsymmetric(self):
+        """Test that a tiny non-symmetric matrix is not treated as Hermitian."""
+        eigenvals, _ = eigenvalues_eigenvectors([[0, 9e-13], [1e-13, 0]])
+        np.testing.assert_allclose(sorted(eigenvals.real), [-3e-13, 3e-13], rtol=1e-12)
+    
     def test_eigenvalues_eigenvectors_non_square(self):
         """Test eigenvalues with non-square matrix."""
         a = [[1, 2, 3], [4, 5, 6]]
@@ -183,6 +282,43 @@ class TestLinearSystems:
         # Should find least squares solution
         assert len(result) == 2
     
+    def test_solve_linear_system_reuses_factorization(self):
+        """Test that repeated solves with the same matrix reuse its LU factors."""
+        from mathgenius.advanced.linear_algebra import _cached_lu_factor
+        _cached_lu_factor.cache_clear()
+        a = [[4.0, 1.0], [1.0, 3.0]]
+        for b in ([1.0, 2.0], [0.0, 1.0], [5.0, -1.0]):
+            np.testing.assert_array_almost_equal(np.dot(a, solve_linear_system(a, b)), b)
+        assert _cached_lu_factor.cache_info().hits == 2
+    
+    def test_solve_linear_system_scaled(self):
+        """Test that a well-conditioned but tiny-scaled system is not called singular."""
+        x = solve_linear_system(1e-15 * np.eye(3), [1e-15, 2e-15, 3e-15])
+        np.testing.assert_array_almost_equal(x, [1.0, 2.0, 3.0])
+    
+    def test_solve_linear_system_large_matrix_not_cached(self):
+        """Test that matrices above the cache size limit are factorized directly."""
+        from mathgenius.advanced.linear_algebra import _cached_lu_factor
+        _cached_lu_factor.cache_clear()
+        a = np.eye(400) * 2.0
+        np.testing.assert_array_almost_equal(solve_linear_system(a, np.ones(400)), np.full(400, 0.5))
+        assert _cached_lu_factor.cache_info().currsize == 0
+    
+    def test_solve_linear_system_singular(self):
+        """Test solving a singular system."""
+        with pytest.raises(CalculationError):
+            solve_linear_system([[1, 2], [2, 4]], [1, 2])
+    
+    def test_solve_linear_system_batched(self):
+        """Test solving for several right-hand sides at once."""
+        a = [[4.0, 1.0], [1.0, 3.0]]
+        b = [[1.0, 0.0, 5.0], [2.0, 1.0, -1.0]]
+        x = solve_linear_system_batched(a, b)
+        assert x.shape == (2, 3)
+        np.testing.assert_array_almost_equal(np.dot(a, x), b)
+        with pytest.raises(ValidationError):
+            solve_linear_system_batched(a, [1.0, 2.0])
+    
     def test_solve_linear_system_incompatible_dimensions(self):
         """Test solving system with incompatible dimensions."""
         a = [[1, 2], [3, 4]]
@@ -227,7 +363,62 @@ class TestMatrixDecompositions:
         s_matrix = np.diag(s)
         reconstructed = matrix_multiply(matrix_multiply(u, s_matrix), vt)
         np.testing.assert_array_almost_equal(reconstructed, a)
+    
+    def test_svd_decomposition_tall(self):
+        """Test that tall matrices get the reduced SVD by default."""
+        a = np.arange(12.0).reshape(6, 2)
+        u, s, vt = svd_decomposition(a)
+        assert u.shape == (6, 2)
+        np.testing.assert_array_almost_equal(u @ np.diag(s) @ vt, a)
+        assert svd_decomposition(a, full_matrices=True)[0].shape == (6, 6)
+    
+    def test_ndarray_inputs_are_not_overwritten(self):
+        """Test that LAPACK calls leave the caller's arrays intact."""
+        a = np.array([[4.0, 1.0], [1.0, 3.0]])
+        b = np.array([1.0, 2.0])
+        original = a.copy()
+        for func in (matrix_inverse, matrix_determinant, eigenvalues_eigenvectors,
+                     lu_decomposition, qr_decomposition, svd_decomposition, matrix_nullspace):
+            func(a)
+        solve_linear_system(a, b)
+        np.testing.assert_array_equal(a, original)
+        np.testing.assert_array_equal(b, [1.0, 2.0])
+    
+    def test_array_like_views_are_not_overwritten(self):
+        """Test that inputs np.asarray only views (np.matrix, memoryview) stay intact."""
+        data = np.array([[4.0, 3.0], [6.0, 3.0]])
+        for wrap in (np.matrix, memoryview):
+            a = data.copy()
+            for func in (matrix_inverse, matrix_determinant, eigenvalues_eigenvectors,
+                         matrix_rank, lu_decomposition, qr_decomposition, svd_decomposition,
+                         matrix_nullspace):
+                func(wrap(a))
+            solve_linear_system_batched(wrap(a), wrap(a))
+            np.testing.assert_array_equal(a, data)
+    
+    def test_non_finite_inputs_rejected(self):
+        """Test that infs and NaNs raise CalculationError instead of reaching LAPACK."""
+        a = [[1.0, np.nan], [2.0, 3.0]]
+        for func in (matrix_inverse, matrix_determinant, eigenvalues_eigenvectors,
+                     matrix_rank, lu_decomposition, qr_decomposition, svd_decomposition,
+                     matrix_nullspace):
+            with pytest.raises(CalculationError):
+                func(a)
+        with pytest.raises(CalculationError):
+            matrix_inverse([[1.0, 0.0], [0.0, np.inf]])
+        with pytest.raises(CalculationError):
+            solve_linear_system([[1.0, 0.0], [0.0, 1.0]], [1.0, np.nan])
 
+    
+    def test_float32_computation(self):
+        """Test that dtype=np.float32 computes and returns single precision."""
+        a = [[4, 1], [1, 3]]
+        assert matrix_multiply(a, a, dtype=np.float32).dtype == np.float32
+        inverse = matrix_inverse(a, dtype=np.float32)
+        assert inverse.dtype == np.float32
+        np.testing.assert_allclose(np.dot(a, inverse), np.eye(2), atol=1e-6)
+        assert all(f.dtype == np.float32 for f in qr_decomposition(a, dtype=np.float32))
+        assert all(f.dtype == np.float32 for f in svd_decomposition(a, dtype=np.float32))
 
 class TestVectorOperations:
     """Test vector operations."""
@@ -258,6 +449,19 @@ class TestVectorOperations:
         expected = 3  # max(|1|, |2|, |3|) = 3
         assert abs(result - expected) < 1e-10
     
+    @pytest.mark.parametrize("ord", [1, 2, np.inf, 3])
+    def test_vector_norm_float_orders(self, ord):
+        """Test float vector norms against NumPy, including huge entries."""
+        for v in (np.array([-3.0, 1.5, 2.0]), np.linspace(-1.0, 1.0, 5000)):
+            assert vector_norm(v, ord=ord) == pytest.approx(np.linalg.norm(v, ord=ord))
+        assert vector_norm([3e200, 4e200], ord=2) == pytest.approx(5e200)
+    
+    @pytest.mark.parametrize("ord", [1, 2, np.inf])
+    def test_vector_norm_empty(self, ord):
+        """Test that empty vectors have zero norm, as with np.linalg.norm."""
+        assert vector_norm(np.array([], dtype=np.float64), ord=ord) == 0.0
+        assert vector_norm([], ord=ord) == 0.0
+    
     def test_vector_norm_invalid_input(self):
         """Test vector norm with invalid input."""
         with pytest.raises(ValidationError):
@@ -271,12 +475,28 @@ class TestVectorOperations:
         expected = np.array([1, 0])  # Projection of [1,2] onto [3,0] = [1,0]
         np.testing.assert_array_almost_equal(result, expected)
     
+    @pytest.mark.parametrize("dtype", [np.float32, np.float64])
+    def test_vector_projection_float_kernel(self, dtype):
+        """Test that small float vectors (numba kernel when installed) keep their dtype."""
+        a = np.array([1, 2, 3], dtype=dtype)
+        b = np.array([0, 1, 1], dtype=dtype)
+        result = vector_projection(a, b)
+        assert result.dtype == dtype
+        np.testing.assert_array_almost_equal(result, [0, 2.5, 2.5])
+    
     def test_vector_projection_zero_vector(self):
         """Test projection onto zero vector."""
         a = [1, 2]
         b = [0, 0]
         with pytest.raises(CalculationError):
             vector_projection(a, b)
+        with pytest.raises(CalculationError):
+            vector_projection(np.array([1.0, 2.0]), np.zeros(2))
+    
+    def test_vector_projection_small_vector(self):
+        """Test projection onto a short but nonzero vector."""
+        result = vector_projection([1.0, 2.0], [1e-9, 0.0])
+        np.testing.assert_array_almost_equal(result, [1.0, 0.0])
     
     def test_vector_projection_incompatible_dimensions(self):
         """Test projection with incompatible dimensions."""
@@ -327,6 +547,21 @@ class TestMatrixNullspace:
         
         # Full rank matrix should have trivial null space
         assert result.shape[1] == 0
+    
+    @pytest.mark.parametrize("a", [
+        [[1, 2, 3], [2, 4, 6]],
+        [[1, 2], [2, 4], [3, 6]],
+        [[1, 0, 1, 0], [0, 1, 0, 1]],
+        [[0, 0, 0]],
+        [[1j, 1], [1, -1j]],
+    ])
+    def test_matrix_nullspace_orthonormal_basis(self, a):
+        """Test that the null space basis is orthonormal and complete."""
+        result = matrix_nullspace(a)
+        a = np.asarray(a)
+        assert result.shape == (a.shape[1], a.shape[1] - np.linalg.matrix_rank(a))
+        np.testing.assert_array_almost_equal(a @ result, 0)
+        np.testing.assert_array_almost_equal(result.conj().T @ result, np.eye(result.shape[1]))
 
 
 if __name__ == "__main__":
@@ -3,7 +3,7 @@ import pytest
 import numpy as np
 from mathgenius.advanced.statistics import (
     mean, median, mode, variance, standard_deviation,
-    correlation_coefficient, covariance, normal_distribution_pdf,
+    correlation_coefficient, correlation_matrix, covariance, normal_distribution_pdf,
     normal_distribution_cdf, binomial_distribution_pmf, poisson_distribution_pmf,
     t_test_one_sample, t_test_two_sample, chi_square_test, linear_regression,
     confidence_interval, z_score, percentile
@@ -26,6 +26,20 @@ class TestDescriptiveStatistics:
         with pytest.raises(ValidationError):
             mean([])
     
+    def test_mean_non_numeric_keeps_cause(self):
+        """Test that numpy failures are chained to the CalculationError."""
+        with pytest.raises(CalculationError) as exc_info:
+            mean(['a', 'b'])
+        assert isinstance(exc_info.value.__cause__, TypeError)
+    
+    def test_import_does_not_load_scipy_stats(self):
+        """Test that importing the module leaves scipy.stats unloaded."""
+        import subprocess
+        import sys
+        code = "import sys, mathgenius.advanced.statistics; print('scipy.stats' in sys.modules)"
+        output = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, check=True)
+        assert output.stdout.strip() == 'False'
+    
     def test_median_basic(self):
         """Test median calculation."""
         # Odd number of elements
@@ -57,6 +71,18 @@ class TestDescriptiveStatistics:
         with pytest.raises(ValidationError):
             mode([])
     
+    def test_mode_integer_data(self):
+        """Test mode of integer data, including negative, tied and wide-range values."""
+        from scipy import stats
+        data = np.random.default_rng(5).integers(-50, 50, 10000)
+        assert mode(data) == float(stats.mode(data).mode)
+        assert mode([3, 1, 1, 3]) == 1.0
+        assert mode([-5, -5, 7]) == -5.0
+        assert mode([2**62, -2**62, 5, 5]) == 5.0
+        assert mode(np.array([-100, 100, 100, 5], dtype=np.int8)) == 100.0
+        assert mode(np.array([-30000, 30000, 30000], dtype=np.int16)) == 30000.0
+        assert mode(np.array([7, 3, 7], dtype=np.uint64)) == 7.0
+    
     def test_variance_basic(self):
         """Test variance calculation."""
         data = [1, 2, 3, 4, 5]
@@ -90,6 +116,38 @@ class TestDescriptiveStatistics:
         """Test standard deviation with empty data."""
         with pytest.raises(ValidationError):
             standard_deviation([])
+    
+    def test_variance_standard_deviation_match_numpy(self):
+        """Test variance and standard deviation against numpy, including offset and complex data."""
+        rng = np.random.default_rng(0)
+        data = rng.random(1000) + 1e6
+        for ddof in (0, 1):
+            assert abs(variance(data, ddof=ddof) - np.var(data, ddof=ddof)) < 1e-12
+            assert abs(standard_deviation(data, ddof=ddof) - np.std(data, ddof=ddof)) < 1e-12
+        assert variance(np.arange(10).reshape(2, 5)) == np.var(np.arange(10), ddof=1)
+        assert abs(variance([1 + 1j, 2, 3]) - np.var([1 + 1j, 2, 3], ddof=1)) < 1e-12
+    
+    def test_inputs_are_not_copied(self):
+        """Test that float64 arrays are used in place and other real data is promoted."""
+        from mathgenius.advanced.statistics import _asarray
+        data = np.arange(5, dtype=np.float64)
+        assert _asarray(data) is data
+        assert _asarray([1, 2, 3]).dtype == np.float64
+        assert _asarray(np.ones(3, dtype=np.float32)).dtype == np.float64
+        assert _asarray([1j, 2]).dtype == np.complex128
+    
+    def test_statistics_along_axis(self):
+        """Test reducing a stack of datasets along an axis."""
+        stack = np.random.default_rng(3).random((4, 6))
+        assert np.allclose(mean(stack, axis=1), stack.mean(axis=1))
+        assert np.allclose(median(stack, axis=0), np.median(stack, axis=0))
+        assert np.allclose(variance(stack, axis=1), stack.var(axis=1, ddof=1))
+        assert np.allclose(standard_deviation(stack, ddof=0, axis=-1), stack.std(axis=1))
+        
+        with pytest.raises(ValidationError):
+            mean(stack, axis=2)
+        with pytest.raises(ValidationError):
+            variance(np.ones((5, 1)), axis=1)
 
 
 class TestCorrelationCovariance:
@@ -134,6 +192,38 @@ class TestCorrelationCovariance:
         # Should be positive (positive relationship)
         assert result > 0
     
+    def test_correlation_covariance_match_numpy(self):
+        """Test correlation and covariance against np.corrcoef and np.cov."""
+        rng = np.random.default_rng(1)
+        x = rng.random(1000)
+        y = 0.3 * x + rng.random(1000)
+        assert correlation_coefficient(x, y) == pytest.approx(np.corrcoef(x, y)[0, 1], rel=1e-12)
+        for ddof in (0, 1):
+            assert covariance(x, y, ddof=ddof) == pytest.approx(np.cov(x, y, ddof=ddof)[0, 1], rel=1e-12)
+    
+    def test_correlation_covariance_large_offset_data(self):
+        """Test large inputs (parallel numba reduction when available) on offset data."""
+        rng = np.random.default_rng(9)
+        x = rng.random(200000) + 1e6
+        y = 0.5 * x + rng.random(200000)
+        assert correlation_coefficient(x, y) == pytest.approx(np.corrcoef(x, y)[0, 1], rel=1e-9)
+        assert covariance(x, y) == pytest.approx(np.cov(x, y)[0, 1], rel=1e-9)
+    
+    def test_correlation_matrix(self):
+        """Test the correlation matrix against np.corrcoef."""
+        rng = np.random.default_rng(10)
+        data = rng.random((500, 4))
+        data[:, 1] += 2 * data[:, 0]
+        result = correlation_matrix(data)
+        assert result.shape == (4, 4)
+        assert np.allclose(result, np.corrcoef(data, rowvar=False), rtol=1e-12)
+        assert result[0, 1] == pytest.approx(correlation_coefficient(data[:, 0], data[:, 1]), rel=1e-12)
+        
+        with pytest.raises(ValidationError):
+            correlation_matrix([1, 2, 3])
+        with pytest.raises(ValidationError):
+            correlation_matrix([[1, 2]])
+    
     def test_covariance_mismatched_size(self):
         """Test covariance with mismatched data sizes."""
         x = [1, 2, 3]
@@ -215,6 +305,28 @@ class TestProbabilityDistributions:
         
         with pytest.raises(ValidationError):
             poisson_distribution_pmf(2, -1)
+    
+    def test_normal_distribution_arrays(self):
+        """Test the normal PDF and CDF on arrays against scipy."""
+        from scipy import stats
+        x = np.linspace(-10, 12, 101)
+        assert np.allclose(normal_distribution_pdf(x, mean=1, std=2), stats.norm.pdf(x, 1, 2), rtol=1e-12)
+        assert np.allclose(normal_distribution_cdf(x, mean=1, std=2), stats.norm.cdf(x, 1, 2), rtol=1e-12)
+        assert np.allclose(normal_distribution_cdf([0, 1]), [0.5, stats.norm.cdf(1)])
+        
+        with pytest.raises(ValidationError):
+            normal_distribution_pdf(['a'])
+    
+    def test_distributions_match_scipy(self):
+        """Test the closed-form distributions against scipy.stats."""
+        from scipy import stats
+        for x in (-40.0, -3.5, 0.0, 0.7, 12.0):
+            assert normal_distribution_pdf(x, 0.5, 1.3) == pytest.approx(stats.norm.pdf(x, 0.5, 1.3), rel=1e-12)
+            assert normal_distribution_cdf(x, 0.5, 1.3) == pytest.approx(stats.norm.cdf(x, 0.5, 1.3), rel=1e-12)
+        for k, n, p in ((0, 10, 0.3), (7, 10, 0.3), (10, 10, 0.3), (480, 1000, 0.5), (3, 5, 0.0), (5, 5, 1.0)):
+            assert binomial_distribution_pmf(k, n, p) == pytest.approx(stats.binom.pmf(k, n, p), rel=1e-10)
+        for k, mu in ((0, 0.1), (3, 2.5), (95, 100.0), (2000, 1500.0)):
+            assert poisson_distribution_pmf(k, mu) == pytest.approx(stats.poisson.pmf(k, mu), rel=1e-10)
 
 
 class TestHypothesisTesting:
@@ -269,6 +381,29 @@ class TestHypothesisTesting:
         # Should reject null hypothesis (means are different)
         assert result['reject_null'] == True
     
+    def test_t_tests_match_scipy(self):
+        """Test one- and two-sample t-tests against scipy, including constant data."""
+        from scipy import stats
+        rng = np.random.default_rng(7)
+        a = rng.normal(size=20)
+        b = rng.normal(0.5, 2, size=35)
+        
+        result = t_test_one_sample(a, 0.3)
+        expected = stats.ttest_1samp(a, 0.3)
+        assert result['t_statistic'] == pytest.approx(expected.statistic, rel=1e-12)
+        assert result['p_value'] == pytest.approx(expected.pvalue, rel=1e-12)
+        
+        for equal_var in (True, False):
+            result = t_test_two_sample(a, b, equal_var=equal_var)
+            expected = stats.ttest_ind(a, b, equal_var=equal_var)
+            assert result['t_statistic'] == pytest.approx(expected.statistic, rel=1e-12)
+            assert result['p_value'] == pytest.approx(expected.pvalue, rel=1e-12)
+        
+        result = t_test_one_sample([1, 1, 1], 0)
+        assert result['t_statistic'] == np.inf
+        assert result['reject_null']
+        assert t_test_two_sample([1, 1], [2, 2], equal_var=False)['p_value'] == 0.0
+    
     def test_t_test_two_sample_insufficient_data(self):
         """Test two-sample t-test with insufficient data."""
         with pytest.raises(ValidationError):
@@ -291,6 +426,16 @@ class TestHypothesisTesting:
         assert 'reject_null' in result
         assert 'conclusion' in result
     
+    def test_chi_square_test_uniform_matches_scipy(self):
+        """Test the uniform-expectation chi-square test against scipy."""
+        from scipy import stats
+        rng = np.random.default_rng(8)
+        for observed in (rng.integers(0, 100, 50), rng.integers(10**8, 10**8 + 100, 1000)):
+            result = chi_square_test(observed)
+            expected = stats.chisquare(observed)
+            assert result['chi2_statistic'] == pytest.approx(expected.statistic, rel=1e-9)
+            assert result['p_value'] == pytest.approx(expected.pvalue, rel=1e-9)
+    
     def test_chi_square_test_invalid_frequencies(self):
         """Test chi-square test with invalid frequencies."""
         # Negative observed frequencies
@@ -341,6 +486,36 @@ class TestRegression:
         """Test linear regression with mismatched sizes."""
         with pytest.raises(ValidationError):
             linear_regression([1, 2, 3], [4, 5])
+    
+    def test_linear_regression_matches_polyfit(self):
+        """Test linear regression against np.polyfit on noisy data."""
+        rng = np.random.default_rng(2)
+        x = rng.random(200)
+        y = 3 * x - 1 + rng.normal(scale=0.1, size=200)
+        result = linear_regression(x, y)
+        slope, intercept = np.polyfit(x, y, 1)
+        assert result['slope'] == pytest.approx(slope, rel=1e-10)
+        assert result['intercept'] == pytest.approx(intercept, rel=1e-10)
+        assert result['r_squared'] == pytest.approx(np.corrcoef(x, y)[0, 1] ** 2, rel=1e-10)
+    
+    def test_linear_regression_constant_data(self):
+        """Test linear regression when x or y is constant."""
+        result = linear_regression([2, 2, 2], [1, 2, 3])
+        assert result['slope'] == 0.0
+        assert result['intercept'] == 2.0
+        
+        result = linear_regression([1, 2, 3], [4, 4, 4])
+        assert result['slope'] == 0.0
+        assert result['r_squared'] == 1.0
+    
+    def test_linear_regression_arrays_and_residuals(self):
+        """Test that predictions and residuals are arrays and residuals are optional."""
+        x = np.array([1.0, 2.0, 3.0, 4.0])
+        y = np.array([2.0, 4.5, 5.5, 8.0])
+        result = linear_regression(x, y)
+        assert isinstance(result['predictions'], np.ndarray)
+        assert np.allclose(result['residuals'], y - result['predictions'])
+        assert 'residuals' not in linear_regression(x, y, return_residuals=False)
 
 
 class TestConfidenceInterval:
@@ -365,6 +540,20 @@ class TestConfidenceInterval:
         # Confidence interval should contain the mean
         assert result['lower_bound'] <= result['mean'] <= result['upper_bound']
     
+    def test_confidence_interval_matches_scipy(self):
+        """Test confidence interval against scipy and reuse of the critical value."""
+        from scipy import stats
+        from mathgenius.advanced.statistics import _t_critical
+        data = np.random.default_rng(6).random(30)
+        result = confidence_interval(data, confidence_level=0.9)
+        lower, upper = stats.t.interval(0.9, 29, loc=data.mean(), scale=stats.sem(data))
+        assert result['lower_bound'] == pytest.approx(lower, rel=1e-12)
+        assert result['upper_bound'] == pytest.approx(upper, rel=1e-12)
+        
+        hits = _t_critical.cache_info().hits
+        confidence_interval(data[:30], confidence_level=0.9)
+        assert _t_critical.cache_info().hits == hits + 1
+    
     def test_confidence_interval_invalid_confidence_level(self):
         """Test confidence interval with invalid confidence level."""
         data = [1, 2, 3, 4, 5]
@@ -397,6 +586,22 @@ class TestZScore:
         
         with pytest.raises(ValidationError):
             z_score(5, 3, -1)
+    
+    def test_z_score_array(self):
+        """Test z-scores of an array of values."""
+        result = z_score([1, 3, 5], 3, 2)
+        assert isinstance(result, np.ndarray)
+        assert np.allclose(result, [-1.0, 0.0, 1.0])
+    
+    def test_z_score_per_row(self):
+        """Test z-scores of a stack of datasets against per-row statistics."""
+        stack = np.random.default_rng(4).random((3, 5))
+        result = z_score(stack, stack.mean(axis=1)[:, None], stack.std(axis=1)[:, None])
+        assert np.allclose(result.mean(axis=1), 0.0)
+        assert np.allclose(result.std(axis=1), 1.0)
+        
+        with pytest.raises(ValidationError):
+            z_score(stack, 0, np.zeros(5))
 
 
 class TestPercentile:
@@ -434,6 +639,15 @@ class TestPercentile:
         """Test percentile with empty data."""
         with pytest.raises(ValidationError):
             percentile([], 50)
+    
+    def test_percentile_multiple(self):
+        """Test several percentiles at once."""
+        data = np.random.default_rng(0).random(1001)
+        result = percentile(data, [0, 25, 50, 90, 100])
+        assert np.allclose(result, [percentile(data, q) for q in (0, 25, 50, 90, 100)])
+        
+        with pytest.raises(ValidationError):
+            percentile(data, [50, 101])
 
 
 if __name__ == "__main__":
@@ -1,12 +1,15 @@
 """Test suite for advanced symbolic mathematics operations."""
 import pytest
+import math
+import numpy as np
 import sympy as sp
 from mathgenius.advanced.symbolic import (
     parse_expression, create_symbol, expand_expression, factor_expression,
     simplify_expression, collect_terms, solve_equation, solve_differential_equation,
     substitute_expression, evaluate_expression, expression_to_latex,
     expression_to_string, symbolic_integrate, symbolic_differentiate,
-    symbolic_limit, symbolic_series, create_rational, is_polynomial
+    symbolic_limit, symbolic_series, create_rational, is_polynomial,
+    clear_symbolic_caches, CSEResult
 )
 from mathgenius.core.errors import ValidationError, CalculationError
 
@@ -27,6 +30,12 @@ class TestExpressionParsing:
         assert "sin(x)" in str(expr)
         assert "cos(x)" in str(expr)
     
+    def test_calculation_error_keeps_cause(self):
+        """Test that wrapped errors keep the original exception as their cause."""
+        with pytest.raises(CalculationError) as exc_info:
+            symbolic_limit("x", "x", "(")
+        assert exc_info.value.__cause__ is not None
+    
     def test_parse_expression_empty(self):
         """Test parsing empty expression."""
         with pytest.raises(ValidationError):
@@ -84,6 +93,13 @@ class TestExpressionManipulation:
         expected = x**2 + 2*x + 1
         assert result == expected
     
+    def test_expand_expression_empty(self):
+        """Test that empty input is rejected as a validation error."""
+        with pytest.raises(ValidationError):
+            expand_expression("")
+        with pytest.raises(ValidationError):
+            expand_expression("   ")
+    
     def test_factor_expression_basic(self):
         """Test basic expression factoring."""
         expr = "x**2 + 2*x + 1"
@@ -112,6 +128,17 @@ class TestExpressionManipulation:
         expected = "1"
         assert str(result) == expected
     
+    def test_simplify_expression_tiers(self):
+        """Test that each simplification tier keeps the simplest form."""
+        assert simplify_expression("(x + 1)**2") == "(x + 1)**2"
+        assert simplify_expression("(x**2 - 1)/(x - 1)") == "x + 1"
+        assert simplify_expression("1/x + 1/y") == "(x + y)/(x*y)"
+        assert simplify_expression("tan(x)*cos(x)") == "sin(x)"
+        assert simplify_expression("exp(x)*exp(y)") == "exp(x + y)"
+        assert simplify_expression("x*y + x*z") == "x*(y + z)"
+        assert simplify_expression("a*b + a*c + a*d") == "a*(b + c + d)"
+        assert simplify_expression("2*x + 2") == "2*x + 2"
+    
     def test_collect_terms_basic(self):
         """Test term collection."""
         expr = "x**2 + 2*x*y + y**2"
@@ -154,6 +181,16 @@ class TestEquationSolving:
         assert len(result) == 1
         assert result[0] == expected
     
+    def test_solve_equation_system_shared_subexpressions(self):
+        """Test a larger system whose parameters share a subexpression."""
+        equations = ["x + y + z - (a*b + 1)**2", "x - y - (a*b + 1)", "2*z - (a*b + 1)**2*x"]
+        result = solve_equation(equations, ["x", "y", "z"])
+        assert len(result) == 1
+        solution = sp.sympify(result[0])
+        expected = sp.solve(sp.sympify(equations), sp.symbols("x y z"))
+        for var, value in expected.items():
+            assert sp.simplify(solution[var] - value) == 0
+    
     def test_solve_equation_no_solution(self):
         """Test solving equation with no solution."""
         equation = "x + 1 - x"  # 1 = 0, no solution
@@ -221,6 +258,54 @@ class TestSubstitutionEvaluation:
         expected = 16.0
         assert abs(result - expected) < 1e-10
     
+    def test_evaluate_expression_symbolic_substitutions(self):
+        """Test evaluation with substitution values that are expressions."""
+        assert evaluate_expression("x + y", {"x": "pi", "y": 1}) == pytest.approx(math.pi + 1)
+        assert evaluate_expression("x*y", {"x": "sqrt(2)", "y": "sqrt(2)"}) == pytest.approx(2.0)
+    
+    def test_evaluate_expression_reuses_compiled_function(self):
+        """Test that numeric evaluation compiles each expression once."""
+        from mathgenius.advanced.symbolic import _cached_lambdify
+        _cached_lambdify.cache_clear()
+        for x in range(5):
+            assert evaluate_expression("x*y + sin(x)", {"x": x, "y": 2.5}) == pytest.approx(
+                x * 2.5 + math.sin(x))
+        assert _cached_lambdify.cache_info().misses == 1
+        assert evaluate_expression("besselj(0, x)", {"x": 1.0}) == pytest.approx(0.7651976865579666)
+    
+    def test_evaluate_expression_arrays(self):
+        """Test vectorized evaluation over array-valued substitutions."""
+        result = evaluate_expression("x**2 + y", {"x": [1, 2, 3], "y": 0.5})
+        assert isinstance(result, np.ndarray)
+        assert np.allclose(result, [1.5, 4.5, 9.5])
+        
+        xs = np.linspace(0, 1, 5)
+        assert np.allclose(evaluate_expression("sin(x)", {"x": xs}), np.sin(xs))
+        assert np.allclose(evaluate_expression("2", {"x": xs}), np.full(5, 2))
+        
+        with pytest.raises(ValidationError):
+            evaluate_expression("x*z", {"x": [1, 2]})
+    
+    def test_evaluate_expression_arrays_shared_subexpressions(self):
+        """Test vectorized evaluation of repeated subexpressions (eliminated once)."""
+        import inspect
+        from mathgenius.advanced.symbolic import _cached_lambdify
+        xs = np.linspace(0, 1, 50)
+        result = evaluate_expression("sin(x*y + 1)**2 + sqrt(sin(x*y + 1) + 2)", {"x": xs, "y": 2.0})
+        inner = np.sin(2 * xs + 1)
+        assert np.allclose(result, inner**2 + np.sqrt(inner + 2))
+        
+        func = _cached_lambdify(sp.sympify("sin(x*y + 1)**2 + sqrt(sin(x*y + 1) + 2)"), ("x", "y"), ("numpy",))
+        assert inspect.getsource(func).count("sin(") == 1
+    
+    def test_evaluate_expression_large(self):
+        """Test that expressions too large for a single lambdify still evaluate."""
+        x, y = sp.symbols("x y")
+        expr = sp.Add(*[k * x**k * y for k in range(1, 4001)])
+        result = evaluate_expression(expr, {"x": 0.999, "y": 2})
+        expected = sum(2 * k * 0.999**k for k in range(1, 4001))
+        assert result == pytest.approx(expected)
+    
     def test_evaluate_expression_complex(self):
         """Test evaluation resulting in complex number."""
         expr = "sqrt(-1)"
@@ -277,6 +362,19 @@ class TestSymbolicCalculus:
         expected = sp.Rational(1, 3)
         assert result == expected
     
+    def test_symbolic_integrate_cse_result(self):
+        """Test CSE-reduced integration results and their evaluation."""
+        result = symbolic_integrate("x**2*exp(2*x)*sin(3*x)", "x",
+                                    common_subexpression_elimination=True)
+        assert isinstance(result, CSEResult)
+        assert result.replacements
+        plain = symbolic_integrate("x**2*exp(2*x)*sin(3*x)", "x")
+        assert evaluate_expression(result, {"x": 0.7}) == pytest.approx(
+            evaluate_expression(plain, {"x": 0.7}))
+        
+        series = symbolic_series("exp(x)", "x", 0, 3, common_subexpression_elimination=True)
+        assert evaluate_expression(series, {"x": 1.0}) == pytest.approx(1 + 1 + 1/2 + 1/6)
+    
     def test_symbolic_integrate_invalid_limits(self):
         """Test integration with invalid limits."""
         expr = "x**2"
@@ -297,6 +395,21 @@ class TestSymbolicCalculus:
         expected = "12*x**2"
         assert str(result) == expected
     
+    def test_symengine_paths_match_sympy(self, monkeypatch):
+        """Test that SymEngine-backed expand and diff give SymPy's results."""
+        pytest.importorskip("symengine")
+        from mathgenius.advanced.symbolic import clear_symbolic_caches
+        expressions = ["(x + y)**3", "exp(x + y)", "(x + 1)**2/(x + y)", "sin(2*(x + y))"]
+        with_symengine = []
+        for expression in expressions:
+            with_symengine.append(expand_expression(expression))
+            assert with_symengine[-1] == str(sp.expand(sp.sympify(expression)))
+        monkeypatch.setenv("MATHGENIUS_USE_SYMENGINE", "0")
+        clear_symbolic_caches()
+        assert [expand_expression(e) for e in expressions] == with_symengine
+        assert symbolic_differentiate("sin(x)*x**3", "x", 2) == str(
+            sp.diff(sp.sympify("sin(x)*x**3"), sp.Symbol("x"), 2))
+    
     def test_symbolic_differentiate_invalid_order(self):
         """Test differentiation with invalid order."""
         expr = "x**2"
@@ -401,6 +514,181 @@ class TestPolynomialCheck:
         expr = "x**2 + y**2 + x*y"
         result = is_polynomial(expr)
         assert result == True
+    
+    def test_is_polynomial_multivariable_not_polynomial(self):
+        """Test multivariable expressions that are not polynomials."""
+        assert is_polynomial("x*y + sin(y)") == False
+        assert is_polynomial("x/y") == False
+        assert is_polynomial("x**y") == False
+    
+    def test_is_polynomial_is_cached(self):
+        """Test that polynomial checks are memoized per expression and variable."""
+        from mathgenius.advanced.symbolic import _is_polynomial_in
+        clear_symbolic_caches()
+        assert is_polynomial("x**2 + sin(y)", "x") == True
+        assert is_polynomial("x**2 + sin(y)", "y") == False
+        assert is_polynomial("x**2 + sin(y)", "x") == True
+        assert _is_polynomial_in.cache_info().hits == 1
+
+
+class TestCaching:
+    """Test memoization of parsed expressions."""
+    
+    def test_parse_is_cached(self):
+        """Test that repeated parses of a string reuse the parsed expression."""
+        from mathgenius.advanced.symbolic import _cached_parse
+        _cached_parse.cache_clear()
+        first = _cached_parse("x**2 + y")
+        assert _cached_parse("x**2 + y") is first
+        assert _cached_parse.cache_info().hits == 1
+        
+        assert symbolic_differentiate("x**2 + y", "x") == "2*x"
+    
+    def test_symbols_are_cached_per_assumptions(self):
+        """Test that symbol lookups are memoized per name and assumptions."""
+        from mathgenius.advanced.symbolic import _sym
+        assert _sym("x") is _sym("x")
+        positive = _sym("x", (("positive", True),))
+        assert positive.is_positive
+        assert positive != _sym("x")
+        assert create_symbol("z", {"positive": True, "integer": True}) == "z"
+    
+    def test_rewrite_results_are_cached(self):
+        """Test that expand, factor and simplify results survive cache clears."""
+        from mathgenius.advanced.symbolic import _cached_factor
+        clear_symbolic_caches()
+        assert factor_expression("x**2 - 4") == "(x - 2)*(x + 2)"
+        assert factor_expression("x**2 - 4") == "(x - 2)*(x + 2)"
+        assert _cached_factor.cache_info().hits == 1
+        
+        clear_symbolic_caches()
+        assert _cached_factor.cache_info().currsize == 0
+        assert expand_expression("(x + 1)**2") == "x**2 + 2*x + 1"
+        assert simplify_expression("sin(x)**2 + cos(x)**2") == "1"
+        assert symbolic_differentiate("x**2 + y", "x") == "2*x"
+    
+    def test_calculus_results_are_cached(self):
+        """Test that integrals, derivatives and series are memoized per exact arguments."""
+        from mathgenius.advanced.symbolic import _cached_integrate, _cached_diff, _cached_series
+        clear_symbolic_caches()
+        assert symbolic_integrate("x**2", "x", (0, 1)) == "1/3"
+        assert symbolic_integrate("x**2", "x", (0, 1)) == "1/3"
+        assert _cached_integrate.cache_info().hits == 1
+        # Float limits are a different key from the equal integers
+        assert symbolic_integrate("x**2", "x", (0.0, 1.0)) != "1/3"
+        
+        symbolic_differentiate("x**3", "x", 2)
+        assert symbolic_differentiate("x**3", "x", 2) == "6*x"
+        assert _cached_diff.cache_info().hits == 1
+        
+        symbolic_series("exp(x)", "x", 0, 3)
+        assert symbolic_series("exp(x)", "x", 0, 3) == symbolic_series("exp(x)", "x", 0, 3)
+        assert _cached_series.cache_info().hits == 2
+        
+        clear_symbolic_caches()
+        assert _cached_series.cache_info().currsize == 0
+    
+    def test_symengine_can_be_switched_off(self, monkeypatch):
+        """Test the SymEngine path and its MATHGENIUS_USE_SYMENGINE=0 switch."""
+        from mathgenius.advanced import symbolic
+        
+        # SymPy objects stand in for SymEngine's, which share their API
+        converted = []
+        
+        class StandInSymEngine:
+            @staticmethod
+            def sympify(value):
+                converted.append(value)
+                return value
+        
+        monkeypatch.setattr(symbolic, "_HAS_SYMENGINE", True)
+        monkeypatch.setattr(symbolic, "se", StandInSymEngine)
+        expr = sp.sympify("(x + 1)**2")
+        
+        monkeypatch.setenv("MATHGENIUS_USE_SYMENGINE", "0")
+        assert symbolic._symengine_apply(lambda e: e.expand(), expr) is None
+        assert not converted
+        
+        monkeypatch.delenv("MATHGENIUS_USE_SYMENGINE")
+        assert symbolic._symengine_apply(lambda e: e.expand(), expr) == sp.expand(expr)
+        assert converted == [expr]
+    
+    def test_expand_uses_symengine_only_for_polynomials(self, monkeypatch):
+        """Test that non-polynomial expressions are always expanded by SymPy."""
+        from mathgenius.advanced import symbolic
+        calls = []
+        monkeypatch.setattr(symbolic, "_symengine_apply", lambda op, expr: calls.append(expr))
+        symbolic.clear_symbolic_caches()
+        assert expand_expression("exp(x + y)") == "exp(x)*exp(y)"
+        assert calls == []
+        assert expand_expression("(x + y)**2") == "x**2 + 2*x*y + y**2"
+        assert len(calls) == 1
+    
+    def test_transformed_parse_is_cached(self):
+        """Test that parsing with notation transformations is memoized per string."""
+        from mathgenius.advanced.symbolic import _parse_expression_with_transformations
+        clear_symbolic_caches()
+        first = _parse_expression_with_transformations("2x^2 + 3x")
+        assert _parse_expression_with_transformations("2x^2 + 3x") is first
+        assert _parse_expression_with_transformations.cache_info().hits == 1
+        assert expand_expression("2x^2 + 3x") == "2*x**2 + 3*x"
+        
+        clear_symbolic_caches()
+        assert _parse_expression_with_transformations.cache_info().currsize == 0
+    
+    def test_substitutions_are_canonicalized_once(self):
+        """Test that a substitutions dict is parsed once for many expressions."""
+        from mathgenius.advanced.symbolic import _canonical_sub_items
+        clear_symbolic_caches()
+        subs = {"x": 2, "y": "pi/2"}
+        assert substitute_expression("x**2", subs) == "4"
+        assert substitute_expression("sin(y)*x", subs) == "2"
+        assert _canonical_sub_items.cache_info().hits == 1
+    
+    def test_substitution_keeps_bound_variables(self):
+        """Test that bound variables are left alone by substitution."""
+        assert substitute_expression("Integral(x*y, (x, 0, 1))", {"x": 2, "y": 3}) == "Integral(3*x, (x, 0, 1))"
+        assert substitute_expression("x + y", {"x": 2.5}) == "y + 2.5"
+    
+    def test_substitution_values_mentioning_keys(self):
+        """Test that substitutions whose values use other keys apply in sequence."""
+        assert substitute_expression("x + y", {"x": "y", "y": 2}) == "4"
+        assert substitute_expression("x*y", {"x": "y**2", "y": 3}) == "27"
+        assert evaluate_expression("x*y", {"x": "y**2", "y": 3}) == 27.0
+    
+    def test_disk_cache(self, tmp_path, monkeypatch):
+        """Test that results are persisted when MATHGENIUS_DISK_CACHE is set."""
+        from mathgenius.advanced import symbolic
+        monkeypatch.setenv("MATHGENIUS_DISK_CACHE", str(tmp_path / "symbolic"))
+        assert symbolic_integrate("x*exp(x)", "x") == "(x - 1)*exp(x)"
+        assert solve_equation("x**2 - 4", "x") == ["-2", "2"]
+        
+        def fail(*args, **kwargs):
+            raise AssertionError("recomputed a cached result")
+        monkeypatch.setattr(symbolic.sp, "integrate", fail)
+        monkeypatch.setattr(symbolic, "sympy_solve", fail)
+        assert symbolic_integrate("x*exp(x)", "x") == "(x - 1)*exp(x)"
+        assert solve_equation("x**2 - 4", "x") == ["-2", "2"]
+        # Other arguments still reach the (now failing) integrator
+        with pytest.raises(CalculationError):
+            symbolic_integrate("x*exp(x)", "y")
+    
+    def test_disk_cache_shared_and_versioned(self, tmp_path, monkeypatch):
+        """Test that a fresh connection sees stored results, but not another release's."""
+        from mathgenius.advanced import symbolic
+        monkeypatch.setenv("MATHGENIUS_DISK_CACHE", str(tmp_path / "symbolic.db"))
+        assert simplify_expression("x*y + x*z") == "x*(y + z)"
+        
+        calls = []
+        simplify = symbolic._cached_simplify.__wrapped__
+        monkeypatch.setattr(symbolic, "_cached_simplify", lambda expr: calls.append(expr) or simplify(expr))
+        symbolic._open_disk_cache.cache_clear()
+        assert simplify_expression("x*y + x*z") == "x*(y + z)"
+        assert calls == []
+        
+        monkeypatch.setattr(symbolic, "__version__", "0.0.0")
+        assert simplify_expression("x*y + x*z") == "x*(y + z)"
+        assert len(calls) == 1
 
 
 if __name__ == "__main__":
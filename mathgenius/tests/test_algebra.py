@@ -1,5 +1,6 @@
+import math
 import pytest
-from mathgenius.algebra.equations import solve_linear, solve_quadratic
+from mathgenius.algebra.equations import solve_linear, solve_quadratic, solve_equation
 from mathgenius.algebra.polynomials import expand_expr, factor_expr, simplify_expr
 from mathgenius.core.errors import ValidationError
 from sympy import symbols
@@ -15,6 +16,34 @@ def test_solve_quadratic():
     with pytest.raises(ValidationError):
         solve_quadratic(1, "b", 2)
 
+def test_solve_linear_closed_form():
+    assert solve_linear(3, 6) == -2.0
+    assert solve_linear(4, 1) == -0.25
+    result = solve_linear(2, 0.0)
+    assert result == 0.0 and math.copysign(1.0, result) == 1.0
+
+def test_solve_quadratic_closed_form():
+    assert solve_quadratic(1, 2, 1) == [-1.0]
+    assert solve_quadratic(-1, 5, -6) == [2.0, 3.0]
+    roots = solve_quadratic(1, 1e8, 1)
+    assert roots[1] == pytest.approx(-1e-8)
+    assert roots == sorted(roots)
+    assert solve_quadratic(1, 0, 1) == ['-I', 'I']
+
+def test_solve_closed_form_overflow_falls_back():
+    roots = solve_quadratic(1e200, 1e200, 1)
+    assert roots[0] == pytest.approx(-1.0)
+    assert all(math.isfinite(root) for root in roots)
+    assert solve_quadratic(10**400, 1, -1) == pytest.approx([-1e-200, 1e-200])
+    assert solve_linear(1e-320, 1).startswith('-1.0000')
+
+def test_solve_equation_reuses_symbols():
+    from mathgenius.algebra.equations import _symbols
+    assert solve_equation("2*t + 3 = 7", "t") == [2.0]
+    hits = _symbols.cache_info().hits
+    assert solve_equation("t^2 = 9", "t") == [-3.0, 3.0]
+    assert _symbols.cache_info().hits == hits + 1
+
 def test_expand_expr():
     x = symbols('x')
     assert expand_expr((x + 1)**2) == x**2 + 2*x + 1